@@ -31,6 +31,16 @@ class Settings(BaseSettings):
     DB_DATA_DIR: str = os.getenv("DB_DATA_DIR", '.workflow-automation/data')
     DB_DATA_FILENAME:str = os.getenv("DB_DATA_FILENAME", 'db.json')
     
+    # LLM response cache, reused across re-runs over unchanged files
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", 'true').lower() in {'true', 'yes', 'y', '1'}
+    RESPONSE_CACHE_FILENAME: str = os.getenv("RESPONSE_CACHE_FILENAME", 'llm_responses.sqlite3')
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 7 * 24 * 3600))  # Entries older than this are ignored and pruned
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 50000))  # Oldest entries beyond this are pruned
+    
+    # Provider prompt caching: per-file requests share the system prompt and instruction
+    # preface, so they carry the same prompt_cache_key to hit the same provider cache shard
+    PROMPT_CACHE_ENABLED: bool = os.getenv("PROMPT_CACHE_ENABLED", 'true').lower() in {'true', 'yes', 'y', '1'}
+    
     # GitHub settings for private repository access
     GITHUB_TOKEN: Optional[str] = os.getenv("GITHUB_TOKEN", '')
     
@@ -57,6 +67,16 @@ class Settings(BaseSettings):
     HTTPX_TIMEOUT_SECONDS: int = int(os.getenv("HTTPX_TIMEOUT_SECONDS", 60))  # Timeout for LLM requests
     HTTPX_MAX_CONNECTIONS: int = int(os.getenv("HTTPX_MAX_CONNECTIONS", MAX_WORKERS))
     
+    # Skip base extraction LLM calls for files without env/DB/API signals (opt-in until the signal pattern is tuned)
+    PREFILTER_ENABLED: bool = os.getenv("PREFILTER_ENABLED", 'false').lower() in {'true', 'yes', 'y', '1'}
+    # Files sent per Prefect agent task run; 1 keeps one task run (and UI entry) per file
+    AGENT_TASK_BATCH_SIZE: int = int(os.getenv("AGENT_TASK_BATCH_SIZE", 1))
+    # Send a second copy of LLM requests slower than the recent p95 latency (costs extra tokens)
+    HEDGE_REQUESTS_ENABLED: bool = os.getenv("HEDGE_REQUESTS_ENABLED", 'false').lower() in {'true', 'yes', 'y', '1'}
+    
+    # Flow concurrency
+    REPO_CONCURRENCY: int = int(os.getenv("REPO_CONCURRENCY", 8)) # Repositories processed concurrently by multi-repo flows
+    
     # Tokenization settings - exposed to end users
     DEFAULT_TOKENIZER: str = os.getenv("DEFAULT_TOKENIZER", "o200k_base")  # The tokenizer model to use for token counting
     TOKEN_LIMIT: int = int(os.getenv("TOKEN_FILE_LIMIT", "50000"))  # Default token limit per file chunk
@@ -152,6 +172,9 @@ class Settings(BaseSettings):
 
     def get_db_path(cls) -> str:
         return os.path.join(cls.DB_DATA_DIR,cls.DB_DATA_FILENAME)
+    
+    def get_response_cache_path(cls) -> str:
+        return os.path.join(cls.DB_DATA_DIR,cls.RESPONSE_CACHE_FILENAME)
         
     def model_post_init(self, __context):
         """Set the repomix config path after initialization"""
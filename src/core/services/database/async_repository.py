@@ -74,8 +74,24 @@ class AsyncRepository(Generic[T]):
         Returns:
             The list of created document IDs.
         """
-        data_list = [model.to_dict() for model in models]
-        doc_ids = await self.storage.insert_multiple(self.table_name, data_list)
+        data_list = []
+        for model in models:
+            if isinstance(model,dict):
+                data_list.append(model)
+            elif hasattr(model,'model_dump'):
+                data_list.append(model.model_dump())
+            elif hasattr(model,'to_dict'):
+                data_list.append(model.to_dict())
+            else:
+                raise ValueError(f"DB create_many received unsupported data type: {type(model).__name__}")
+        
+        if not data_list:
+            return []
+        
+        # Single storage session and a single insert_multiple write for the whole batch
+        async with self.storage:
+            doc_ids = await self.storage.insert_multiple(self.table_name, data_list)
+        
         return doc_ids
     
     async def get_all(self) -> List[T]:
@@ -1,8 +1,9 @@
 import os
 import shutil
+import itertools
 
-from uuid import uuid4
 from pathlib import Path
+from types import MappingProxyType
 
 from git import Repo
 from git.exc import GitCommandError
@@ -14,6 +15,23 @@ logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config
 
 TMP_DATA_BASE = "/tmp/a78adba6599a44d1bf092cc0f92c52ee"
 
+# Per-process workdir naming: "<pid>-<counter>" is unique within a process
+_WORKDIR_COUNTER = itertools.count()
+_PID = os.getpid()
+
+
+def _reset_workdir_naming():
+    """Refresh the cached pid and counter in forked children."""
+    global _WORKDIR_COUNTER, _PID
+    _WORKDIR_COUNTER = itertools.count()
+    _PID = os.getpid()
+
+
+os.register_at_fork(after_in_child=_reset_workdir_naming)
+
+# Shared read-only kwargs for the common unauthenticated clone path
+_NO_AUTH_KWARGS = MappingProxyType({})
+
 
 class CodebaseFetcher:
     """
@@ -21,6 +39,10 @@ class CodebaseFetcher:
     Supports both public and private repositories with token authentication.
     """
 
+    def __init__(self):
+        # Token -> read-only clone kwargs, built once per token instead of per clone
+        self._auth_kwargs_cache = {}
+
     @staticmethod
     def _create_workdir() -> Path:
         """
@@ -33,14 +55,23 @@ class CodebaseFetcher:
             OSError: If directory creation fails
         """
         try:
-            # Generate unique identifier
-            dir_id = uuid4().hex
-
-            # Create the full path
-            temp_path = Path(TMP_DATA_BASE) / dir_id
+            while True:
+                # Generate unique identifier
+                dir_id = f"{_PID}-{next(_WORKDIR_COUNTER)}"
+
+                # Create the full path
+                temp_path = Path(TMP_DATA_BASE) / dir_id
+
+                # Create the directory, skipping names left behind by an earlier process with the same pid
+                try:
+                    os.mkdir(temp_path)
+                    break
+                except FileExistsError:
+                    continue
+                except FileNotFoundError:
+                    # Base directory is created on first use, or was removed since (e.g. tmp cleaner)
+                    os.makedirs(TMP_DATA_BASE, exist_ok=True)
 
-            # Create the directory
-            os.makedirs(temp_path, exist_ok=True)
             logger.debug(f"Created temporary directory: {temp_path}")
 
             return temp_path
@@ -64,13 +95,11 @@ class CodebaseFetcher:
             token (str, optional): GitHub personal access token for private repositories
 
         Returns:
-            dict: Keyword arguments for GitPython's clone_from method
+            Mapping: Read-only keyword arguments for GitPython's clone_from method
         """
-        clone_kwargs = {}
-
         # If no token provided, return empty kwargs
         if not token:
-            return clone_kwargs
+            return _NO_AUTH_KWARGS
 
         # Handle authentication for private repositories
         # GitPython supports environment-based authentication
@@ -78,26 +107,31 @@ class CodebaseFetcher:
 
         # For HTTPS URLs
         if repo_url.startswith('https://') or not any(x in repo_url for x in ['github.com', 'git@github.com']):
-            # Create a minimal environment with only the necessary variables
-            env = {
-                'GIT_ASKPASS': 'echo',
-                'GIT_USERNAME': 'git',
-                'GIT_PASSWORD': token
-            }
-
-            # Add PATH if needed for git executable
-            if 'PATH' in os.environ:
-                env['PATH'] = os.environ['PATH']
-
-            clone_kwargs['env'] = env
+            clone_kwargs = self._auth_kwargs_cache.get(token)
+            if clone_kwargs is None:
+                # Create a minimal environment with only the necessary variables
+                env = {
+                    'GIT_ASKPASS': 'echo',
+                    'GIT_USERNAME': 'git',
+                    'GIT_PASSWORD': token
+                }
+
+                # Add PATH if needed for git executable
+                if 'PATH' in os.environ:
+                    env['PATH'] = os.environ['PATH']
+
+                clone_kwargs = MappingProxyType({'env': env})
+                self._auth_kwargs_cache[token] = clone_kwargs
+
             logger.debug(
                 "Using token authentication via minimal environment variables")
+            return clone_kwargs
 
         # For SSH URLs, token is not used directly
         elif repo_url.startswith('git@'):
             logger.debug("SSH URL detected, token will not be used")
 
-        return clone_kwargs
+        return _NO_AUTH_KWARGS
 
     def _normalize_github_url(self, repo_url, token=None):
         """
@@ -189,7 +223,8 @@ class CodebaseFetcher:
         # Location where fetched repository files are stored
         tmp_data_storage = self._create_workdir()
 
-        assert tmp_data_storage is not None, "Failed to create tmp workdir for file storage, did you initialize the CodebaseFetcher?"
+        if tmp_data_storage is None:
+            raise RuntimeError("Failed to create tmp workdir for file storage, did you initialize the CodebaseFetcher?")
 
         try:
             logger.debug(f"Cloning repository from {repo_url}")
@@ -197,7 +232,8 @@ class CodebaseFetcher:
             # Prepare the URL for GitPython
             clone_url = normalized_url
 
-            assert clone_url is not None and 'github.com' in clone_url, f"Failed to normalize github repo url: {repo_url}"
+            if clone_url is None or 'github.com' not in clone_url:
+                raise ValueError(f"Failed to normalize github repo url: {repo_url}")
 
             # Prepare authentication 
             auth_kwargs = self._get_auth_kwargs(repo_url, token)
@@ -209,13 +245,8 @@ class CodebaseFetcher:
             return str(tmp_data_storage)
 
         except GitCommandError as e:
-            try:
-                # Clean up failed clone attempt
-                if os.path.exists(tmp_data_storage):
-                    shutil.rmtree(tmp_data_storage)
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to clean up repository directory after failed clone: {cleanup_error}")
+            # Clean up failed clone attempt
+            shutil.rmtree(tmp_data_storage, ignore_errors=True)
 
             if 'Authentication failed' in str(e):
                 logger.error(
@@ -234,9 +265,5 @@ class CodebaseFetcher:
         except Exception as e:
             logger.error(f"Unexpected error while fetching repository: {e}")
             # Clean up on other exceptions
-            try:
-                if os.path.exists(tmp_data_storage):
-                    shutil.rmtree(tmp_data_storage)
-            except Exception:
-                pass
+            shutil.rmtree(tmp_data_storage, ignore_errors=True)
             raise 
\ No newline at end of file
@@ -1,10 +1,20 @@
 from typing import Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+
+# Shared keep-alive session so repeated health polls reuse the same TCP connection
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+_SESSION.headers.update({"Content-Type": "application/json"})
+
 class LocalPrefectServer:
-    
+
     def change_prefect_settings():
-        
-        
+        pass
+
     def start_local_server():
         pass
 
@@ -12,24 +22,15 @@ class LocalPrefectServer:
     def test_prefect_api(api_url:str) -> Tuple[bool,str]:
         """Test connection to Prefect server"""
         try:
-            import requests
-            from requests.exceptions import ConnectionError, Timeout
-            
             # Simple connection test with timeout
-            response = requests.get(
-                api_url, 
-                timeout=3,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code != 200:
-                return False, f"Error: response_code: {response.status_code}, reason: {response.reason} - {response.content}"
-            
-            return True, ""
-            
-            # return response.status_code < 500  # Consider any non-5xx response as success
+            response = _SESSION.get(api_url, timeout=3)
+
+            if response.ok:
+                return True, ""
+
+            return False, f"Error: response_code: {response.status_code}, reason: {response.reason} - {response.content}"
         except (ConnectionError, Timeout):
             return False,""
         except Exception as e:
             print(f"Error testing Prefect connection: {str(e)}")
-            return False,""
\ No newline at end of file
+            return False,""
@@ -1,24 +1,34 @@
 import asyncio
+import threading
 import chromadb
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, RoundRobinProxyStrategy
-from crawl4ai.proxy_strategy import ProxyConfig
 from typing import List, Dict, Optional
 
-from core.services.web_crawler.proxy import load_proxies_config
+from core.services.web_crawler.proxy import get_proxies
 
 CONTENT_STORAGE = '.workflow-automation/data/chroma'
 
-client = chromadb.PersistentClient(path=CONTENT_STORAGE)
+_client = None
+_client_lock = threading.Lock()
+
+def get_chroma_client():
+    """
+    Get the shared Chroma client, opening the persistent store on first use
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = chromadb.PersistentClient(path=CONTENT_STORAGE)
+    return _client
 
 async def crawl_with_proxy_rotation(urls: List[str]):
     """
     Crawl multiple URLs with proxy rotation
     """
-    # Proxies defined in CSV file are loaded in ENV
-    load_proxies_config()
-
-    proxy_configs = ProxyConfig.from_env()
+    # Proxies defined in CSV file are parsed once and cached until the file changes
+    proxy_configs = get_proxies()
     # Set up proxy rotation using ProxyConfig
     proxy_strategy = RoundRobinProxyStrategy(proxy_configs)
     
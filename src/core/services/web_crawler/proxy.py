@@ -1,12 +1,17 @@
 import os
+import re
 import csv
-from typing import List, Dict
+import functools
+from typing import List, Dict, Tuple
 
 from crawl4ai.proxy_strategy import ProxyConfig
 
 
 PROXIES_CONFIG = 'src/core/services/web_crawler/proxies.csv'
 
+# One proxy per line: ip:port:username:password
+_PROXY_RE = re.compile(rb'^[ \t]*([^:\s]+):(\d+):([^:\s]+):([^:\s]+)[ \t]*\r?$', re.M)
+
 
 def load_proxies_config() -> List[str]:
     """
@@ -22,20 +27,24 @@ def load_proxies_config() -> List[str]:
     Returns:
         List[str]: List of proxy strings in format "ip:port:username:password"
     """
-    proxies = []
-    
     if not os.path.exists(PROXIES_CONFIG):
         raise FileNotFoundError(f"Proxy CSV file not found: {PROXIES_CONFIG}")
     
-    with open(PROXIES_CONFIG, 'r') as f:
-        for idx, line in enumerate(f):
-            parts = line.strip().split(':')
-            if len(parts) == 4:
-                ip, port, user, passwd = parts[0], parts[1], parts[2], parts[3]
-                proxies.append(f"{ip}:{port}:{user}:{passwd}")
-            else:
-                raise ValueError(f"Invalid Proxies at row: {idx} - Expected 4 values, Got {len(parts)}")
+    with open(PROXIES_CONFIG, 'rb') as f:
+        data = f.read()
+    
+    # Validate and split every row in a single C-level pass
+    matches = _PROXY_RE.findall(data)
+    line_count = data.count(b'\n') + (0 if not data or data.endswith(b'\n') else 1)
     
+    if len(matches) != line_count:
+        invalid_rows = [idx for idx, line in enumerate(data.splitlines()) if not _PROXY_RE.match(line)]
+        raise ValueError(f"Invalid Proxies at rows: {invalid_rows} - Expected 4 values per row (ip:port:username:password)")
+    
+    proxies = [
+        f"{ip.decode()}:{port.decode()}:{user.decode()}:{passwd.decode()}"
+        for ip, port, user, passwd in matches
+    ]
     
     os.environ["PROXIES"] = ','.join(proxies)
     # Set the total count of proxies in environment
@@ -43,6 +52,35 @@ def load_proxies_config() -> List[str]:
     
     return proxies
 
+
+@functools.lru_cache(maxsize=1)
+def _load_proxies_cached(mtime_ns: int) -> Tuple[ProxyConfig, ...]:
+    """
+    Parse the proxies CSV into ProxyConfig objects, cached per file modification time.
+    
+    Args:
+        mtime_ns: Modification time of PROXIES_CONFIG, used only as the cache key
+    
+    Returns:
+        Tuple[ProxyConfig, ...]: Parsed proxy configurations
+    """
+    return tuple(ProxyConfig.from_string(proxy) for proxy in load_proxies_config())
+
+
+def get_proxies() -> List[ProxyConfig]:
+    """
+    Get the parsed proxy configurations, re-reading the CSV only when it changes on disk.
+    
+    Returns:
+        List[ProxyConfig]: Proxy configurations ready for a proxy rotation strategy
+    """
+    try:
+        mtime_ns = os.stat(PROXIES_CONFIG).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Proxy CSV file not found: {PROXIES_CONFIG}")
+    
+    return list(_load_proxies_cached(mtime_ns))
+
 # if __name__ == "__main__":
 #     proxies_cfg = load_proxies_config()
 #     proxies = _load_csv('src/core/services/web_crawler/proxies.csv')
@@ -5,7 +5,7 @@ from .system.datetime import get_utc_date
 from .runtime import get_runtime_task_id, get_runtime_context, get_ai_run_context, get_flow_name
 from .time import get_run_duration, format_duration
 from .ai import create_llm_request_error
-from .tasks import get_current_task_run_id,get_current_retry_count,create_task_batches
+from .tasks import get_current_task_run_id,get_current_retry_count,create_task_batches,iter_task_batches
 from .format.colors import Crayons
 from .format.markdown_builder import *
 from .tokenization import count_tokens, chunk_text_by_tokens
@@ -26,6 +26,7 @@ __all__ = [
     'get_current_task_run_id',
     'get_current_retry_count',
     'create_task_batches',
+    'iter_task_batches',
     'Crayons',
     'count_tokens',
     'chunk_text_by_tokens'
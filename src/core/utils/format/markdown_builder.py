@@ -4,6 +4,11 @@ Simple utility for generating markdown from data objects.
 import json
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 
 def custom_json_serializer(obj):
     """
@@ -25,6 +30,25 @@ def custom_json_serializer(obj):
         return str(obj)
 
 
+def _dumps(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string, preferring orjson when available.
+    
+    Args:
+        data: The JSON-serializable data to dump
+        
+    Returns:
+        The JSON string with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=custom_json_serializer,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(data, indent=2, sort_keys=False, default=custom_json_serializer)
+
+
 def convert_to_serializable(data):
     """
     Convert complex data structures into JSON-serializable form.
@@ -96,7 +120,7 @@ def json_to_markdown(data: Any, title: Optional[str] = None, target_repo_url: Op
     # markdown += "## Complete Analysis Data\n\n"
     markdown += "```json\n"
     try:
-        markdown += json.dumps(serializable_data, indent=2, sort_keys=False)
+        markdown += _dumps(serializable_data)
     except TypeError as e:
         markdown += f"Error serializing data: {str(e)}\n"
         markdown += f"Data type: {type(data)}\n"
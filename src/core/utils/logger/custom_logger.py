@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Mapping
+
 import logfire
 
 class CustomLogger:
@@ -15,28 +17,55 @@ class CustomLogger:
         self.logger = logger
         self.use_trace = use_trace
     
+    @staticmethod
+    def _render(msg: str, args: tuple) -> str:
+        """
+        Apply %-style args for logfire, which does not take logging-style arguments.
+        
+        Callers check isEnabledFor() first, so messages below the logger level are never formatted.
+        Mirrors LogRecord.getMessage(): a single Mapping argument is used for %(name)s formatting,
+        and args that do not match the message are appended instead of raising.
+        """
+        msg = str(msg)
+        if not args:
+            return msg
+        if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]
+        try:
+            return msg % args
+        except (TypeError, ValueError, KeyError):
+            return f"{msg} {args!r}"
+    
     def info(self, msg: str, *args, **kwargs):
         """Log an info message primarily to logfire, with fallback to standard logger."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if self.use_trace:
-            logfire.info(msg)
+            logfire.info(self._render(msg, args))
         self.logger.info(msg, *args, **kwargs)
     
     def error(self, msg: str, *args, **kwargs):
         """Log an error message primarily to logfire, with fallback to standard logger."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if self.use_trace:
-            logfire.error(msg)
+            logfire.error(self._render(msg, args))
         self.logger.error(msg, *args, **kwargs)
     
     def warning(self, msg: str, *args, **kwargs):
         """Log a warning message primarily to logfire, with fallback to standard logger."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         if self.use_trace:
-            logfire.warning(msg)
+            logfire.warning(self._render(msg, args))
         self.logger.warning(msg, *args, **kwargs)
     
     def debug(self, msg: str, *args, **kwargs):
         """Log a debug message primarily to logfire, with fallback to standard logger."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if self.use_trace:
-            logfire.debug(msg)
+            logfire.debug(self._render(msg, args))
         self.logger.debug(msg, *args, **kwargs)
     
     # Keep the trace-specific methods for backward compatibility
@@ -57,6 +86,8 @@ class CustomLogger:
             msg: The message to log
             stack_info: Whether to include stack information
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if self.use_trace:
             logfire.error(msg)
         self.logger.error(msg, stack_info=stack_info)
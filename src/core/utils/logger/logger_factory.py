@@ -1,6 +1,8 @@
 import os
+import sys
 import logging
-from typing import Dict, Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 import logfire
 from rich.console import Console
@@ -10,26 +12,79 @@ from .custom_logger import CustomLogger
 
 from core.config import app_config
 
+# Batch span export tuning, read by the OpenTelemetry BatchSpanProcessor that logfire
+# installs. Environment overrides win; the 2s delay keeps tail spans from lingering.
+_SPAN_BATCH_DEFAULTS = {
+    "OTEL_BSP_MAX_QUEUE_SIZE": "8192",
+    "OTEL_BSP_SCHEDULE_DELAY": "2000",
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": "512",
+}
+
+# Logfire settings resolved once at import (env is loaded by core.config above)
+_LOGFIRE_TOKEN = os.getenv('LOGFIRE_API_KEY', None)
+_LOGFIRE_ENVIRONMENT = "dev" if app_config.is_development() else 'prod'
+
 class LoggerFactory:
     """Singleton factory class for creating and caching loggers with rich console output and logfire tracing."""
     
     # Class variable to store logger instances
-    _logger_instances: Dict[str, CustomLogger] = {}
+    _logger_instances: Dict[Tuple[str, bool], CustomLogger] = {}
     
-    # Flag to track if logfire has been set up
+    # Flag to track if logfire has been set up, and an event set once it is ready
     _logfire_initialized: bool = False
+    _logfire_ready = threading.Event()
+    
+    # Shared rich console/handler, attached to the root logger exactly once
+    _console: Optional[Console] = None
+    _rich_handler: Optional[RichHandler] = None
+    _basic_configured: bool = False
+    _config_lock = threading.Lock()
     
     @classmethod
     def initialize_tracing(cls):
         """
         Initialize Logfire tracing once at application startup.
         This method should be called early in the application lifecycle.
+        Setup runs in a background thread; short-lived entry points call wait_for_tracing()
+        before exiting so the spans they emitted are exported.
         """
-        if not cls._logfire_initialized:
-            cls._setup_logfire_tracing()
+        if cls._logfire_initialized:
+            return False
+        
+        with cls._config_lock:
+            if cls._logfire_initialized:
+                return False
             cls._logfire_initialized = True
+        
+        # Logfire setup inspects and instruments modules, run it off the caller's path.
+        # Spans emitted before it finishes go to logfire's no-op default.
+        threading.Thread(target=cls._run_logfire_setup, name="logfire-setup", daemon=True).start()
+        return True
+    
+    @classmethod
+    def wait_for_tracing(cls, timeout: Optional[float] = None) -> bool:
+        """
+        Block until Logfire tracing has finished initializing.
+        
+        Returns at once when tracing was never initialized.
+        
+        Args:
+            timeout: Maximum seconds to wait (default: wait indefinitely)
+            
+        Returns:
+            True if tracing is ready or not in use, False if the timeout expired
+        """
+        if not cls._logfire_initialized:
             return True
-        return False
+        return cls._logfire_ready.wait(timeout)
+    
+    @classmethod
+    def _run_logfire_setup(cls):
+        """Run the Logfire setup and signal readiness, even if it fails."""
+        try:
+            cls._setup_logfire_tracing()
+        finally:
+            cls._logfire_ready.set()
     
     @classmethod
     def get_logger(cls, name: Optional[str] = None, log_level: int = None, trace_enabled: bool = True) -> CustomLogger:
@@ -45,9 +100,9 @@ class LoggerFactory:
         Returns:
             A configured CustomLogger instance
         """
-        # If name is not provided, get the caller's module name
+        # If name is not provided, use the caller's module name (one frame hop, no stack walk)
         if name is None:
-            name = cls._get_caller_module_name()
+            name = sys._getframe(1).f_globals.get('__name__', 'root')
         
         # If log_level is not provided, use the app_config
         if log_level is None:
@@ -57,7 +112,7 @@ class LoggerFactory:
             log_level = numeric_level if isinstance(numeric_level, int) else logging.INFO
         
         # Create a cache key based on the logger name and trace setting
-        cache_key = f"{name}_{trace_enabled}"
+        cache_key = (name, trace_enabled)
         
         # Return cached logger if it exists
         if cache_key in cls._logger_instances:
@@ -73,12 +128,7 @@ class LoggerFactory:
             base_logger = get_run_logger()
         except Exception:
             # Configure rich logger
-            logging.basicConfig(
-                level=log_level,
-                format="%(message)s",
-                datefmt="[%X]",
-                handlers=[RichHandler(console=Console(), rich_tracebacks=True)]
-            )
+            cls._configure_root_logging(log_level)
             base_logger = logging.getLogger(name)
         
         # Create the custom logger wrapper and cache it
@@ -87,20 +137,44 @@ class LoggerFactory:
         
         return custom_logger
     
+    @classmethod
+    def _configure_root_logging(cls, log_level: int):
+        """Attach the shared rich handler to the root logger on first use."""
+        if cls._basic_configured:
+            return
+        
+        with cls._config_lock:
+            if cls._basic_configured:
+                return
+            
+            cls._console = Console()
+            cls._rich_handler = RichHandler(console=cls._console, rich_tracebacks=True)
+            logging.basicConfig(
+                level=log_level,
+                format="%(message)s",
+                datefmt="[%X]",
+                handlers=[cls._rich_handler]
+            )
+            cls._basic_configured = True
+    
     @staticmethod
     def _setup_logfire_tracing():
         """Configure Logfire tracing for AI operations."""
         
-        # Get logfire token and check if it's present
-        logfire_token = os.getenv('LOGFIRE_API_KEY', None)
-        send_to_logfire = bool(logfire_token)
+        # Check if the logfire token is present
+        send_to_logfire = bool(_LOGFIRE_TOKEN)
+        
+        # Export spans in large background batches rather than close to per-span
+        for env_key, env_value in _SPAN_BATCH_DEFAULTS.items():
+            os.environ.setdefault(env_key, env_value)
         
         # Configure logfire instrumentation
         logfire.configure(
-            environment="dev" if app_config.is_development() else 'prod',
+            environment=_LOGFIRE_ENVIRONMENT,
             service_name='workflow-agents',
-            token=logfire_token,
+            token=_LOGFIRE_TOKEN,
             send_to_logfire=send_to_logfire,  # Set to False if sending to another OpenTelemetry backend
+            inspect_arguments=False,  # Avoid ast.parse of the call site on every span
         )
         
         
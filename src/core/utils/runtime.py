@@ -7,7 +7,20 @@ from prefect import runtime
 from core.utils.logger import LoggerFactory
 
 from core.config import app_config
-logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+_logger = None
+
+def _get_logger():
+    """Get the module logger, creating it on first use rather than at import."""
+    global _logger
+    if _logger is None:
+        _logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+    return _logger
+
+def __getattr__(name: str):
+    # Keep `module.logger` working for importers, resolved lazily
+    if name == 'logger':
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_runtime_task_id() -> str:
     """
@@ -22,7 +35,7 @@ def get_runtime_task_id() -> str:
             task_id = runtime.task_run.id
     
     if not task_id:
-        logger.warning("Failed to retrieve task_id")
+        _get_logger().warning("Failed to retrieve task_id")
         
     return task_id
 
@@ -33,10 +46,12 @@ def get_ai_run_context() -> Dict[str, Any]:
     Returns:
         Dictionary with AI context or empty dict if not available
     """
-    if 'ctx' in runtime.task_run.parameters and hasattr(runtime.task_run.parameters['ctx'], 'to_dict'):
+    # Resolve the runtime proxy once, each attribute access re-reads the run context
+    params = runtime.task_run.parameters
+    ctx = params.get('ctx') if isinstance(params, dict) else None
+    if ctx is not None and hasattr(ctx, 'to_dict'):
         # The object exists and has a to_dict method
-        ctx_dict = runtime.task_run.parameters['ctx'].to_dict()
-        return ctx_dict
+        return ctx.to_dict()
 
     return {}
 
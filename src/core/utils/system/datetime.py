@@ -1,10 +1,21 @@
+import time
 from datetime import datetime, timezone
 
+# (epoch second, formatted string) of the last call, swapped atomically as one tuple
+_last_utc_date = (-1, "")
+
 def get_utc_date() -> str:
     """
     Returns the current date and time in UTC as a string in the format 'YYYY-MM-DD HH:MM:SS'.
+    The formatted string is reused for all calls within the same second.
     """
-    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    global _last_utc_date
+    now_s = int(time.time())
+    cached_s, cached_str = _last_utc_date
+    if now_s != cached_s:
+        cached_str = datetime.fromtimestamp(now_s, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        _last_utc_date = (now_s, cached_str)
+    return cached_str
 
 
-__all__ = ["get_utc_date"] 
\ No newline at end of file
+__all__ = ["get_utc_date"]
@@ -1,11 +1,18 @@
 import time
-from typing import List,Any
+from itertools import islice
+from typing import Iterable, Iterator, List, Any
 
 from prefect.context import get_run_context
 
+def iter_task_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Lazily yield batches of specified size from any iterable"""
+    it = iter(items)
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
 def create_task_batches(items: List[Any], batch_size: int) -> List[List[Any]]:
     """Split a list into batches of specified size"""
-    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    return list(iter_task_batches(items, batch_size))
 
 # Helper functions for the task
 def get_current_retry_count() -> int:
@@ -22,6 +29,6 @@ def get_current_task_run_id() -> str:
         context = get_run_context()
         return str(context.task_run.id)
     except Exception:
-        return f"unknown-{time.time()}"
+        return f"unknown-{time.monotonic_ns()}"
 
-__all__ = ["get_current_task_run_id", "get_current_retry_count", "create_task_batches"]
\ No newline at end of file
+__all__ = ["get_current_task_run_id", "get_current_retry_count", "create_task_batches", "iter_task_batches"]
\ No newline at end of file
@@ -3,17 +3,25 @@ Time utilities for measuring performance and durations.
 """
 import time
 
+# (lower bound in seconds, formatter) from the largest unit down to microseconds
+_DURATION_UNITS = (
+    (60.0, lambda s: f"{int(s // 60)}m {s % 60:.2f}s"),
+    (1.0, lambda s: f"{s:.2f}s"),
+    (1e-3, lambda s: f"{s * 1000:.2f}ms"),
+    (0.0, lambda s: f"{s * 1000000:.2f}µs"),
+)
+
 def get_run_duration(start_time: float) -> float:
     """
     Calculate the duration of a process.
     
     Args:
-        start_time: Timestamp when the process started
+        start_time: time.perf_counter() value taken when the process started
         
     Returns:
         Duration in seconds as a float
     """
-    end_time = time.time()
+    end_time = time.perf_counter()
     return end_time - start_time
 
 def format_duration(seconds: float) -> str:
@@ -26,24 +34,13 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted duration string (e.g., "2m 30s" or "150ms")
     """
-    # Handle negative values
-    is_negative = seconds < 0
     abs_seconds = abs(seconds)
+    sign = '-' if seconds < 0 else ''
     
-    # Format the absolute value
-    if abs_seconds < 0.001:
-        formatted = f"{abs_seconds * 1000000:.2f}µs"
-    elif abs_seconds < 1:
-        formatted = f"{abs_seconds * 1000:.2f}ms"
-    elif abs_seconds < 60:
-        formatted = f"{abs_seconds:.2f}s"
-    else:
-        minutes = int(abs_seconds // 60)
-        remaining_seconds = abs_seconds % 60
-        formatted = f"{minutes}m {remaining_seconds:.2f}s"
+    # Pick the first unit whose threshold the absolute value reaches
+    for threshold, formatter in _DURATION_UNITS:
+        if abs_seconds >= threshold:
+            return sign + formatter(abs_seconds)
     
-    # Add the negative sign if needed
-    if is_negative:
-        return f"-{formatted}"
-    else:
-        return formatted 
\ No newline at end of file
+    # Only reached for NaN, which fails every comparison
+    return sign + _DURATION_UNITS[-1][1](abs_seconds)
@@ -2,13 +2,28 @@
 Utilities for working with tokens in text, using tiktoken library.
 """
 import os
+import mmap
+import codecs
 import tiktoken
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from core.utils import LoggerFactory
 from core.config import app_config
 
-logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+_logger = None
+
+def _get_logger():
+    """Get the module logger, creating it on first use rather than at import."""
+    global _logger
+    if _logger is None:
+        _logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+    return _logger
+
+def __getattr__(name: str):
+    # Keep `module.logger` working for importers, resolved lazily
+    if name == 'logger':
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Constants - sourced from application config
 # These should be exposed to end users via the configuration settings
@@ -24,6 +39,16 @@ DEFAULT_TOKEN_LIMIT = int(os.getenv('TOKEN_FILE_LIMIT', '50000'))
 # This is an approximation based on research - typically 1 token is around 4 chars in English
 BYTES_PER_TOKEN_APPROX = 4
 
+# Texts shorter than this are counted with the approximation unless an exact count is requested
+SHORT_TEXT_CHAR_LIMIT = 64
+
+# Size of the byte windows decoded and tokenized at a time when counting tokens in a file
+FILE_CHUNK_BYTES = 1 << 20
+
+# Resolved tokenizers keyed by encoding/model name. Only successful lookups are
+# cached so a transient failure (e.g. BPE download) is retried on the next call.
+_TOKENIZER_CACHE: Dict[str, "tiktoken.Encoding"] = {}
+
 def get_tokenizer(encoding_name: str = DEFAULT_TOKENIZER):
     """
     Get a tokenizer for counting tokens in text.
@@ -34,31 +59,43 @@ def get_tokenizer(encoding_name: str = DEFAULT_TOKENIZER):
     Returns:
         A tiktoken encoding object
     """
+    tokenizer = _TOKENIZER_CACHE.get(encoding_name)
+    if tokenizer is not None:
+        return tokenizer
+    
     try:
         # First try to use get_encoding with the name
-        return tiktoken.get_encoding(encoding_name)
+        tokenizer = tiktoken.get_encoding(encoding_name)
     except Exception as e:
         try:
             # If that fails, try to use encoding_for_model
-            logger.info(f"Falling back to encoding_for_model for {encoding_name}")
-            return tiktoken.encoding_for_model(encoding_name)
+            _get_logger().info("Falling back to encoding_for_model for %s", encoding_name)
+            tokenizer = tiktoken.encoding_for_model(encoding_name)
         except Exception as e2:
-            logger.warning(f"Error getting tokenizer {encoding_name}: {e}. Using approximation method instead.")
+            _get_logger().warning("Error getting tokenizer %s: %s. Using approximation method instead.", encoding_name, e)
             return None
+    
+    _TOKENIZER_CACHE[encoding_name] = tokenizer
+    return tokenizer
 
-def count_tokens(text: str, encoding_name: str = DEFAULT_TOKENIZER) -> int:
+def count_tokens(text: str, encoding_name: str = DEFAULT_TOKENIZER, exact: bool = False) -> int:
     """
     Count the number of tokens in a text string.
     
     Args:
         text: The text to count tokens in
         encoding_name: The name of the encoding to use
+        exact: Always use the tokenizer, even for short texts (default: False)
         
     Returns:
         Number of tokens
     """
     if not text:
         return 0
+    
+    # Short texts are within the approximation's error margin, skip the BPE encode
+    if not exact and len(text) < SHORT_TEXT_CHAR_LIMIT:
+        return len(text) // BYTES_PER_TOKEN_APPROX
         
     try:
         # Try to use tiktoken for accurate token counting
@@ -66,7 +103,7 @@ def count_tokens(text: str, encoding_name: str = DEFAULT_TOKENIZER) -> int:
         if tokenizer:
             return len(tokenizer.encode(text))
     except Exception as e:
-        logger.warning(f"Error counting tokens with tiktoken: {e}. Using approximation instead.")
+        _get_logger().warning("Error counting tokens with tiktoken: %s. Using approximation instead.", e)
     
     # Fallback to approximation if tiktoken fails
     # Approximate based on character count (1 token ~= 4 chars in English)
@@ -96,16 +133,11 @@ def chunk_text_by_tokens(text: str, token_limit: int = DEFAULT_TOKEN_LIMIT, enco
             if len(tokens) <= token_limit:
                 return [text]
                 
-            # Split into chunks based on token limit
-            chunks = []
-            for i in range(0, len(tokens), token_limit):
-                chunk_tokens = tokens[i:i + token_limit]
-                chunk_text = tokenizer.decode(chunk_tokens)
-                chunks.append(chunk_text)
-                
-            return chunks
+            # Split into chunks based on token limit and decode them in one batch call
+            token_slices = [tokens[i:i + token_limit] for i in range(0, len(tokens), token_limit)]
+            return tokenizer.decode_batch(token_slices)
     except Exception as e:
-        logger.warning(f"Error chunking by tokens with tiktoken: {e}. Using approximation method instead.")
+        _get_logger().warning("Error chunking by tokens with tiktoken: %s. Using approximation method instead.", e)
     
     # Fallback to approximation if tiktoken fails
     # Approximate based on character count (token_limit tokens ~= token_limit*4 chars)
@@ -146,15 +178,26 @@ def estimate_tokens_in_file(file_path: str, encoding_name: str = DEFAULT_TOKENIZ
         Estimated number of tokens
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return count_tokens(content, encoding_name)
+        file_size = os.stat(file_path).st_size
+        if file_size == 0:
+            return 0
+        
+        # Memory-map the file and tokenize fixed-size windows so peak memory stays bounded.
+        # The incremental decoder carries multi-byte characters split across windows.
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        total_tokens = 0
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, file_size, FILE_CHUNK_BYTES):
+                text = decoder.decode(mm[offset:offset + FILE_CHUNK_BYTES])
+                total_tokens += count_tokens(text, encoding_name, exact=True)
+        total_tokens += count_tokens(decoder.decode(b'', final=True), encoding_name, exact=True)
+        return total_tokens
     except Exception as e:
-        logger.error(f"Error estimating tokens in file {file_path}: {e}")
+        _get_logger().error("Error estimating tokens in file %s: %s", file_path, e)
         # Fallback to file size approximation
         try:
             byte_size = os.path.getsize(file_path)
             return estimate_tokens_from_bytes(byte_size)
         except Exception as size_err:
-            logger.error(f"Error getting file size for {file_path}: {size_err}")
+            _get_logger().error("Error getting file size for %s: %s", file_path, size_err)
             return 0 
\ No newline at end of file
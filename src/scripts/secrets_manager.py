@@ -19,7 +19,20 @@ from prefect.blocks.system import Secret
 from core.utils import LoggerFactory
 
 from core.config import app_config
-logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+_logger = None
+
+def _get_logger():
+    """Get the module logger, creating it on first use rather than at import."""
+    global _logger
+    if _logger is None:
+        _logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
+    return _logger
+
+def __getattr__(name: str):
+    # Keep `module.logger` working for importers, resolved lazily
+    if name == 'logger':
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SecretsManager:
@@ -43,7 +56,7 @@ class SecretsManager:
                 Secret.load(name)
                 # msg = f"Secret '{name}' already exists. Use update if you want to change its value."
                 # print()
-                logger.info(
+                _get_logger().info(
                     f"Secret '{name}' already exists. Use update if you want to change its value.")
                 return False
             except ValueError:
@@ -53,10 +66,10 @@ class SecretsManager:
             # Create and save the secret
             secret_block = Secret(value=value)
             secret_block.save(name=name, overwrite=False)
-            logger.info(f"Secret '{name}' created successfully.")
+            _get_logger().info(f"Secret '{name}' created successfully.")
             return True
         except Exception as e:
-            logger.error(f"Error creating secret: {e}")
+            _get_logger().error(f"Error creating secret: {e}")
             return False
 
     @staticmethod
@@ -76,13 +89,13 @@ class SecretsManager:
             # Only show first 3 characters for security in console output
             masked_value = value[:3] + '*' * \
                 (len(value) - 3) if len(value) > 3 else '***'
-            logger.info(f"Retrieved secret '{name}': {masked_value}")
+            _get_logger().info(f"Retrieved secret '{name}': {masked_value}")
             return value
         except ValueError:
-            logger.warning(f"Secret '{name}' not found.")
+            _get_logger().warning(f"Secret '{name}' not found.")
             return None
         except Exception as e:
-            logger.error(f"Error retrieving secret: {e}")
+            _get_logger().error(f"Error retrieving secret: {e}")
             return None
 
     @staticmethod
@@ -102,16 +115,16 @@ class SecretsManager:
             try:
                 Secret.load(name)
             except ValueError:
-                logger.warning(f"Secret '{name}' not found. Create it first.")
+                _get_logger().warning(f"Secret '{name}' not found. Create it first.")
                 return False
 
             # Update the secret
             secret_block = Secret(value=value)
             secret_block.save(name=name, overwrite=True)
-            logger.info(f"Secret '{name}' updated successfully.")
+            _get_logger().info(f"Secret '{name}' updated successfully.")
             return True
         except Exception as e:
-            logger.error(f"Error updating secret: {e}")
+            _get_logger().error(f"Error updating secret: {e}")
             return False
 
     @staticmethod
@@ -130,15 +143,15 @@ class SecretsManager:
             try:
                 secret_block = Secret.load(name)
             except ValueError:
-                logger.warning(f"Secret '{name}' not found.")
+                _get_logger().warning(f"Secret '{name}' not found.")
                 return False
 
             # Delete the secret
             secret_block.delete()
-            logger.info(f"Secret '{name}' deleted successfully.")
+            _get_logger().info(f"Secret '{name}' deleted successfully.")
             return True
         except Exception as e:
-            logger.error(f"Error deleting secret: {e}")
+            _get_logger().error(f"Error deleting secret: {e}")
             return False
 
 
@@ -170,16 +183,20 @@ def main():
 
     args = parser.parse_args()
 
-    if args.command == "create":
-        SecretsManager.create_secret(args.name, args.value)
-    elif args.command == "get":
-        SecretsManager.get_secret(args.name)
-    elif args.command == "delete":
-        SecretsManager.delete_secret(args.name)
-    elif args.command == "update":
-        SecretsManager.update_secret(args.name, args.value)
-    else:
-        parser.print_help()
+    try:
+        if args.command == "create":
+            SecretsManager.create_secret(args.name, args.value)
+        elif args.command == "get":
+            SecretsManager.get_secret(args.name)
+        elif args.command == "delete":
+            SecretsManager.delete_secret(args.name)
+        elif args.command == "update":
+            SecretsManager.update_secret(args.name, args.value)
+        else:
+            parser.print_help()
+    finally:
+        # Let background tracing setup finish, so logged spans are exported at exit
+        LoggerFactory.wait_for_tracing(timeout=10)
 
 
 if __name__ == "__main__":
@@ -5,14 +5,27 @@ A module to run the repomix tool programmatically.
 
 import os
 import subprocess
+import tempfile
 import json
 import re
+import shutil
+from typing import BinaryIO, Iterable, Optional
 
 from core.config import app_config
 from core.utils import LoggerFactory
 
 logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level,trace_enabled=True)
 
+# Patterns used to clean repomix terminal output
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_CONTROL_SEQ_RE = re.compile(r'\[2K|\[1A|\[G')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+_SPINNER_TABLE = str.maketrans(dict.fromkeys('⠙⠹⠸⠼⠴⠦⠧⠇⠏⠋', '•'))
+
+# Markers wrapping the tool output appended to the repomix result file
+_TOOL_OUTPUT_OPEN = b"\n<tool_output>\n"
+_TOOL_OUTPUT_CLOSE = b"\n</tool_output>\n"
+
 def clean_terminal_output(text: str) -> str:
     """
     Clean terminal output by removing ANSI escape codes and progress indicators.
@@ -23,24 +36,106 @@ def clean_terminal_output(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove ANSI escape sequences (like color codes and cursor movements)
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    text = ansi_escape.sub('', text)
+    # Remove ANSI escape sequences (like color codes and cursor movements),
+    # skipping the regex scan entirely when no ESC character is present
+    if '\x1b' in text:
+        text = _ANSI_ESCAPE_RE.sub('', text)
     
     # Remove terminal control sequences
-    text = re.sub(r'\[2K|\[1A|\[G', '', text)
+    if '[' in text:
+        text = _CONTROL_SEQ_RE.sub('', text)
     
     # Convert spinner characters to simple status indicators
-    spinner_chars = ['⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏', '⠋']
-    for char in spinner_chars:
-        text = text.replace(char, '•')
+    text = text.translate(_SPINNER_TABLE)
     
     # Clean up multiple newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '\n\n\n' in text:
+        text = _MULTI_NEWLINE_RE.sub('\n\n', text)
     
     return text
 
 
+def _write_cleaned_lines(lines: Iterable[str], out: BinaryIO) -> None:
+    """
+    Clean terminal output line by line and write it out as it is read.
+    
+    Runs of three or more newlines are collapsed to two across line boundaries,
+    giving the same result as cleaning the whole output at once.
+    
+    Args:
+        lines: Raw terminal output lines
+        out: Binary file the cleaned output is written to
+    """
+    newline_run = 0  # newlines at the end of what has been written so far
+    for line in lines:
+        text = clean_terminal_output(line)
+        content = text.lstrip('\n')
+        leading = len(text) - len(content)
+        if newline_run + leading > 2:
+            text = '\n' * max(0, 2 - newline_run) + content
+        if not text:
+            continue
+        out.write(text.encode('utf-8'))
+        newline_run = newline_run + len(text) if not content else len(text) - len(text.rstrip('\n'))
+
+
+def _append_tool_output(abs_output_file: str, cleaned_output: BinaryIO) -> None:
+    """
+    Append cleaned repomix terminal output to the result file inside <tool_output> markers.
+    
+    Args:
+        abs_output_file: Absolute path of the repomix output file
+        cleaned_output: Binary file holding the cleaned terminal output of the repomix run
+    """
+    try:
+        # Append the tool output with markers, without re-reading the existing content
+        cleaned_output.seek(0)
+        with open(abs_output_file, 'ab') as f:
+            f.write(_TOOL_OUTPUT_OPEN)
+            shutil.copyfileobj(cleaned_output, f)
+            f.write(_TOOL_OUTPUT_CLOSE)
+    except Exception as e:
+        logger.error("Error: Failed to write tool output to file: %s", e)
+
+
+def _run_repomix_command(cmd: list[str], abs_output_file: str, cwd: Optional[str] = None) -> str:
+    """
+    Run a repomix command, cleaning its terminal output line by line as it streams in.
+    
+    Each cleaned line is written to a temporary file as soon as it is read, so the
+    output is never held in memory. It is appended to the result file once repomix
+    has exited, since repomix itself (re)writes that file at the end of its run.
+    
+    Args:
+        cmd: The repomix command line
+        abs_output_file: Absolute path of the repomix output file
+        cwd: Working directory for the repomix process, defaults to the current one
+        
+    Returns:
+        The stderr output of the command
+        
+    Raises:
+        subprocess.CalledProcessError: If repomix exits with a non-zero code
+    """
+    # stderr goes to a temp file so a chatty stderr can't block the stdout stream
+    with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as stderr_file, \
+            tempfile.TemporaryFile() as cleaned_output:
+        with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, bufsize=1) as proc:
+            _write_cleaned_lines(proc.stdout, cleaned_output)
+        
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output="", stderr=stderr)
+        
+        # If output file is specified, append the tool output with markers
+        if abs_output_file and cleaned_output.tell():
+            _append_tool_output(abs_output_file, cleaned_output)
+    
+    return stderr
+
+
 def run_repomix(
     remote_url: str,
     config_path: str,
@@ -69,33 +164,10 @@ def run_repomix(
     
     try:
         # Run the repomix command
-        result = subprocess.run(cmd, check=True, text=True, capture_output=True)
-        
-        # If output file is specified, append the tool output with markers
-        if abs_output_file and result.stdout:
-            try:
-                # Clean up the terminal output
-                cleaned_output = clean_terminal_output(result.stdout)
-                
-                # First, check if the file exists and read its content
-                content = ""
-                if os.path.exists(abs_output_file):
-                    with open(abs_output_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                
-                # Append the tool output with markers
-                with open(abs_output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                    
-                    # Add tool output section with markers
-                    f.write("\n<tool_output>\n")
-                    f.write(cleaned_output)
-                    f.write("\n</tool_output>\n")
-            except Exception as e:
-                logger.error(f"Error: Failed to write tool output to file: {e}")
+        stderr = _run_repomix_command(cmd, abs_output_file)
         
         # return 1, result.stdout, result.stderr
-        return 1, abs_output_file, result.stderr
+        return 1, abs_output_file, stderr
     except subprocess.CalledProcessError as e:
         # return e.returncode, e.stdout, e.stderr
         return e.returncode, "", e.stderr
@@ -111,11 +183,11 @@ def run_repomix_local(
     """
     Run the repomix tool on a local repository path.
     
-    This function changes the current working directory to the local repository path
-    and runs repomix without --local or --remote flags. This approach allows repomix
-    to analyze the current directory as the repository, which provides more accurate
-    results than using the --local flag. The function ensures to change back to the
-    original directory after the analysis is complete, even if an error occurs.
+    This function runs repomix with the local repository path as its working directory
+    and without --local or --remote flags. This approach allows repomix to analyze the
+    current directory as the repository, which provides more accurate results than
+    using the --local flag. The process-wide working directory is left untouched, so
+    several analyses can run in parallel threads.
     
     Args:
         local_repo_path: Path to the local repository
@@ -135,59 +207,25 @@ def run_repomix_local(
     abs_config_path = os.path.abspath(config_path)
     abs_output_file = os.path.abspath(result_path)
     
-    # Save current directory to return to it later
-    original_dir = os.getcwd()
-    
-    logger.info(f"Analyzing local repository at: {local_repo_path}")
-    logger.info(f"Using config file: {abs_config_path}")
-    logger.info(f"Output will be saved to: {abs_output_file}")
+    logger.info("Analyzing local repository at: %s", local_repo_path)
+    logger.info("Using config file: %s", abs_config_path)
+    logger.info("Output will be saved to: %s", abs_output_file)
     
     try:
-        # Change to the local repository directory
-        logger.debug(f"Changing directory to: {local_repo_path}")
-        os.chdir(local_repo_path)
-        
-        # Run repomix without --local or --remote flags to analyze current directory
+        # Run repomix without --local or --remote flags to analyze its working directory
         cmd = ['repomix', '--config', abs_config_path, '--output', abs_output_file]
-        logger.debug(f"Running command: {' '.join(cmd)}")
-        
-        # Run the repomix command
-        result = subprocess.run(cmd, check=True, text=True, capture_output=True)
+        logger.debug("Running command: %s (cwd=%s)", ' '.join(cmd), local_repo_path)
         
-        # If output file is specified, append the tool output with markers
-        if abs_output_file and result.stdout:
-            try:
-                # Clean up the terminal output
-                cleaned_output = clean_terminal_output(result.stdout)
-                
-                # First, check if the file exists and read its content
-                content = ""
-                if os.path.exists(abs_output_file):
-                    with open(abs_output_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                
-                # Append the tool output with markers
-                with open(abs_output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                    
-                    # Add tool output section with markers
-                    f.write("\n<tool_output>\n")
-                    f.write(cleaned_output)
-                    f.write("\n</tool_output>\n")
-            except Exception as e:
-                logger.error(f"Error: Failed to write tool output to file: {e}")
+        # Run the repomix command inside the local repository
+        stderr = _run_repomix_command(cmd, abs_output_file, cwd=local_repo_path)
         
-        logger.info(f"Analysis completed successfully. Output saved to: {abs_output_file}")
-        return 1, abs_output_file, result.stderr
+        logger.info("Analysis completed successfully. Output saved to: %s", abs_output_file)
+        return 1, abs_output_file, stderr
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error running repomix: {e}")
+        logger.error("Error running repomix: %s", e)
         return e.returncode, "", e.stderr
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return 0, "", str(e)
-    finally:
-        # Always return to the original directory
-        logger.debug(f"Changing back to original directory: {original_dir}")
-        os.chdir(original_dir)
 
 __all__ = ["run_repomix", "run_repomix_local"]
\ No newline at end of file
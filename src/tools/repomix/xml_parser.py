@@ -1,8 +1,60 @@
+import os
 import re
+import mmap
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional, Type, TypeVar, NamedTuple, Iterable
 
-from core.models import RepomixResultData
+from pydantic import BaseModel
+
+from core.models import RepomixResultData, ToolOutput, Summary, FileRank, RepoFile
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Strips thousands separators from counts
+_NO_COMMAS = str.maketrans('', '', ',')
+
+
+class TopFileEntry(NamedTuple):
+    """A Top Files line as parsed, before conversion to FileRank."""
+    rank: int
+    path: str
+    chars: int
+    tokens: int
+
+
+class FileEntry(NamedTuple):
+    """A <file> block as parsed, before conversion to RepoFile."""
+    path: str
+    content: str
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Opt-in: run the large DOTALL section scans on RE2's linear-time engine
+USE_RE2 = re2 is not None and os.getenv("REPOMIX_PARSER_RE2", "").lower() in ("1", "true", "yes")
+
+
+def _compile_dotall(pattern: Union[str, bytes]):
+    """
+    Compile a DOTALL pattern with RE2 when enabled, otherwise with the stdlib engine.
+    
+    Args:
+        pattern: Regular expression without inline flags
+        
+    Returns:
+        Compiled pattern object exposing the `re` matching API
+    """
+    if USE_RE2:
+        try:
+            # RE2 takes flags inline rather than as a compile() argument
+            return re2.compile((b'(?s)' if isinstance(pattern, bytes) else '(?s)') + pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.DOTALL)
 
 class RepoMixParser:
     """
@@ -13,6 +65,37 @@ class RepoMixParser:
     and tool outputs like the Top Files list and Pack Summary.
     """
     
+    # Patterns compiled once and shared by all parse calls
+    # Top-level sections, matched in a single scan and told apart by group name
+    # Bytes pattern: it runs directly over the memory-mapped file
+    _SECTION_RE = _compile_dotall(
+        rb'<directory_structure>(?P<directory_structure>.*?)</directory_structure>'
+        rb'|<instruction>(?P<instruction>.*?)</instruction>'
+        rb'|<tool_output>(?P<tool_output>.*?)</tool_output>'
+        rb'|<files>(?P<files>.*?)</files>'
+        rb'|(?P<cursor_position><CURRENT_CURSOR_POSITION>)'
+    )
+    _DIRECTORY_GROUP = 1  # index of the directory_structure group above
+    # Delimiters of a <file path="...">...</file> block, located with str.find
+    _FILE_OPEN = '<file path="'
+    _FILE_CLOSE = '</file>'
+    # Short per-line patterns stay on the stdlib engine, which is faster on small inputs
+    _TOP_FILES_RE = re.compile(r'📈 Top 50 Files by Character Count and Token Count:.*?(?=\n\n)', re.DOTALL)
+    _SUMMARY_RE = re.compile(r'📊 Pack Summary:.*?(?=\n\n)', re.DOTALL)
+    # One entry per line, e.g. "1.  src/app.py (1,234 chars, 300 tokens)"; header lines never match
+    _TOP_FILE_LINE_RE = re.compile(
+        r'^\s*(\d+)\.\s+(.*?)\s+\((\d[\d,]*)\s+chars,\s+(\d[\d,]*)\s+tokens\)',
+        re.MULTILINE
+    )
+    # Pack Summary line labels -> (summary key, value kind), dispatched in one pass over the lines
+    _SUMMARY_FIELDS = {
+        'Total Files:': ('total_files', 'int'),
+        'Total Chars:': ('total_chars', 'count'),
+        'Total Tokens:': ('total_tokens', 'count'),
+        'Output:': ('output_file', 'text'),
+        'Security:': ('security', 'text'),
+    }
+    
     @staticmethod
     def parse(file_path: Union[str, Path]) -> RepomixResultData:
         """
@@ -25,13 +108,118 @@ class RepoMixParser:
             Dictionary representation of the parsed content, or empty dict if parsing failed
         """
         try:
-            result_dict = RepoMixParser._parse_custom_repo_output(file_path)
+            stat = os.stat(file_path)
+            result = RepoMixParser._parse_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
             
-            return RepomixResultData.model_validate(result_dict)
+            # Copy the files list too, so callers replacing or reordering files
+            # (e.g. merge_strategy_results) do not alter the cached entry
+            return result.model_copy(update={"files": list(result.files)})
         except Exception as e:
             print(f"Error parsing file {file_path}: {e}")
             return {}
     
+    @staticmethod
+    def parse_many(file_paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> List[RepomixResultData]:
+        """
+        Parse several RepoMix output files, spreading the work over worker processes.
+        
+        Parsing is CPU-bound, so threads would serialize on the GIL; each file is
+        parsed in a separate process instead. Results keep the input order.
+        
+        Args:
+            file_paths: Paths to the repository analysis files
+            workers: Maximum number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Parsed results in input order; failed files yield an empty dict as with parse()
+        """
+        paths = list(file_paths)
+        if len(paths) <= 1 or workers == 1:
+            # Not worth spawning processes; this also uses the in-process cache
+            return [RepoMixParser.parse(path) for path in paths]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(RepoMixParser.parse, paths))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _parse_cached(file_path: str, mtime_ns: int, size: int) -> RepomixResultData:
+        """
+        Parse and validate a file, cached per path, modification time and size.
+        
+        Args:
+            file_path: Path to the repository analysis file
+            mtime_ns: Modification time of the file, used only as part of the cache key
+            size: Size of the file in bytes, used only as part of the cache key
+            
+        Returns:
+            Validated result data; failures raise and are therefore not cached
+        """
+        result_dict = RepoMixParser._parse_custom_repo_output(file_path)
+        
+        return RepoMixParser._build_result(result_dict)
+    
+    @staticmethod
+    def _construct(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+        """
+        Build a model from parser output without running field validation.
+        
+        The parser already produces correctly typed values, so only the presence
+        of required fields is checked, keeping model_validate's failure behaviour
+        for incomplete files.
+        
+        Args:
+            model: Model class to instantiate
+            data: Field values produced by the parser
+            
+        Returns:
+            The constructed model instance
+            
+        Raises:
+            ValueError: If a required field is missing
+        """
+        missing = [name for name, field in model.model_fields.items() if field.is_required() and name not in data]
+        if missing:
+            raise ValueError(f"{model.__name__} is missing required fields: {', '.join(missing)}")
+        return model.model_construct(**data)
+    
+    @staticmethod
+    def _build_result(result_dict: Dict[str, Any]) -> RepomixResultData:
+        """
+        Assemble RepomixResultData, including its nested models, from parser output.
+        
+        Args:
+            result_dict: Dictionary returned by _parse_custom_repo_output
+            
+        Returns:
+            Result data equivalent to RepomixResultData.model_validate(result_dict)
+            
+        Raises:
+            ValueError: If a required section or field is missing
+        """
+        construct = RepoMixParser._construct
+        data = dict(result_dict)
+        
+        if 'tool_output' in data:
+            tool_output = dict(data['tool_output'])
+            if 'top_files' in tool_output:
+                # Entries always carry every field, so no presence check is needed
+                tool_output['top_files'] = [
+                    FileRank.model_construct(rank=entry.rank, path=entry.path, chars=entry.chars, tokens=entry.tokens)
+                    for entry in tool_output['top_files']
+                ]
+            if 'summary' in tool_output:
+                tool_output['summary'] = construct(Summary, tool_output['summary'])
+            data['tool_output'] = construct(ToolOutput, tool_output)
+        
+        if 'files' in data:
+            data['files'] = [
+                RepoFile.model_construct(path=entry.path, content=entry.content)
+                for entry in data['files']
+            ]
+        
+        return construct(RepomixResultData, data)
+    
     @staticmethod
     def get_formatted_directory_tree(file_path: Union[str, Path]) -> str:
         """
@@ -43,11 +231,39 @@ class RepoMixParser:
         Returns:
             Formatted directory tree as a string
         """
-        result = RepoMixParser.parse(file_path)
-        if 'directory_structure' not in result:
+        try:
+            directory_structure = RepoMixParser._parse_directory_only(file_path)
+        except Exception as e:
+            print(f"Error parsing file {file_path}: {e}")
+            directory_structure = None
+        
+        if directory_structure is None:
             return "No directory structure found"
         
-        return result['directory_structure']
+        return directory_structure
+    
+    @staticmethod
+    def _parse_directory_only(file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Extract just the directory structure, skipping the rest of the file.
+        
+        Args:
+            file_path: Path to the file to parse
+            
+        Returns:
+            Formatted directory tree, or None if the section is missing
+        """
+        with open(file_path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Same scan as the full parse, stopping at the first directory section;
+                # repomix writes it ahead of <files>, so the bulk of the file is never read
+                for match in RepoMixParser._SECTION_RE.finditer(mm):
+                    if match.lastindex == RepoMixParser._DIRECTORY_GROUP:
+                        dir_content = RepoMixParser._decode(match.group(match.lastindex)).strip()
+                        return RepoMixParser._format_simple_directory_tree(dir_content)
+        return None
     
     @staticmethod
     def _parse_custom_repo_output(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -61,49 +277,83 @@ class RepoMixParser:
         Returns:
             Structured dictionary representation of the file content
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Scan the memory-mapped bytes and decode only the matched sections,
+        # rather than decoding the whole (often multi-MB) file into one str
+        spans = {}
+        cursor_position = None
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Locate the first occurrence of every top-level section in one pass.
+                    # Sections are consumed whole, so tags quoted inside a section are not picked up.
+                    sections = {}
+                    for match in RepoMixParser._SECTION_RE.finditer(mm):
+                        name = match.lastgroup
+                        if isinstance(name, bytes):
+                            # RE2 reports group names of bytes patterns as bytes
+                            name = name.decode('ascii')
+                        sections.setdefault(name, match)
+                        if len(sections) == 5:
+                            break
+                    
+                    for name, match in sections.items():
+                        if name == 'cursor_position':
+                            # Report a character offset, as when parsing decoded text
+                            cursor_position = len(RepoMixParser._decode(mm[:match.start()]))
+                        else:
+                            spans[name] = RepoMixParser._decode(match.group(match.lastindex))
         
         # Initialize result structure
         result = {}
         
         # Extract directory structure section
-        dir_structure_match = re.search(
-            r'<directory_structure>(.*?)</directory_structure>',
-            content, 
-            re.DOTALL
-        )
-        if dir_structure_match:
-            dir_content = dir_structure_match.group(1).strip()
+        dir_structure = spans.get('directory_structure')
+        if dir_structure is not None:
+            dir_content = dir_structure.strip()
             result['directory_structure'] = RepoMixParser._format_simple_directory_tree(dir_content)
         
         # Extract cursor position if present
-        cursor_match = re.search(r'<CURRENT_CURSOR_POSITION>', content)
-        if cursor_match:
-            result['cursor_position'] = cursor_match.start()
+        if cursor_position is not None:
+            result['cursor_position'] = cursor_position
         
         # Extract instruction section if present
-        instruction_match = re.search(r'<instruction>(.*?)</instruction>', content, re.DOTALL)
-        if instruction_match:
-            instruction_content = instruction_match.group(1).strip()
+        instruction = spans.get('instruction')
+        if instruction is not None:
+            instruction_content = instruction.strip()
             result['instruction'] = instruction_content
         
         # Extract tool output section if present
-        tool_output_match = re.search(r'<tool_output>(.*?)</tool_output>', content, re.DOTALL)
-        if tool_output_match:
-            tool_output_content = tool_output_match.group(1).strip()
+        tool_output = spans.get('tool_output')
+        if tool_output is not None:
+            tool_output_content = tool_output.strip()
             
             # Extract and process specific sections from tool output
             result['tool_output'] = RepoMixParser._extract_tool_output_sections(tool_output_content)
         
         # Extract files section
-        files_match = re.search(r'<files>(.*?)</files>', content, re.DOTALL)
-        if files_match:
-            files_section = files_match.group(1).strip()
+        files = spans.get('files')
+        if files is not None:
+            files_section = files.strip()
             result['files'] = RepoMixParser._parse_files_section(files_section)
         
         return result
     
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """
+        Decode a UTF-8 span, normalizing newlines like text-mode file reads do.
+        
+        Args:
+            data: Raw bytes of a section
+            
+        Returns:
+            Decoded text with '\\n' line endings
+        """
+        text = data.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
     @staticmethod
     def _extract_tool_output_sections(content: str) -> Dict[str, Any]:
         """
@@ -118,21 +368,13 @@ class RepoMixParser:
         result = {}
         
         # Extract Top Files section
-        top_files_match = re.search(
-            r'📈 Top 50 Files by Character Count and Token Count:.*?(?=\n\n)', 
-            content, 
-            re.DOTALL
-        )
+        top_files_match = RepoMixParser._TOP_FILES_RE.search(content)
         if top_files_match:
             top_files_section = top_files_match.group(0)
             result['top_files'] = RepoMixParser._parse_top_files_section(top_files_section)
         
         # Extract Pack Summary section
-        summary_match = re.search(
-            r'📊 Pack Summary:.*?(?=\n\n)', 
-            content, 
-            re.DOTALL
-        )
+        summary_match = RepoMixParser._SUMMARY_RE.search(content)
         if summary_match:
             summary_section = summary_match.group(0)
             result['summary'] = RepoMixParser._parse_summary_section(summary_section)
@@ -140,7 +382,7 @@ class RepoMixParser:
         return result
     
     @staticmethod
-    def _parse_top_files_section(section: str) -> List[Dict[str, Any]]:
+    def _parse_top_files_section(section: str) -> List[TopFileEntry]:
         """
         Parse the Top Files section into a structured format.
         
@@ -148,33 +390,14 @@ class RepoMixParser:
             section: The Top Files section content
             
         Returns:
-            List of dictionaries with file information
+            List of TopFileEntry tuples with file information
         """
-        lines = section.splitlines()
-        top_files = []
-        
-        # Skip the header lines
-        for line in lines[2:]:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Extract file information using regex
-            match = re.match(r'(\d+)\.\s+(.*?)\s+\((\d+,?\d*)\s+chars,\s+(\d+,?\d*)\s+tokens\)', line)
-            if match:
-                rank = int(match.group(1))
-                file_path = match.group(2)
-                chars = int(match.group(3).replace(',', ''))
-                tokens = int(match.group(4).replace(',', ''))
-                
-                top_files.append({
-                    'rank': rank,
-                    'path': file_path,
-                    'chars': chars,
-                    'tokens': tokens
-                })
-        
-        return top_files
+        parse_count = RepoMixParser._parse_count
+        # A single scan over the section yields every entry
+        return [
+            TopFileEntry(int(match[1]), match[2], parse_count(match[3]), parse_count(match[4]))
+            for match in RepoMixParser._TOP_FILE_LINE_RE.finditer(section)
+        ]
     
     @staticmethod
     def _parse_summary_section(section: str) -> Dict[str, Any]:
@@ -188,34 +411,51 @@ class RepoMixParser:
             Dictionary with summary information
         """
         summary = {}
+        fields = RepoMixParser._SUMMARY_FIELDS
         
-        # Extract total files
-        files_match = re.search(r'Total Files:\s+(\d+)', section)
-        if files_match:
-            summary['total_files'] = int(files_match.group(1))
-        
-        # Extract total characters
-        chars_match = re.search(r'Total Chars:\s+([\d,]+)', section)
-        if chars_match:
-            summary['total_chars'] = int(chars_match.group(1).replace(',', ''))
-        
-        # Extract total tokens
-        tokens_match = re.search(r'Total Tokens:\s+([\d,]+)', section)
-        if tokens_match:
-            summary['total_tokens'] = int(tokens_match.group(1).replace(',', ''))
-        
-        # Extract output file path
-        output_match = re.search(r'Output:\s+(.*?)$', section, re.MULTILINE)
-        if output_match:
-            summary['output_file'] = output_match.group(1).strip()
-        
-        # Extract security status
-        security_match = re.search(r'Security:\s+(.*?)$', section, re.MULTILINE)
-        if security_match:
-            summary['security'] = security_match.group(1).strip()
+        for line in section.splitlines():
+            # Labels are right-aligned, e.g. "  Total Files: 3 files"
+            line = line.strip()
+            label, sep, value = line.partition(': ')
+            if not sep or label + ':' not in fields:
+                continue
+            
+            key, kind = fields[label + ':']
+            if key in summary:
+                # The first occurrence wins
+                continue
+            
+            value = value.strip()
+            if kind == 'text':
+                summary[key] = value
+                continue
+            
+            # Numeric values: leading digits, with thousands separators for counts
+            end = 0
+            while end < len(value) and (value[end].isdigit() or (kind == 'count' and value[end] == ',')):
+                end += 1
+            number = value[:end]
+            if number.strip(','):
+                summary[key] = RepoMixParser._parse_count(number)
         
         return summary
     
+    @staticmethod
+    def _parse_count(value: str) -> int:
+        """
+        Convert a count such as "1,234" to an int.
+        
+        Args:
+            value: Digits, optionally with thousands separators
+            
+        Returns:
+            The integer value
+        """
+        # Most counts have no separator; only those pay for a translated copy
+        if ',' in value:
+            value = value.translate(_NO_COMMAS)
+        return int(value)
+    
     @staticmethod
     def _format_simple_directory_tree(content: str) -> str:
         """
@@ -228,33 +468,25 @@ class RepoMixParser:
             Formatted directory structure with tree connectors
         """
         lines = content.splitlines()
-        formatted_lines = []
+        # Sized up front; blank lines leave a None slot that is filtered out on join
+        formatted_lines = [None] * len(lines)
         
-        for line in lines:
-            if not line.strip():
-                continue
-            
-            # Extract leading spaces to preserve indentation
-            leading_spaces = re.match(r'^(\s*)', line).group(1)
+        for i, line in enumerate(lines):
             content_part = line.lstrip()
+            if not content_part:
+                continue
             
-            # Check if it's a directory (ends with /)
-            is_dir = content_part.endswith('/')
+            # Leading whitespace is whatever lstrip() removed, preserving indentation
+            leading_spaces = line[:len(line) - len(content_part)]
             
-            # Preserve indentation and add connector
-            if is_dir:
-                # Directory connector
-                new_line = f"{leading_spaces}└── {content_part}"
-            else:
-                # File connector
-                new_line = f"{leading_spaces}├── {content_part}"
-                
-            formatted_lines.append(new_line)
-        
-        return '\n'.join(formatted_lines)
+            # Directories (ending with /) and files get different connectors
+            connector = '└── ' if content_part.endswith('/') else '├── '
+            formatted_lines[i] = f"{leading_spaces}{connector}{content_part}"
+        
+        return '\n'.join(filter(None, formatted_lines))
     
     @staticmethod
-    def _parse_files_section(content: str) -> List[Dict[str, str]]:
+    def _parse_files_section(content: str) -> List[FileEntry]:
         """
         Parse the files section which contains file paths and their contents.
         
@@ -262,21 +494,41 @@ class RepoMixParser:
             content: The content of the files section
             
         Returns:
-            List of dictionaries containing file paths and contents
+            List of FileEntry tuples containing file paths and contents
         """
         files = []
-        
-        # Extract file blocks using regex
-        file_pattern = r'<file path="([^"]+)">(.*?)</file>'
-        file_matches = re.finditer(file_pattern, content, re.DOTALL)
-        
-        for match in file_matches:
-            path = match.group(1)
-            file_content = match.group(2).strip()
-            files.append({
-                "path": path,
-                "content": file_content
-            })
+        # Hoist method and length lookups out of the per-block loop
+        append = files.append
+        find = content.find
+        startswith = content.startswith
+        file_open = RepoMixParser._FILE_OPEN
+        file_close = RepoMixParser._FILE_CLOSE
+        open_len = len(file_open)
+        close_len = len(file_close)
+        pos = 0
+        
+        # Walk the file blocks with substring searches rather than a lazy DOTALL regex
+        while True:
+            start = find(file_open, pos)
+            if start < 0:
+                break
+            
+            path_start = start + open_len
+            path_end = find('"', path_start)
+            if path_end < 0:
+                break
+            if path_end == path_start or not startswith('">', path_end):
+                # Empty path or extra attributes: not a file block, keep looking
+                pos = path_start
+                continue
+            
+            body_start = path_end + 2
+            body_end = find(file_close, body_start)
+            if body_end < 0:
+                break
+            
+            append(FileEntry(content[path_start:path_end], content[body_start:body_end].strip()))
+            pos = body_end + close_len
         
         return files
 
@@ -2,10 +2,16 @@
 Workflows package for task and flow definitions.
 
 This package contains various workflow components organized by domain.
+Subpackages are imported on first access rather than with the package itself.
 """
+import importlib
 
-from .tasks import *
-from .flows import *
-from .agents import *
+_SUBPACKAGES = ("tasks", "flows", "agents")
+
+def __getattr__(name: str):
+    # Resolve `workflows.tasks` etc. lazily (PEP 562)
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = []
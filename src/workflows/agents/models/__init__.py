@@ -1,9 +1,24 @@
-from .flow import *
-# from .agent_results.base import AgentAnalysisResult
-# from .agent_results.result import *
-# from .agent_results.extract_base import *  # Explicitly import extract_base models
-from .agent_tasks import *
-from .agent_results import *
+import importlib
+
+# Names defined directly in this package's modules; everything else in
+# __all__ comes from the agent_results package. Resolved lazily (PEP 562).
+_LAZY = {
+    "RunAIDeps": ".flow",
+    "RunAITask": ".flow",
+    "RunAgentDeps": ".agent_tasks",
+}
+
+def __getattr__(name: str):
+    if name in _LAZY or name in __all__:
+        module = importlib.import_module(_LAZY.get(name, ".agent_results"), __name__)
+        value = getattr(module, name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Flow/Task specific models
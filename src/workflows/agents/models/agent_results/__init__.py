@@ -4,10 +4,35 @@ Agent execution result models.
 This package contains models for representing results from agent executions,
 including both success and error results, as well as specialized analysis results.
 """
-from .base import AgentAnalysisResult
-from .result import TokenUsage, AgentSuccessResult, AgentErrorResult, AgentBatchResult, AgentTask, DBOpsResult, AgentResult
-from .extract_base import BaseAgentAnalysisResult, EnvVarInfo, DbTable, DbInfo, ApiEndpoint, ApiInfo
-from .security_analyzer import SecurityAnalysisResult, MaliciousCodeElement, SensitiveInfoElement, VulnerabilityElement, SecurityRecommendation
+import importlib
+
+# Exported name -> defining submodule, imported on first attribute access (PEP 562)
+_LAZY = {
+    "AgentAnalysisResult": ".base",
+    **dict.fromkeys(
+        ("TokenUsage", "AgentSuccessResult", "AgentErrorResult", "AgentBatchResult", "AgentTask", "DBOpsResult", "AgentResult"),
+        ".result",
+    ),
+    **dict.fromkeys(
+        ("BaseAgentAnalysisResult", "EnvVarInfo", "DbTable", "DbInfo", "ApiEndpoint", "ApiInfo"),
+        ".extract_base",
+    ),
+    **dict.fromkeys(
+        ("SecurityAnalysisResult", "MaliciousCodeElement", "SensitiveInfoElement", "VulnerabilityElement", "SecurityRecommendation"),
+        ".security_analyzer",
+    ),
+}
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Base models
@@ -1,5 +1,5 @@
 from typing import Self
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator
 
 class AgentAnalysisResult(BaseModel):
     """
@@ -9,7 +9,9 @@ class AgentAnalysisResult(BaseModel):
     and support for arbitrary additional attributes.
     """
     file_path: str = Field(
-        default_factory='',
+        default="",
+        # Run the validator on the default too, so an omitted file_path is rejected
+        validate_default=True,
         description="Filename of analysed file"
     )
     
@@ -18,20 +20,24 @@ class AgentAnalysisResult(BaseModel):
         "extra": "allow",
     }
     
-    @model_validator(mode='after')
-    def validate_file_path(self) -> 'AgentAnalysisResult':
+    @field_validator('file_path', mode='before')
+    @classmethod
+    def validate_file_path(cls, value: str) -> str:
         """
         Validates that the file_path is provided.
         
+        Runs as a field validator, before the field is coerced, instead of
+        after the whole model (and every subclass field) has been built.
+        
         Raises:
             ValueError: If file_path is empty or not provided
             
         Returns:
-            The validated model instance
+            The file_path value
         """
-        if not self.file_path:
+        if not value:
             raise ValueError("file_path is required")
-        return self
+        return value
     
     @staticmethod
     def default() -> Self:
@@ -41,7 +47,7 @@ class AgentAnalysisResult(BaseModel):
         Returns:
             A new AgentAnalysisResult instance with default values
         """
-        return AgentAnalysisResult(file_path='default')
+        return AgentAnalysisResult.model_construct(file_path='default')
     
     @staticmethod
     def create_error_result(error_message: str, limitations: str = "", file_path:str='default') -> Self:
@@ -54,12 +60,11 @@ class AgentAnalysisResult(BaseModel):
             file_path: The file path to associate with this error result
             
         Returns:
-            A validated AskAgentResult model with error information
+            An AskAgentResult model with error information
         """
-        result_data = {
-            "file_path": file_path,
-            "limitations": limitations or error_message,
-            "errors": error_message
-        }
-        
-        return AgentAnalysisResult.model_validate(result_data)
\ No newline at end of file
+        # Built from known-safe values, so skip the validation round-trip
+        return AgentAnalysisResult.model_construct(
+            file_path=file_path,
+            limitations=limitations or error_message,
+            errors=error_message
+        )
\ No newline at end of file
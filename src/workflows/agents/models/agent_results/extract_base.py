@@ -90,7 +90,7 @@ class BaseAgentAnalysisResult(AgentAnalysisResult):
         Returns:
             A new BaseAgentAnalysisResult instance with default values
         """
-        return BaseAgentAnalysisResult(file_path='default')
+        return BaseAgentAnalysisResult.model_construct(file_path='default')
 
 __all__ = [
     "EnvVarInfo", 
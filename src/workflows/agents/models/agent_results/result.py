@@ -178,6 +178,18 @@ class AgentTask(BaseModel):
         default=None,
         description="Path of the file being analyzed, if applicable"
     )
+    
+    def fast_dump(self) -> Dict[str, Any]:
+        """
+        Dump the task fields without going through the pydantic serializer.
+        
+        All fields are plain strings, so a copy of the instance dict equals
+        model_dump() at a fraction of the cost when merging many results.
+        
+        Returns:
+            Dictionary of field names to values
+        """
+        return dict(self.__dict__)
 
 
 # Union type for agent results
@@ -97,7 +97,7 @@ class SecurityAnalysisResult(AgentAnalysisResult):
         Returns:
             A new SecurityAnalysisResult instance with default values
         """
-        return SecurityAnalysisResult(file_path='default')
+        return SecurityAnalysisResult.model_construct(file_path='default')
 
 __all__ = [
     "MaliciousCodeElement",
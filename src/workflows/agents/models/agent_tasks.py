@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, Any, Optional, Type
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
@@ -6,7 +7,8 @@ from pydantic import BaseModel, Field
 from workflows.agents.models.agent_results import AgentAnalysisResult
 from core.models import RepoAnalysisResult
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10+; on 3.9 instances keep a __dict__
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class RunAgentDeps:
     repomix_data: RepoAnalysisResult = field(
         default=None,
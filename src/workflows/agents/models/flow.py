@@ -1,8 +1,10 @@
+import sys
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10+; on 3.9 instances keep a __dict__
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class RunAIDeps:
     db_name: str = field(
         default='workflows',
@@ -43,15 +45,6 @@ class RunAIDeps:
             "target_obj_id": self.target_obj_id
         }
     
-    def __dict__(self) -> Dict[str, str]:
-        """
-        Override __dict__ to provide a simplified dictionary representation.
-        
-        Returns:
-            A dictionary representation of the model, excluding the shared_agent field.
-        """
-        return self.to_dict()
-    
     def __json__(self) -> Dict[str, str]:
         """
         Make the class JSON serializable by supporting __json__ method.
@@ -34,43 +34,21 @@ LIMITATIONS:
 - Acknowledge when certain analyses are beyond your capabilities
 - Avoid listing generic possibilities when the code doesn't provide specific evidence
 
-You will receive specific instructions about what to analyze in each task. Respond only with relevant information that addresses the user's specific request.
-"""
-
-
-CODE_ANALYZER_BASE_INSTR = """Analyze the provided codebase to extract the following critical information:
-
-1. ENVIRONMENT VARIABLES:
-   - Identify all environment variables used in the codebase
-   - Document their names and describe their purpose based on context
-   - Include where these variables are loaded, accessed, or referenced
-   - Provide additional context on why the variable exists and how it's used by developers
-
-2. DATABASE INFORMATION:
-   - Detect all database connections and configurations
-   - Identify database names and all tables referenced
-   - For each table, describe how it's used (e.g., "reads from", "writes to")
-   - Note any relationships between tables
-   - Include context about the database design and how it's used
-
-3. API DOCUMENTATION:
-   - Find all API endpoints (both internal and external)
-   - Document their request/response formats
-   - Note any authentication requirements
-   - Include the host/URL information
-   - Provide implementation context and usage patterns for developers
+EXTRACTION TASK (applies to every file you receive):
+1. ENVIRONMENT VARIABLES: every variable used, its purpose, where it is loaded/accessed, and why developers rely on it
+2. DATABASE INFORMATION: connections and configuration, database names, every table referenced and how it is used ("reads from", "writes to"), relationships between tables, and design context
+3. API DOCUMENTATION: internal and external endpoints, request/response formats, authentication requirements, host/URL, and implementation/usage context
 
 RESPONSE FORMAT:
-Your response MUST be a SINGLE valid JSON object following the schema I've provided, but DO NOT include the schema itself in your response.
-
-CRITICAL JSON RULES:
+- Respond with a SINGLE valid JSON object matching the schema given with each file; never repeat the schema itself
 - Use ONLY double quotes (") for property names and string values, NEVER single quotes (')
-- All property names must be enclosed in double quotes
-- Return ONLY the JSON object without any markdown formatting, code blocks, or explanations
-- Do not add any text before or after the JSON
-- Ensure your response is strictly valid JSON that can be parsed by JSON.parse()
+- No markdown, code blocks, or any text before or after the JSON; it must parse with JSON.parse()
+
+Each message contains the JSON schema, the file path and the file content. Respond only with relevant information that addresses the request.
+"""
+
 
-DO NOT include the schema definition. ONLY include the data that matches the schema.
+CODE_ANALYZER_BASE_INSTR = """Extract environment variables, database information and API endpoints from the file below. Output JSON matching this schema:
 {json_schema}
 
 CONTENT TO ANALYZE:
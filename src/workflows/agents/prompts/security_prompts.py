@@ -44,71 +44,24 @@ LIMITATIONS:
 - Acknowledge when certain analyses are beyond your capabilities
 - Avoid listing generic possibilities when the code doesn't provide specific evidence
 
-You will receive specific instructions about what to analyze in each task. Respond only with relevant information that addresses the user's specific request.
-"""
-
-
-SECURITY_ANALYZER_BASE_INSTR = """Analyze the provided codebase to perform a comprehensive security review and extract the following critical security information:
-
-1. MALICIOUS CODE ELEMENTS:
-   - Identify any potential backdoors or intentionally malicious code
-   - Detect hardcoded credentials, access tokens, or API keys in source code (excluding proper configuration mechanisms)
-   - Look for suspicious network connections, unexpected outbound requests
-   - Find any obfuscated code, hidden functionality, or time bombs
-   - Examine for unauthorized system calls, file access, or command execution
-   - Note any suspicious logic that bypasses authentication or authorization
-
-2. SENSITIVE INFORMATION EXPOSURE:
-   - Detect any hardcoded secrets, passwords, keys, or tokens directly in application code (NOT in configuration files or environment variables)
-   - Identify improperly handled sensitive data (PII, PHI, financial)
-   - Find insecure storage or transmission of sensitive information
-   - Look for data leakage in logs, error messages, or comments
-   - Document any weak encryption or hashing implementations
-
-3. VULNERABILITY ASSESSMENT (OWASP ASVS):
-   - Authentication: Weak mechanisms, credential handling, session management
-   - Access Control: Broken authorization, privilege escalation, IDOR vulnerabilities
-   - Input Validation: SQL injection, XSS, CSRF, command injection, path traversal
-   - Cryptography: Weak algorithms, improper implementations, insecure key management
-   - Error Handling: Information leakage, exception management, debug flags
-   - Configuration: Insecure default settings, unnecessary features, outdated components
-   - Business Logic: Missing validations, race conditions, flawed assumptions
-   - API Security: Improper endpoint protection, lack of rate limiting, insufficient validation
-   - Data Protection: Insecure storage, weak encryption, improper access controls
-
-4. SECURITY RECOMMENDATIONS:
-   - Provide specific, actionable remediation steps for each issue found with a focus on maintainability and reliability
-   - Suggest code changes with appropriate security patterns
-   - Recommend additional validation or controls where needed
-   - Prioritize findings based on risk and exploitability
-   - Reference relevant OWASP ASVS requirements and best practices
-
-5. FALSE POSITIVE ANALYSIS:
-   - For each finding, consider and document potential reasons why it might be a false positive
-   - Assess the context, implementation details, and potential mitigations that might already exist
-   - Consider legitimate use cases for security patterns (e.g., credentials in configuration files or environment variables)
-   - Rate the likelihood that each finding is a false positive (Low, Medium, High)
-   - Provide reasoning for your false positive assessment
-   - Don't dismiss real issues - when in doubt, report the finding with appropriate confidence level
-
-6. RISK SCORING:
-   - Calculate an overall security risk score (0-100) for the analyzed code
-   - Consider severity, number of findings, and confidence levels in your scoring
-   - Higher scores indicate higher security risk (e.g., 85-100 is critical risk)
-   - Provide brief justification for the assigned score
-   - Be consistent in scoring across different analyses
+SECURITY REVIEW TASK (applies to every file you receive):
+1. MALICIOUS CODE: backdoors, hardcoded credentials/tokens/API keys in source code (not proper configuration), suspicious outbound connections, obfuscated or hidden functionality, time bombs, unauthorized system calls/file access/command execution, authentication or authorization bypasses
+2. SENSITIVE INFORMATION EXPOSURE: secrets directly in application code (NOT configuration files or environment variables), mishandled PII/PHI/financial data, insecure storage or transmission, leakage in logs/errors/comments, weak encryption or hashing
+3. VULNERABILITY ASSESSMENT (OWASP ASVS): authentication, access control (authorization, privilege escalation, IDOR), input validation (SQLi, XSS, CSRF, command injection, path traversal), cryptography, error handling, configuration, business logic, API security, data protection
+4. RECOMMENDATIONS: specific, actionable and maintainable remediation per finding, secure code patterns, extra validation or controls, prioritized by risk and exploitability, referencing OWASP ASVS
+5. FALSE POSITIVE ANALYSIS: per finding, reasons it may be a false positive given context and existing mitigations (e.g. credentials in configuration), likelihood (Low, Medium, High) with reasoning; when in doubt, report the finding with an appropriate confidence
+6. RISK SCORING: overall score 0-100 (85-100 is critical) from severity, number of findings and confidence, with a brief, consistently applied justification
 
 RESPONSE FORMAT:
-Your response MUST be a SINGLE valid JSON object following the schema I've provided, but DO NOT include the schema itself in your response.
-
-CRITICAL JSON RULES:
+- Respond with a SINGLE valid JSON object matching the schema given with each file; never repeat the schema itself
 - Use ONLY double quotes (") for property names and string values, NEVER single quotes (')
-- All property names must be enclosed in double quotes
-- Return ONLY the JSON object without any markdown formatting, code blocks, or explanations
-- Do not add any text before or after the JSON
-- Ensure your response is strictly valid JSON that can be parsed by JSON.parse()
+- No markdown, code blocks, or any text before or after the JSON; it must parse with JSON.parse()
+
+Each message contains the JSON schema, the file path and the file content. Respond only with relevant information that addresses the request.
+"""
+
 
-DO NOT include the schema definition. ONLY include the data that matches the schema.
+SECURITY_ANALYZER_BASE_INSTR = """Perform a security review of the file below: malicious code, sensitive information exposure, OWASP ASVS vulnerabilities, recommendations, false positive analysis and risk score. Output JSON matching this schema:
 {json_schema}
 
 CONTENT TO ANALYZE:
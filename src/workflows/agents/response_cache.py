@@ -0,0 +1,226 @@
+"""
+Persistent LLM response cache.
+
+This module stores validated agent responses on disk so that re-running an
+analysis over unchanged files skips the LLM call entirely. Entries are keyed by
+a digest of everything that determines the response: model, system prompt and
+the fully formatted task instructions (template, file path, content and schema).
+Entries expire after a TTL and the table is trimmed to a maximum entry count, so
+the file does not grow without bound.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from core.config import app_config
+from core.utils import LoggerFactory
+
+# Number of writes between two prune passes over the SQLite table
+_PRUNE_INTERVAL = 256
+
+logger = LoggerFactory.get_logger(name=app_config.APP_TITLE, log_level=app_config.log_level, trace_enabled=True)
+
+
+class ResponseCache:
+    """
+    SQLite-backed key/value store for serialized agent responses.
+
+    A short-lived connection is opened per operation so the cache can be shared
+    by Prefect tasks running on different worker threads. Recently used entries
+    are also kept in an in-process LRU so repeated prompts skip SQLite entirely.
+    get()/set() block on SQLite; async callers use aget()/aset(), which run them
+    on a worker thread so a locked database never stalls the event loop.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        memory_size: int = 1024,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the cache, create its table if needed and prune stale entries.
+
+        Args:
+            db_path: SQLite file path (default: app_config.get_response_cache_path())
+            enabled: Whether the cache is active (default: app_config.CACHE_ENABLED)
+            memory_size: Maximum number of entries kept in the in-process LRU (default: 1024)
+            ttl_seconds: Age after which entries expire (default: app_config.RESPONSE_CACHE_TTL_SECONDS)
+            max_entries: Maximum number of entries kept on disk (default: app_config.RESPONSE_CACHE_MAX_ENTRIES)
+        """
+        self.db_path = db_path or app_config.get_response_cache_path()
+        self.enabled = app_config.CACHE_ENABLED if enabled is None else enabled
+        self.memory_size = memory_size
+        self.ttl_seconds = app_config.RESPONSE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_entries = app_config.RESPONSE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._writes = 0
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+                if "created_at" not in columns:
+                    # Tables from before expiry was added; their entries count as expired
+                    conn.execute("ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)")
+                self._prune(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache disabled, failed to open {self.db_path}: {str(e)}")
+            self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _is_fresh(self, created_at: float) -> bool:
+        return self.ttl_seconds <= 0 or time.time() - created_at < self.ttl_seconds
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete expired entries and the oldest entries beyond max_entries."""
+        if self.ttl_seconds > 0:
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        if self.max_entries > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        with self._memory_lock:
+            self._memory[key] = (value, created_at)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def make_key(*parts: Optional[str]) -> str:
+        """
+        Build a cache key from the inputs that determine an LLM response.
+
+        Args:
+            *parts: Strings such as model name, system prompt and task instructions
+
+        Returns:
+            Hex digest identifying the combination of parts
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in parts:
+            encoded = (part or "").encode("utf-8")
+            # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The stored response string, or None on a miss, an expired entry or when disabled
+        """
+        if not self.enabled:
+            return None
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(entry[1]):
+                    self._memory.move_to_end(key)
+                    return entry[0]
+                del self._memory[key]
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+        if not row or not self._is_fresh(row[1]):
+            return None
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response, replacing any existing entry for the key.
+
+        Args:
+            key: Cache key from make_key()
+            value: Serialized response to store
+        """
+        if not self.enabled:
+            return
+        created_at = time.time()
+        self._remember(key, value, created_at)
+        with self._memory_lock:
+            self._writes += 1
+            prune = self._writes % _PRUNE_INTERVAL == 0
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, created_at),
+                )
+                if prune:
+                    self._prune(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {str(e)}")
+
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response without blocking the event loop.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The stored response string, or None on a miss, an expired entry or when disabled
+        """
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """
+        Store a response without blocking the event loop.
+
+        Args:
+            key: Cache key from make_key()
+            value: Serialized response to store
+        """
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.set, key, value)
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide response cache configured from app_config.
+
+    Returns:
+        Shared ResponseCache instance
+    """
+    return ResponseCache()
+
+
+__all__ = ["ResponseCache", "get_response_cache"]
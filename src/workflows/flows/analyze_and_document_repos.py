@@ -1,8 +1,15 @@
 import os
+import re
 import click
 import asyncio
+from pathlib import Path
 from typing import Union, Dict, Any, List, Optional
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None
+
 from prefect import flow
 from prefect.states import Failed, Completed
 
@@ -27,6 +34,10 @@ DEFAULT_REPOMIX_CONFIG_PATH = os.environ.get(
     "/workspaces/workflow-automation/src/tools/repomix/default_repomix_config.json"
 )
 
+_GITHUB_URL_RE = re.compile(r'^https://github\.com/[\w.-]+/[\w.-]+(?:\.git)?$')
+# Characters dropped from each line of a URLs file
+_URL_STRIP_TBL = str.maketrans('', '', '\n,\r\t')
+
 def flow_precheck() -> Union[bool, str]:
     """
     Verify required environment variables and prerequisites for the flow.
@@ -85,11 +96,24 @@ def build_repo_result(
         "documentation_path": documentation_path if status == "success" else None
     }
 
+def read_repo_urls(urls_file: str) -> List[str]:
+    """
+    Read repository URLs from a file, one per line.
+    
+    Newlines, commas and surrounding whitespace are dropped and blank lines skipped.
+    
+    Args:
+        urls_file: Path to the file containing the URLs
+        
+    Returns:
+        List of URLs in file order
+    """
+    lines = Path(urls_file).read_text(encoding='utf-8').splitlines()
+    return [url for url in (line.translate(_URL_STRIP_TBL).strip() for line in lines) if url]
+
 def is_valid_github_url(url: str) -> bool:
     """Validate that a URL is a properly formatted GitHub repository URL."""
-    import re
-    pattern = r'^https://github\.com/[\w.-]+/[\w.-]+(?:\.git)?$'
-    return bool(re.match(pattern, url))
+    return _GITHUB_URL_RE.match(url) is not None
 
 async def _analyze_repo(github_url:str, repomix_config_path:str=DEFAULT_REPOMIX_CONFIG_PATH, is_private:bool=False) -> RepoAnalysisResult:
     
@@ -102,10 +126,12 @@ async def _analyze_repo(github_url:str, repomix_config_path:str=DEFAULT_REPOMIX_
             repomix_config_path=repomix_config_path
         )
         
+        # Analysis flows are synchronous; run them in a worker thread so other
+        # repositories keep making progress on the event loop meanwhile
         if is_private:
-            repo_analysis_result = run_private_repo_analysis(task)
+            repo_analysis_result = await asyncio.to_thread(run_private_repo_analysis, task)
         else:
-            repo_analysis_result = run_repo_analysis(task)
+            repo_analysis_result = await asyncio.to_thread(run_repo_analysis, task)
     
         if not repo_analysis_result:
             logger.warning(f"Failed to run repository analysis for {github_url}")
@@ -133,6 +159,150 @@ async def _analyze_repo(github_url:str, repomix_config_path:str=DEFAULT_REPOMIX_
     
     return final_result
 
+class RepoStageError(Exception):
+    """Raised by a per-repository stage to stop processing that repository with an error."""
+
+
+async def _run_analysis_stage(repo_url: str, repomix_config_path: str, is_private: bool) -> RepoAnalysisResult:
+    """
+    Stage 1: run the Repomix analysis of the repository.
+    
+    Raises:
+        RepoStageError: If the analysis fails or returns no result data
+    """
+    try:
+        tool_run_result = await _analyze_repo(github_url=repo_url,repomix_config_path=repomix_config_path, is_private=is_private)
+    except Exception as ex:
+        raise RepoStageError(f"Error: failed to analyze repository: {repo_url}: {str(ex)}. Skipping...") from ex
+    
+    if not tool_run_result:
+        raise RepoStageError(f"Error: Either public/private repo analysis returned no result. Did tool failed to analyze repo? Skipping...")
+    if not tool_run_result.result:
+        reason = tool_run_result.error or "result is missing"
+        raise RepoStageError(f"Error: Repository analysis returned no result data ({reason}). Skipping...")
+    return tool_run_result
+
+async def _run_strategies_stage(tool_run_result: RepoAnalysisResult) -> List[Any]:
+    """
+    Stage 2: apply the extraction strategies (extending analysis phase).
+    
+    Raises:
+        RepoStageError: If a strategy fails or returns nothing
+    """
+    try:
+        logger.info(f"Running Base Extraction Strategy")
+        # Run Base Information Extraction Strategy Flow to get env, api, db constants
+        base_result_data = await add_basev2(repomix_result=tool_run_result)
+        
+        # logger.info(f"Running Security Review Strategy")
+        # appsec_result_data = await security_review(repomix_result=tool_run_result)
+        
+        # Additional strategies goes here
+    except Exception as ex:
+        raise RepoStageError(f"Uncaught Exception when trying to apply repo analysis strategies: {str(ex)}") from ex
+    
+    if not base_result_data:
+        raise RepoStageError(f"Uncaught Exception when trying to apply repo analysis strategies: add_base returned empty object")
+    
+    # Results from additional strategies should be included here
+    return [base_result_data,]
+
+async def _store_repo_document(
+    repo_url: str,
+    repo_document: RepomixResultData,
+    repomix_result_store: AsyncRepository,
+    storage_lock: asyncio.Lock,
+) -> None:
+    """
+    Store the analysis document of one repository as soon as its processing is done.
+    
+    Storage errors are logged and do not fail the repository.
+    
+    Args:
+        repo_url: GitHub repository URL the document belongs to
+        repo_document: Analysis document, enriched with strategy results when they succeeded
+        repomix_result_store: Repository used to store analysis results
+        storage_lock: Serializes access to the shared local storage
+    """
+    try:
+        logger.info(f"Storing repo analysis results of {repo_url} to local data store")
+        async with storage_lock:
+            doc_id = await repomix_result_store.create(repo_document)
+        logger.debug(f"DONE: DB Location: {app_config.get_db_path()}, doc_id: {doc_id}")
+    except Exception as ex:
+        logger.error(f"Error: Failed to store repo analysis results of {repo_url}. Reason: {str(ex)}")
+
+async def _process_repo(
+    repo_url: str,
+    repomix_config_path: str,
+    is_private: bool,
+    repo_semaphore: asyncio.Semaphore,
+    repomix_result_store: AsyncRepository,
+    storage_lock: asyncio.Lock,
+) -> List[RepoAnalysisResult]:
+    """
+    Run analysis, strategies, merge and documentation stages for a single repository.
+    
+    Each stage either returns its output or raises RepoStageError; the first error
+    ends processing and is recorded as the repository's single result entry. Once
+    the analysis succeeded, its document is stored in one write after the merge
+    (or after a failed strategy), so finished work is kept even if other
+    repositories in the run fail or are cancelled.
+    
+    Args:
+        repo_url: GitHub repository URL to process
+        repomix_config_path: Path to the Repomix configuration file
+        is_private: Flag if private repo analysis should be run instead of public
+        repo_semaphore: Limits how many repositories are processed concurrently
+        repomix_result_store: Repository used to store analysis results
+        storage_lock: Serializes access to the shared local storage
+        
+    Returns:
+        Result entries recorded for this repository
+    """
+    if not is_valid_github_url(repo_url):
+        logger.warning(f"Skipping invalid GitHub URL format: {repo_url}")
+        return [RepoAnalysisResult(repository_url=repo_url, error="Invalid GitHub repository URL format")]
+    
+    async with repo_semaphore:
+        logger.info(f"Processing repository: {repo_url}")
+        try:
+            # Stage 1: Running Repomix tool to analyze repository
+            tool_run_result = await _run_analysis_stage(repo_url, repomix_config_path, is_private)
+        except RepoStageError as ex:
+            logger.error(str(ex))
+            return [RepoAnalysisResult(repository_url=repo_url, error=str(ex))]
+        org_result_data = tool_run_result.result
+        
+        stage_error = None
+        try:
+            # Stage 2: Applying strategies
+            results_to_be_merged = await _run_strategies_stage(tool_run_result)
+            
+            # Stage 3: Merging results from strategies into final result object
+            try:
+                # Files are replaced in place, so org_result_data sees the merge
+                merge_strategy_results(org_result_data.files, results_to_be_merged)
+            except Exception as ex:
+                raise RepoStageError(f"Error merging strategy results for repository {repo_url}: {str(ex)}") from ex
+        except RepoStageError as ex:
+            logger.error(str(ex))
+            stage_error = ex
+        
+        # A single write per repository, with whatever enrichment succeeded
+        await _store_repo_document(repo_url, org_result_data, repomix_result_store, storage_lock)
+        if stage_error is not None:
+            return [RepoAnalysisResult(repository_url=repo_url, error=str(stage_error))]
+        
+        # Stage 4: Creating Docs (best effort, does not affect the result)
+        try:
+            doc_path = await run_generate_docs_new(build_from_obj=org_result_data)
+        except Exception as ex:
+            pass
+        logger.info(f"Successfully processed repository: {repo_url}")
+    
+    return [RepoAnalysisResult(repository_url=repo_url, result=org_result_data, error=None)]
+
 @flow(
     log_prints=True, 
     name="run_analyze_and_document_repos", 
@@ -147,7 +317,8 @@ async def run_analyze_and_document_repos(
     Run analysis, enrichment, and documentation generation for multiple repositories
     using the same configuration.
     
-    This flow processes each repository in sequence:
+    This flow processes repositories concurrently (up to REPO_CONCURRENCY at a time),
+    running these stages for each one:
     1. Runs the private repo analysis flow to analyze the repository
     2. Extracts base information (env vars, APIs, DB connections) with AI
     3. Merges the AI results into the MongoDB document
@@ -191,158 +362,38 @@ async def run_analyze_and_document_repos(
         if not can_run:
             return Failed(err_msg)
     
-    # Track results for each repository
-    consolidated_results = []
     # Place to store repository file content and metadata
     repomix_result_store = AsyncRepository(model_class=RepomixResultData, storage=local_storage)
+    # Bounds how many repositories are in flight at once
+    repo_semaphore = asyncio.Semaphore(app_config.REPO_CONCURRENCY)
+    # The shared storage holds a single open DB handle, so its operations must not interleave
+    storage_lock = asyncio.Lock()
     
-    # Process each repository
-    for repo_url in github_repo_urls:
-        if not is_valid_github_url(repo_url):
-            logger.warning(f"Skipping invalid GitHub URL format: {repo_url}")
-            
-            consolidated_results.append(
-                RepoAnalysisResult(
-                    repository_url=repo_url,
-                    error="Invalid GitHub repository URL format"
-                )
-            )
-            continue
-        
-        logger.info(f"Processing repository: {repo_url}")
-        tool_run_result = None
-        
-        # Stage 1: Running Repomix tool to analyze repository and store results
-        try:
-            tool_run_result = await _analyze_repo(github_url=repo_url,repomix_config_path=repomix_config_path, is_private=is_private)
-        
-        except Exception as ex:
-            err_msg = f"Error: failed to analyze repository: {repo_url}: {str(ex)}. Skipping..."
-            logger.error(err_msg)
-            
-            consolidated_results.append(
-                RepoAnalysisResult(
-                    repository_url=repo_url,
-                    error=err_msg
-                )
-            )
-            continue # Continue processing other repos
-        finally:
-            if tool_run_result:
-                tool_run_result_data = getattr(tool_run_result,'result', None)
-                
-                if tool_run_result_data:
-                    # Using nested try/except to catch db errors
-                    try:
-                        logger.info(f"Storing private repo analysis results to local data store")
-                        doc_id = await repomix_result_store.create(tool_run_result_data)
-                        logger.debug(f"DONE: DB Location: {app_config.get_db_path()}, doc_id: {doc_id}")
-                    except Exception as ex:
-                        err_msg = f"Error: Failed to store repo analysis results. Reason: {str(ex)}"
-                        continue
-                else:
-                    err_msg = f"Error: Failed to store analysis results. Either tool_run_result is missing `result` attribute or it's value is None. Skipping..."
-                    logger.error(err_msg)
-                    continue # Continue processing other repose, cause this failed
-            else:
-                err_msg = f"Error: Either public/private repo analysis returned no result. Did tool failed to analyze repo? Skipping..."
-                logger.error(err_msg)     
-                continue
-        
-        # Stage 2: Applying strategies (extending analysis phase)
-        try:
-            if tool_run_result:
-                results_to_be_merged = []
-                base_result_data = {}
-                logger.info(f"Running Base Extraction Strategy")
-                # Run Base Information Extraction Strategy Flow to get env, api, db constants
-                base_result_data = await add_basev2(repomix_result=tool_run_result)
-                
-                # logger.info(f"Running Security Review Strategy")
-                # appsec_result_data = await security_review(repomix_result=tool_run_result)
-                
-                # Additional strategies goes here
-                
-                if not base_result_data:
-                    raise Exception(f"add_base returned empty object")
-
-                # Results from additional strategies should be included here
-                results_to_be_merged.extend([base_result_data,])
-            else:
-                raise ValueError(f"Error: Enhanced Analysis completed but result is None. Skipping...")
-            
-        except Exception as ex:
-            err_msg = f"Uncaught Exception when trying to apply repo analysis strategies: {str(ex)}"
-            logger.error(err_msg)
-            
-            consolidated_results.append(
-                RepoAnalysisResult(
-                    repository_url=repo_url,
-                    error=err_msg
-                )
+    # Process repositories concurrently; each one reports its own outcome
+    repo_outcomes = await asyncio.gather(
+        *[
+            _process_repo(
+                repo_url=repo_url,
+                repomix_config_path=repomix_config_path,
+                is_private=is_private,
+                repo_semaphore=repo_semaphore,
+                repomix_result_store=repomix_result_store,
+                storage_lock=storage_lock,
             )
-            continue
-        
-        # Stage 3: Merging results from strategies into final result object
-        try:
-            if results_to_be_merged:
-                local_storage_id = doc_id[0] if doc_id else '' # We will replace original doc, with enriched one
-                org_result_data = getattr(tool_run_result, 'result', None)
-                org_files = getattr(org_result_data, 'files', [])
-                # Ensure we have valid data to work with
-                if not org_result_data:
-                    logger.warning("Original result data is missing or invalid")
-                    consolidated_results.append(
-                        RepoAnalysisResult(
-                            repository_url=repo_url,
-                            error="Original result data is missing or invalid"
-                        )
-                    )
-                    continue
-                
-                merge_strategy_results(org_files, results_to_be_merged)
-                
-                setattr(org_result_data,'files',org_files)
-                
-                # Update the document in storage with merged data
-                update_success = await repomix_result_store.update_document_with_merged_data(
-                    local_storage_id, 
-                    org_result_data
-                )
-                
-                consolidated_results.append(
-                    RepoAnalysisResult(
-                        repository_url=repo_url,
-                        result=org_result_data,
-                        error=None
-                    )
-                )
-            else:
-                logger.warning(f"No strategy results to merge for repository {repo_url}")
-                consolidated_results.append(
-                    RepoAnalysisResult(
-                        repository_url=repo_url,
-                        result=org_result_data,
-                        error=None
-                    )
-                )
-        except Exception as ex:
-            err_msg = f"Error merging strategy results for repository {repo_url}: {str(ex)}"
+            for repo_url in github_repo_urls
+        ],
+        return_exceptions=True
+    )
+    
+    # Track results for each repository, in input order
+    consolidated_results = []
+    for repo_url, outcome in zip(github_repo_urls, repo_outcomes):
+        if isinstance(outcome, BaseException):
+            err_msg = f"Uncaught Exception when processing repository {repo_url}: {str(outcome)}"
             logger.error(err_msg)
-            
-            consolidated_results.append(
-                RepoAnalysisResult(
-                    repository_url=repo_url,
-                    error=err_msg
-                )
-            )
-        
-        # Stage 4: Creating Docs
-        try:
-            doc_path = await run_generate_docs_new(build_from_obj=org_result_data)
-        except Exception as ex:
-            pass
-        logger.info(f"Successfully processed repository: {repo_url}")
+            consolidated_results.append(RepoAnalysisResult(repository_url=repo_url, error=err_msg))
+        else:
+            consolidated_results.extend(outcome)
     
     return Completed(
         message=f"Successfully processed of {len(consolidated_results)} repositories",
@@ -381,17 +432,14 @@ def main(urls, urls_file, repomix_config, private):
     # Read from urls-file if provided and exists
     if urls_file:
         try:
-            with open(urls_file, 'r') as url_file:
-                file_urls = [url.replace('\n','').replace(',','').strip() for url in url_file.readlines()]
-                github_repos_to_process.extend(file_urls)
+            github_repos_to_process.extend(read_repo_urls(urls_file))
         except FileNotFoundError:
             click.echo(f"Warning: URLs file '{urls_file}' not found, ignoring it.")
     
     # If no URLs provided, fall back to default behavior (sample_repos.txt)
     if not github_repos_to_process:
         try:
-            with open('sample_repos.txt', 'r') as url_file:
-                github_repos_to_process = [url.replace('\n','').replace(',','').strip() for url in url_file.readlines()]
+            github_repos_to_process = read_repo_urls('sample_repos.txt')
             logger.info(f"No URLs provided. Using {len(github_repos_to_process)} URLs from sample_repos.txt")
         except FileNotFoundError:
             click.echo("Error: No GitHub repository URLs provided and sample_repos.txt not found.")
@@ -400,13 +448,19 @@ def main(urls, urls_file, repomix_config, private):
             click.echo(ctx.get_help())
             ctx.exit(1)
     
-    asyncio.run(
-        run_analyze_and_document_repos(
-            github_repo_urls=github_repos_to_process,
-            repomix_config_path=repomix_config,
-            is_private=private
+    # Prefer the libuv-based event loop when available
+    run_event_loop = uvloop.run if uvloop is not None else asyncio.run
+    try:
+        run_event_loop(
+            run_analyze_and_document_repos(
+                github_repo_urls=github_repos_to_process,
+                repomix_config_path=repomix_config,
+                is_private=private
+            )
         )
-    )
+    finally:
+        # Let background tracing setup finish, so the run's spans are exported at exit
+        LoggerFactory.wait_for_tracing(timeout=10)
 
 
 if __name__ == "__main__":
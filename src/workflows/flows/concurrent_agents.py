@@ -1,24 +1,32 @@
 # Standard library imports
 import time
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+import statistics
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
 
 from openai import APIConnectionError, APIError, APITimeoutError, AsyncOpenAI, RateLimitError
 
-from prefect import flow, task, unmapped
+from prefect import flow, task
 from prefect.cache_policies import NO_CACHE
-from prefect.futures import wait
 from prefect.states import Completed, Failed
-from prefect.task_runners import ThreadPoolTaskRunner
 from prefect.tasks import exponential_backoff
+from pydantic import BaseModel, ValidationError
 from pydantic_ai import Agent
 
+try:
+    from litellm.exceptions import ServiceUnavailableError
+except ImportError:
+    ServiceUnavailableError = None  # pragma: no cover - litellm is an optional provider client
+
 # Local application imports
 from core.utils import (
-    create_task_batches,
     get_current_retry_count,
     get_current_task_run_id,
     get_flow_name,
+    iter_task_batches,
     LoggerFactory
 )
 from workflows.agents.models import (
@@ -32,6 +40,7 @@ from workflows.agents.models import (
     RunAgentDeps,
     TokenUsage
 )
+from workflows.agents.response_cache import ResponseCache, get_response_cache
 from workflows.tasks.ai_ops.agent_config import (
     DEFAULT_MODEL,
     DEFAULT_MODEL_TEMP,
@@ -39,7 +48,7 @@ from workflows.tasks.ai_ops.agent_config import (
     get_async_pydanticai_agent
 )
 from workflows.tasks.ai_ops.tasks import get_file_context
-from workflows.tasks.ai_ops.utils import create_agent_tasks
+from workflows.tasks.ai_ops.utils import iter_agent_tasks, iter_unique_agent_tasks
 
 from core.config import app_config
 from core.models import RepoAnalysisResult
@@ -54,10 +63,254 @@ with proper batching, retry logic, and result aggregation. It supports both Pyda
 and OpenAI-compatible interfaces with comprehensive error handling.
 """
 
+# Limits in-flight LLM requests across every flow run on the same event loop
+_llm_semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent LLM requests to MAX_WORKERS.
+    
+    asyncio primitives are bound to one event loop, so a new semaphore is
+    created when called from a different loop.
+    
+    Returns:
+        Semaphore shared by all agent tasks on the running event loop
+    """
+    global _llm_semaphore
+    loop = asyncio.get_running_loop()
+    if _llm_semaphore is None or _llm_semaphore[0] is not loop:
+        _llm_semaphore = (loop, asyncio.Semaphore(app_config.MAX_WORKERS))
+    return _llm_semaphore[1]
+
+# Bounds live agent task runs across every flow run on the same event loop, counted in files
+_task_run_gate: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock, asyncio.Semaphore]] = None
+
+def _get_task_run_gate() -> Tuple[asyncio.Lock, asyncio.Semaphore]:
+    """
+    Get the lock and semaphore bounding live agent task runs to MAX_WORKERS files.
+    
+    Returns:
+        Lock serializing multi-slot acquisition, and the slot semaphore, for the running event loop
+    """
+    global _task_run_gate
+    loop = asyncio.get_running_loop()
+    if _task_run_gate is None or _task_run_gate[0] is not loop:
+        _task_run_gate = (loop, asyncio.Lock(), asyncio.Semaphore(app_config.MAX_WORKERS))
+    return _task_run_gate[1], _task_run_gate[2]
+
+@asynccontextmanager
+async def _task_run_slots(count: int = 1) -> AsyncIterator[None]:
+    """
+    Hold task-run slots while a Prefect agent task runs.
+    
+    Prefect's task timeout starts when the task run starts, so runs are only started
+    once they can get an LLM slot right away; waiting happens here, outside the timeout.
+    
+    Args:
+        count: Files the task run sends concurrently (capped at MAX_WORKERS)
+    """
+    lock, semaphore = _get_task_run_gate()
+    count = max(1, min(count, app_config.MAX_WORKERS))
+    acquired = 0
+    try:
+        # One acquirer at a time, so partially acquired batches cannot deadlock each other
+        async with lock:
+            for _ in range(count):
+                await semaphore.acquire()
+                acquired += 1
+        yield
+    finally:
+        for _ in range(acquired):
+            semaphore.release()
+
+def _get_batch_timeout(timeout_seconds: float, batch_size: int, max_retries: int) -> float:
+    """
+    Get the Prefect timeout of a fused batch task run.
+    
+    Args:
+        timeout_seconds: Timeout budget of a single file's call
+        batch_size: Files in the batch
+        max_retries: Retries per file inside the batch
+        
+    Returns:
+        Budget for every attempt of the batch's call rounds (the batch holds at most
+        MAX_WORKERS LLM slots) plus the backoff sleeps between attempts
+    """
+    rounds = -(-batch_size // app_config.MAX_WORKERS)
+    backoff = sum(2 * 2 ** attempt for attempt in range(max_retries))
+    return rounds * timeout_seconds * (max_retries + 1) + backoff
+
+# OpenAI client errors that run_agent_openai re-raises for Prefect to retry; must be
+# matched before APIError, which RateLimitError subclasses
+_OPENAI_RETRYABLE_ERRORS: Tuple[type, ...] = (APITimeoutError, APIConnectionError, RateLimitError)
+
+# Exceptions from the PydanticAI agent that Prefect should retry (subclasses included)
+_RETRYABLE_ERRORS: Tuple[type, ...] = (asyncio.TimeoutError, RateLimitError, APIConnectionError) + (
+    (ServiceUnavailableError,) if ServiceUnavailableError is not None else ()
+)
+
+# asyncio.timeout (Python 3.11+) guards a call without wrapping it in an extra task
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+async def _await_with_timeout(awaitable: Awaitable[Any], timeout: float) -> Any:
+    """
+    Await an LLM call, raising asyncio.TimeoutError once the timeout expires.
+    
+    Args:
+        awaitable: The call to await
+        timeout: Timeout in seconds
+        
+    Returns:
+        The result of the call
+    """
+    if _asyncio_timeout is None:
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+    async with _asyncio_timeout(timeout):
+        return await awaitable
+
+# Durations of recent successful LLM calls, used to spot tail-latency outliers
+_llm_latencies: Deque[float] = deque(maxlen=200)
+# Calls needed before the p95 latency is trusted for hedging
+HEDGE_MIN_SAMPLES = 20
+
+def _get_hedge_delay() -> Optional[float]:
+    """
+    Get how long to wait before hedging an LLM request with a second copy.
+    
+    Returns:
+        The p95 of recent call durations in seconds, or None when hedging is disabled
+        or too few calls have completed to estimate it
+    """
+    if not app_config.HEDGE_REQUESTS_ENABLED or len(_llm_latencies) < HEDGE_MIN_SAMPLES:
+        return None
+    return statistics.quantiles(_llm_latencies, n=20)[-1]
+
+async def _run_hedged(make_call: Callable[[], Awaitable[Any]], semaphore: Optional[asyncio.Semaphore] = None) -> Any:
+    """
+    Run an LLM call, racing a second copy once it outlives the recent p95 latency.
+    
+    Whichever copy succeeds first wins and the other is cancelled. A copy that
+    fails while the other is still running does not end the race.
+    
+    Args:
+        make_call: Factory returning a new awaitable for the same request
+        semaphore: Semaphore bounding in-flight LLM requests; the caller holds a slot
+                   for the first copy and the hedged copy needs a free slot of its own,
+                   otherwise it is not sent
+        
+    Returns:
+        The result of the first successful copy
+    """
+    started = time.perf_counter()
+    hedge_delay = _get_hedge_delay()
+    if hedge_delay is None:
+        # No race to run, so await the call directly instead of wrapping it in a task
+        result = await make_call()
+        _llm_latencies.append(time.perf_counter() - started)
+        return result
+    
+    calls = [asyncio.ensure_future(make_call())]
+    hedge_slot = False
+    try:
+        done, _ = await asyncio.wait(calls, timeout=hedge_delay)
+        if not done:
+            if semaphore is not None and semaphore.locked():
+                logger.debug(f"LLM request still running after p95 latency {hedge_delay:.2f}s, no free slot to hedge it")
+            else:
+                if semaphore is not None:
+                    # Not locked, so this takes a slot without waiting
+                    await semaphore.acquire()
+                    hedge_slot = True
+                logger.debug(f"LLM request still running after p95 latency {hedge_delay:.2f}s, sending hedged copy")
+                calls.append(asyncio.ensure_future(make_call()))
+        
+        pending = set(calls)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = [call for call in done if call.exception() is None]
+            if succeeded or not pending:
+                result = (succeeded or list(done))[0].result()
+                _llm_latencies.append(time.perf_counter() - started)
+                return result
+    finally:
+        for call in calls:
+            call.cancel()
+        if hedge_slot:
+            semaphore.release()
+
+def _get_inner_timeout(timeout_seconds: float) -> float:
+    """
+    Get the timeout guarding a single LLM call inside an agent task.
+    
+    Args:
+        timeout_seconds: Timeout budget of the call
+        
+    Returns:
+        The budget minus a 10% (at least 5s) safety margin, so the guard fires before the task timeout
+    """
+    return min(timeout_seconds * 0.9, timeout_seconds - 5)
+
+def _is_cacheable_result(result: AgentAnalysisResult) -> bool:
+    """
+    Check whether an agent result may be stored in (or served from) the response cache.
+    
+    parse_code_analysis_response falls back to AgentAnalysisResult.default() when a
+    response cannot be parsed; caching that would replay a one-off bad reply forever.
+    
+    Args:
+        result: Parsed agent result
+        
+    Returns:
+        True when the response was parsed successfully and carries no errors
+    """
+    return result.file_path != "default" and not getattr(result, "errors", None)
+
+def _empty_result(result_type: Type[BaseModel], file_path: str) -> Dict[str, Any]:
+    """
+    Build the result of a file that was filtered out before reaching the agent.
+    
+    Args:
+        result_type: Pydantic model class returned by the agent
+        file_path: Path of the filtered file
+        
+    Returns:
+        Dumped result_type with default (empty) fields, or just the file path when
+        result_type has required fields
+    """
+    try:
+        return result_type(file_path=file_path).model_dump()
+    except ValidationError:
+        return {"file_path": file_path}
+
+@lru_cache(maxsize=32)
+def _system_message(content: str) -> Dict[str, str]:
+    """
+    Get the chat message for a system prompt, built once per distinct prompt.
+    
+    Args:
+        content: System prompt text
+        
+    Returns:
+        Message dict shared by every request using this prompt (do not mutate)
+    """
+    return {"role": "system", "content": content}
+
+@lru_cache(maxsize=None)
+def _schema_for(result_type: type) -> Dict[str, Any]:
+    """
+    Get the JSON schema of a result model, computed once per model class.
+    
+    Args:
+        result_type: Pydantic model class returned by the agent
+        
+    Returns:
+        JSON schema of the model (shared; do not mutate)
+    """
+    return result_type.model_json_schema()
+
 @flow(
     log_prints=True, 
     name="run_concurrent_agents",
-    task_runner=ThreadPoolTaskRunner(max_workers=app_config.MAX_WORKERS)
 )
 async def run_concurrent_agents(
     ctx: RunAgentDeps,
@@ -65,6 +318,7 @@ async def run_concurrent_agents(
     agent_name: str = "env-vars-extractor",
     max_retries: int = 3,
     timeout_seconds: int = 120,
+    content_filter: Optional[Callable[[str], bool]] = None,
 ) -> Union[Completed,Failed]:
     """
     Flow that runs concurrent agent tasks using PydanticAI across repository context.
@@ -79,6 +333,8 @@ async def run_concurrent_agents(
         agent_name: Name of the agent configuration to use (default: "env-vars-extractor")
         max_retries: Maximum number of retries for each task (default: 3)
         timeout_seconds: Timeout in seconds for each task (default: 120)
+        content_filter: Optional predicate on file content; rejected files are not sent to the agent
+            and get an empty result of ctx.result_type instead
         
     Returns:
         Union[Completed,Failed]: Prefect state with AgentBatchResult data on success,
@@ -87,13 +343,14 @@ async def run_concurrent_agents(
     assert ctx is not None
     assert ctx.repomix_data is not None
     
-    if not hasattr(ctx.result_type,'model_json_schema'):
-        err_msg = f"Error: No expected return type configured for `run_concurrent_agents`: {repo_url}"
+    # Validate the result type once; merged responses are then known to be pydantic models
+    if not (isinstance(ctx.result_type, type) and issubclass(ctx.result_type, BaseModel)):
+        err_msg = f"Error: No expected return type configured for `run_concurrent_agents`: {getattr(ctx.repomix_data, 'repository_url', '')}"
         logger.error(err_msg)
         return Failed(message=f"FAIL: {err_msg}")  
     
     
-    llm_return_data_schema = ctx.result_type.model_json_schema()
+    llm_return_data_schema = _schema_for(ctx.result_type)
     repomix_result_data = getattr(ctx.repomix_data,'result', None)
     files = getattr(repomix_result_data,'files', [])
     
@@ -102,23 +359,23 @@ async def run_concurrent_agents(
     
     logger.info(f"Retrieved repository context for concurrent agents: {repo_url}, {len(files)} files")
 
-    tasks = []
-    
-    # # Otherwise, create tasks from repository files
-    tasks = create_agent_tasks(
-        instructions=instructions, 
-        repo_context=repomix_result_data, 
-        result_type_schema=llm_return_data_schema
+    # Create tasks lazily from repository files; identical files only need one LLM
+    # call, their paths are collected in duplicate_paths and get a copy of the result
+    duplicate_paths: Dict[str, List[str]] = {}
+    # Files rejected by content_filter, collected for their empty results
+    filtered_paths: List[str] = []
+    tasks = iter_unique_agent_tasks(
+        iter_agent_tasks(
+            instructions=instructions, 
+            repo_context=repomix_result_data, 
+            result_type_schema=llm_return_data_schema,
+            content_filter=content_filter,
+            filtered_paths=filtered_paths
+        ),
+        repomix_result_data,
+        duplicate_paths
     )
     
-    # Check if we have tasks to process
-    if not tasks:
-        err_msg = f"Error: No tasks created for repository {repo_url}"
-        logger.error(err_msg)
-        return Failed(message=f"FAIL: {err_msg}")
-    
-    logger.debug(f"Created {len(tasks)} tasks to process")
-    
     # Configure agent and task
     task_build_kwargs = {
         "retries":max_retries,
@@ -127,76 +384,122 @@ async def run_concurrent_agents(
         "tags":[agent_name, repo_name, "llm", "pydantic-ai"]
     }
     agent, config = get_async_pydanticai_agent(agent_name)
+    # Constant for the whole run, so compute it once rather than in every task
+    inner_timeout = _get_inner_timeout(config.get("timeout_seconds", 90))
     
-    configured_task = run_agent_pydantic.with_options(**task_build_kwargs)
-    logger.debug(f"Agent Task Configuration: {task_build_kwargs}")
-    
-    # Process in batches
-    success_results = []
-    fail_results = []
-    batches = create_task_batches(tasks, app_config.MAX_WORKERS)
-    logger.info(f"Processing {len(tasks)} tasks in {len(batches)} batches")
-    
-    for i, batch in enumerate(batches):
-        batch_size = len(batch)
-        logger.info(f"Starting batch {i+1}/{len(batches)} with {batch_size} tasks")
-        
-        # Process batch
-        batch_futures = configured_task.map(
-            task=batch,
-            agent_name=unmapped(agent_name),
-            shared_client=unmapped(agent),
-            config=unmapped(config)
+    # Create a final obj that this task will return
+    final_result = AgentBatchResult()
+    merged_by_path: Dict[str, Dict[str, Any]] = {}
+    tasks_sent = 0
+    
+    def merge_result(task_result: Any) -> None:
+        """Add one successful agent result to final_result"""
+        final_result.successful += 1
+        # Successful tasks return an AgentSuccessResult whose task is an AgentTask; only
+        # the response may be a raw string when the agent output was not parsed
+        agent_response = getattr(task_result, 'result', None)
+        if not isinstance(agent_response, BaseModel):
+            logger.error(f"Expected Pydantic model, got {type(agent_response)}")
+            return
+        task_ctx = task_result.task
+        try:
+            # Dumping to ensure all extra fields from agent_response are included
+            response_w_task_ctx = {**task_ctx.fast_dump(), **agent_response.model_dump()}
+            
+            final_result.results.append(response_w_task_ctx)
+            merged_by_path[task_ctx.file_path] = response_w_task_ctx
+        except Exception as e:
+            logger.error(f"Failed to merge task_ctx and agent_response, type(`agent_response`): {type(agent_response).__name__}: {str(e)}")
+    
+    # Workers pull the next task as soon as their previous one finishes, so only about
+    # 2 x MAX_WORKERS prompts are alive at once; a task run only starts once it holds
+    # task-run slots, so its Prefect timeout never includes time queued for the LLM
+    in_flight = 2 * app_config.MAX_WORKERS
+    logger.info(f"Processing tasks, up to {app_config.MAX_WORKERS} LLM requests at a time")
+    batch_size = app_config.AGENT_TASK_BATCH_SIZE
+    if batch_size > 1:
+        # Fuse files into fewer Prefect task runs; retries happen per file inside the batch
+        configured_batch_task = run_agent_batch_pydantic.with_options(
+            tags=task_build_kwargs["tags"],
+            timeout_seconds=_get_batch_timeout(timeout_seconds, batch_size, max_retries),
         )
+        task_batches = iter_task_batches(tasks, batch_size)
         
-        batch_completed = wait(batch_futures).done
+        async def run_worker() -> None:
+            nonlocal tasks_sent
+            for task_batch in task_batches:
+                tasks_sent += len(task_batch)
+                async with _task_run_slots(len(task_batch)):
+                    batch_state = await configured_batch_task(
+                        tasks=task_batch,
+                        agent_name=agent_name,
+                        shared_client=agent,
+                        config=config,
+                        max_retries=max_retries,
+                        inner_timeout=inner_timeout,
+                        return_state=True
+                    )
+                batch_results = await batch_state.result(raise_on_failure=False)
+                if batch_state.is_failed():
+                    final_result.failed += len(task_batch)
+                    continue
+                for task_result in batch_results:
+                    if isinstance(task_result, AgentErrorResult):
+                        final_result.failed += 1
+                    else:
+                        merge_result(task_result)
         
-        # Split into successful and failed tasks
-        success_tasks = [future for future in batch_completed if not future.state.is_failed()]
-        failed_tasks = [future for future in batch_completed if future.state.is_failed()]
+        worker_count = -(-in_flight // batch_size)
+    else:
+        configured_task = run_agent_pydantic.with_options(**task_build_kwargs)
+        logger.debug(f"Agent Task Configuration: {task_build_kwargs}")
         
-        # Get results from each task
-        batch_results_ok = [future.result() for future in success_tasks]
-        batch_results_fail = [future.result() for future in failed_tasks]
+        async def run_worker() -> None:
+            nonlocal tasks_sent
+            # Merge each result as soon as its task finishes, so responses are not held until the end
+            for agent_task in tasks:
+                tasks_sent += 1
+                async with _task_run_slots():
+                    task_state = await configured_task(
+                        task=agent_task,
+                        agent_name=agent_name,
+                        shared_client=agent,
+                        config=config,
+                        inner_timeout=inner_timeout,
+                        return_state=True
+                    )
+                task_result = await task_state.result(raise_on_failure=False)
+                if task_state.is_failed():
+                    final_result.failed += 1
+                    continue
+                merge_result(task_result)
         
-        # Add batch results to overall results
-        success_results.extend(batch_results_ok)
-        fail_results.extend(batch_results_fail)
-        
-        # Calculate batch statistics
-        batch_success_count = len(success_tasks)
-        overall_success_count = len(success_results)
-        overall_fail_count = len(fail_results)
-        
-        # Log detailed batch results
-        logger.info(f"Batch {i+1} completed: {batch_success_count}/{batch_size} successful")
-        logger.info(f"  - Cumulative progress: {overall_success_count} successful, {overall_fail_count} failed")
+        worker_count = in_flight
     
-    # Create a final obj that this task will return
-    final_result = AgentBatchResult(
-        successful=len(success_results),
-        failed=len(fail_results),
-        total_tasks=len(tasks)
-    )
+    await asyncio.gather(*(run_worker() for _ in range(worker_count)))
     
-    # Get Agent response message for parsing
-    agent_response_content = [(agent_response.task,agent_response.result) for agent_response in success_results]
+    # Check if we had tasks to process; a repository whose files were all filtered out is not an error
+    if not tasks_sent and not filtered_paths:
+        err_msg = f"Error: No tasks created for repository {repo_url}"
+        logger.error(err_msg)
+        return Failed(message=f"FAIL: {err_msg}")
     
-    # Build final result obj
-    for task_ctx, agent_response in agent_response_content:
-        try:
-            # Dumping to ensure all extra fields from agent_response are included
-            # Make sure both objects are Pydantic models before using model_dump()
-            if hasattr(task_ctx, 'model_dump') and hasattr(agent_response, 'model_dump'):
-                response_w_task_ctx = task_ctx.model_dump() | agent_response.model_dump()
-            else:
-                logger.error(f"Expected Pydantic models, got {type(task_ctx)} and {type(agent_response)}")
-                continue
-            
-            final_result.results.append(response_w_task_ctx)
-        except Exception as e:
-            logger.error(f"Failed to merge task_ctx and agent_response, type(`agent_response`): {type(agent_response).__name__}: {str(e)}")
+    # Reuse results for files with the same content
+    final_result.total_tasks = tasks_sent + sum(len(paths) for paths in duplicate_paths.values()) + len(filtered_paths)
+    for representative_path, paths in duplicate_paths.items():
+        response_w_task_ctx = merged_by_path.get(representative_path)
+        if response_w_task_ctx is None:
+            # The representative failed, so its duplicates failed with it
+            final_result.failed += len(paths)
             continue
+        for duplicate_path in paths:
+            final_result.results.append({**response_w_task_ctx, "file_path": duplicate_path})
+            final_result.successful += 1
+    
+    # Filtered files hold nothing to extract, so they get an empty result without an LLM call
+    for filtered_path in filtered_paths:
+        final_result.results.append(_empty_result(ctx.result_type, filtered_path))
+        final_result.successful += 1
     
     if not final_result.results:
         return Failed(message=f"FAIL: {get_flow_name()}")
@@ -221,6 +524,7 @@ async def run_agent_pydantic(
     user_prompt: Optional[str] = None, 
     shared_client: Optional[Agent] = None,
     config: Optional[Dict[str, Any]] = None,
+    inner_timeout: Optional[float] = None,
 ) -> Union[Completed, Failed]:
     """
     Enhanced run_agent_pydantic task with comprehensive error handling and recovery using PydanticAI.
@@ -235,20 +539,117 @@ async def run_agent_pydantic(
         user_prompt: Optional user prompt to override task.instructions
         shared_client: Optional shared PydanticAI Agent client
         config: Optional configuration parameters
+        inner_timeout: Optional timeout for the LLM call, precomputed by the caller
         
     Returns:
         Union[Completed, Failed]: Where the Prefect state's data attribute contains an AgentResult
         (either AgentSuccessResult or AgentErrorResult)
     """
+    return await _call_agent_pydantic(
+        task=task,
+        agent_name=agent_name,
+        user_prompt=user_prompt,
+        shared_client=shared_client,
+        config=config,
+        inner_timeout=inner_timeout,
+    )
+
+@task(
+    name="run_agent_batch_pydantic",
+    tags=["ai", "agent", "llm", "pydantic-ai"],  # Tags for filtering in the UI
+    persist_result=app_config.is_development(),  # Persist the result for debugging
+    cache_policy=NO_CACHE,
+)
+async def run_agent_batch_pydantic(
+    tasks: List[AgentTask],
+    agent_name: str,
+    shared_client: Optional[Agent] = None,
+    config: Optional[Dict[str, Any]] = None,
+    max_retries: int = 3,
+    inner_timeout: Optional[float] = None,
+) -> List[Union[AgentSuccessResult, AgentErrorResult]]:
+    """
+    Run several agent tasks inside a single Prefect task run.
+    
+    Each Prefect task run carries its own state transitions and telemetry, so fusing
+    tasks into one run removes that overhead for large repositories. Calls still run
+    concurrently, bounded by the shared LLM semaphore. Retryable errors are retried
+    per file inside the batch, so successful files are never re-sent.
+    
+    Args:
+        tasks: Task objects containing instructions and metadata
+        agent_name: Name of the agent to use
+        shared_client: Optional shared PydanticAI Agent client
+        config: Optional configuration parameters
+        max_retries: Maximum number of retries for each file (default: 3)
+        inner_timeout: Optional timeout for each LLM call, precomputed by the caller
+        
+    Returns:
+        List[Union[AgentSuccessResult, AgentErrorResult]]: One result per task, in input order
+    """
+    results: List[Optional[Union[AgentSuccessResult, AgentErrorResult]]] = [None] * len(tasks)
+    pending = list(range(len(tasks)))
+    
+    for attempt in range(max_retries + 1):
+        if attempt:
+            # Same schedule as exponential_backoff(backoff_factor=2) on the single-file task
+            await asyncio.sleep(2 * 2 ** (attempt - 1))
+        
+        states = await asyncio.gather(
+            *(_call_agent_pydantic(task=tasks[i], agent_name=agent_name, shared_client=shared_client, config=config, inner_timeout=inner_timeout) for i in pending),
+            return_exceptions=True
+        )
+        
+        retry = []
+        for i, state in zip(pending, states):
+            if not isinstance(state, BaseException):
+                results[i] = state.data
+            elif attempt < max_retries and isinstance(state, _RETRYABLE_ERRORS):
+                retry.append(i)
+            else:
+                results[i] = AgentErrorResult(
+                    task=tasks[i],
+                    error_type="unexpected",
+                    message=str(state),
+                    exception_type=state.__class__.__name__
+                )
+        if not retry:
+            break
+        pending = retry
+    
+    return results
+
+async def _call_agent_pydantic(
+    task: AgentTask,
+    agent_name: str,
+    user_prompt: Optional[str] = None, 
+    shared_client: Optional[Agent] = None,
+    config: Optional[Dict[str, Any]] = None,
+    inner_timeout: Optional[float] = None,
+) -> Union[Completed, Failed]:
+    """
+    Send one task to a PydanticAI agent; shared by the single and batched agent tasks.
+    
+    Args:
+        task: Task object containing instructions and metadata
+        agent_name: Name of the agent to use
+        user_prompt: Optional user prompt to override task.instructions
+        shared_client: Optional shared PydanticAI Agent client
+        config: Optional configuration parameters
+        inner_timeout: Optional timeout for the LLM call; derived from config when omitted
+        
+    Returns:
+        Union[Completed, Failed]: Prefect state whose data is an AgentSuccessResult or AgentErrorResult
+        
+    Raises:
+        asyncio.TimeoutError: When the inner timeout guard triggers
+        Exception: Retryable provider errors, re-raised for the caller to retry
+    """
     # Track execution time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    # Initialize tracking context
-    context = {
-        "agent": agent_name,
-        "retry_count": get_current_retry_count(),
-        "task_run_id": get_current_task_run_id(),
-    }
+    # Read the Prefect run context once per call
+    retry_count = get_current_retry_count()
     
     if not task.instructions:
         raise ValueError(f"instructions are required for `run_agent_pydantic` task. Make sure param task has valid `instruction` field")
@@ -262,19 +663,39 @@ async def run_agent_pydantic(
     # Determine which prompt to use (user_prompt has priority over task.instructions)
     prompt_to_use = (user_prompt or task.instructions)
     
-    # Create a more configurable timeout with safety margin
-    timeout_seconds = config.get("timeout_seconds", 90)  # Default 90 seconds
-    # Add a 10% safety margin to prevent task timeout before inner timeout
-    inner_timeout = min(timeout_seconds * 0.9, timeout_seconds - 5)
+    # Serve unchanged inputs from the persistent response cache
+    response_cache = get_response_cache()
+    cache_key = ResponseCache.make_key(agent_name, config.get("model"), config.get("system_prompt"), prompt_to_use)
+    cached_response = await response_cache.aget(cache_key)
+    if cached_response is not None:
+        try:
+            result = AgentAnalysisResult.model_validate_json(cached_response)
+            if not _is_cacheable_result(result):
+                raise ValueError("cached response holds a fallback or error result")
+            duration = time.perf_counter() - start_time
+            success_result = AgentSuccessResult(
+                task=task,
+                result=result,
+                duration_seconds=duration,
+                agent=agent_name,
+                model=config.get("model"),
+            )
+            return Completed(data=success_result, message=f"Agent {agent_name} served from response cache in {duration:.2f}s")
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid cached response for {task.file_path}: {str(e)}")
+    
+    # Callers running many tasks pass the timeout precomputed once per flow run
+    if inner_timeout is None:
+        inner_timeout = _get_inner_timeout(config.get("timeout_seconds", 90))  # Default 90 seconds
     
     try:
-        # Make the API call with timeout guard
-        agent_response = await asyncio.wait_for(
-            agent.run(
-                prompt_to_use
-            ),
-            timeout=inner_timeout
-        )
+        # Make the API call with timeout guard, holding a slot of the shared LLM semaphore
+        llm_semaphore = _get_llm_semaphore()
+        async with llm_semaphore:
+            agent_response = await _await_with_timeout(
+                _run_hedged(lambda: agent.run(prompt_to_use), llm_semaphore),
+                timeout=inner_timeout
+            )
         
         # Process successful response
         result = getattr(agent_response,'data',None)
@@ -288,7 +709,9 @@ async def run_agent_pydantic(
             return Failed(data=error_result, message="Agent returned empty response")
             
         if isinstance(result, AgentAnalysisResult):
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
+            if _is_cacheable_result(result):
+                await response_cache.aset(cache_key, result.model_dump_json())
         
             success_result = AgentSuccessResult(
                 task=task,
@@ -299,7 +722,7 @@ async def run_agent_pydantic(
             )
             return Completed(
                 data=success_result, 
-                message=f"Agent {agent_name} completed successfully in {duration:.2f}s. Retry attempts: {get_current_retry_count()+1}")
+                message=f"Agent {agent_name} completed successfully in {duration:.2f}s. Retry attempts: {retry_count+1}")
         else:
             error_result = AgentErrorResult(
                 task=task,
@@ -310,7 +733,7 @@ async def run_agent_pydantic(
 
     except asyncio.TimeoutError as e:
         # Our own timeout guard triggered
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.warning(f"Internal timeout for agent {agent_name} after {duration:.2f}s")
         
         # Raise for Prefect to handle retry
@@ -318,18 +741,10 @@ async def run_agent_pydantic(
         
     except Exception as e:
         # Catch all other exceptions - PydanticAI will have its own error types
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         # Determine if this is a retryable error
-        error_class = e.__class__.__name__
-        retryable_errors = [
-            "TimeoutError", 
-            "RateLimitError", 
-            "APIConnectionError", 
-            "ServiceUnavailableError"
-        ]
-        
-        if error_class in retryable_errors:
+        if isinstance(e, _RETRYABLE_ERRORS):
             logger.warning(f"Expected error: {str(e)} for agent {agent_name} after {duration:.2f}s execution - Will Retry... ")
             # Raise for Prefect to handle retry
             raise e
@@ -338,7 +753,7 @@ async def run_agent_pydantic(
             task=task,
             error_type="unexpected",
             message=str(e),
-            exception_type=error_class
+            exception_type=e.__class__.__name__
         )
         return Failed(data=error_result, message=f"Agent {agent_name} encountered unexpected error: {str(e)}")
 
@@ -386,14 +801,11 @@ async def run_agent_openai(
         (either AgentSuccessResult or AgentErrorResult)
     """
     # Track execution time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    # Initialize tracking context
-    context = {
-        "agent": agent_name,
-        "retry_count": get_current_retry_count(),
-        "task_run_id": get_current_task_run_id(),
-    }
+    # Read the Prefect run context once per call
+    retry_count = get_current_retry_count()
+    task_run_id = get_current_task_run_id()
     
     
     if not task.instructions:
@@ -414,15 +826,17 @@ async def run_agent_openai(
     
     # Prepare headers with request ID for tracing
     headers = dict(config.get("headers", {}))
-    headers["X-Request-ID"] = f"run-{context['task_run_id']}"
+    headers["X-Request-ID"] = f"run-{task_run_id}"
     
     # Create a more configurable timeout with safety margin
     timeout_seconds = config.get("timeout_seconds", app_config.HTTPX_TIMEOUT_SECONDS)
     # Add a 10% safety margin to prevent task timeout before inner timeout
-    inner_timeout = min(timeout_seconds * 0.9, timeout_seconds - 5) 
+    inner_timeout = _get_inner_timeout(timeout_seconds)
     
     # Determine which prompt to use (user_prompt has priority over task.instructions)
     prompt_to_use = user_prompt or task.instructions
+    # The system message is shared across tasks; only the user message is built per task
+    messages = [_system_message(system_message), {"role": "user", "content": prompt_to_use}]
     
     try:
         # Make the API call with timeout guard
@@ -431,24 +845,24 @@ async def run_agent_openai(
             model_to_use = DEFAULT_MODEL
             logger.warning(f"Model name not found in agent_config, using default: {model_to_use}")
         
-        response = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=model_to_use,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt_to_use}
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature,
-                extra_headers=headers
-            ),
-            timeout=inner_timeout
-        )
+        llm_semaphore = _get_llm_semaphore()
+        async with llm_semaphore:
+            response = await _await_with_timeout(
+                _run_hedged(lambda: client.chat.completions.create(
+                    model=model_to_use,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    extra_headers=headers,
+                    extra_body=config.get("extra_body") or None
+                ), llm_semaphore),
+                timeout=inner_timeout
+            )
         
         # Process successful response
         if response.choices:
             result = response.choices[0].message.content
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Create token usage data if available
             token_usage = None
@@ -469,7 +883,7 @@ async def run_agent_openai(
             )
             return Completed(
                 data=success_result, 
-                message=f"Agent {agent_name} completed successfully in {duration:.2f}s. Retry attempts: {get_current_retry_count()+1}")
+                message=f"Agent {agent_name} completed successfully in {duration:.2f}s. Retry attempts: {retry_count+1}")
         
         # Handle empty response (unlikely but possible)
         logger.warning(f"Agent {agent_name} returned empty response")
@@ -479,33 +893,17 @@ async def run_agent_openai(
             message=f"The LLM returned an empty response for model {model_to_use}"
         )
         return Failed(data=error_result, message="Agent returned empty response")
-    except APITimeoutError as e:
-        # Timeout errors are usually retryable
-        duration = time.time() - start_time
-        logger.warning(f"Timeout error for agent {agent_name} after {duration:.2f}s: {str(e)}")
-        
-        # Raise for Prefect to handle retry - don't add a message
-        raise e
-            
-    except APIConnectionError as e:
-        # Connection errors are usually retryable
-        duration = time.time() - start_time
-        logger.warning(f"Connection error for agent {agent_name} after {duration:.2f}s: {str(e)}")
-        
-        # Raise for Prefect to handle retry - don't add a message
-        raise e
-        
-    except RateLimitError as e:
-        # Rate limit errors should retry with increasing backoff
-        duration = time.time() - start_time
-        logger.warning(f"Rate limit error for agent {agent_name} after {duration:.2f}s: {str(e)}")
+    except _OPENAI_RETRYABLE_ERRORS as e:
+        # Timeouts, connection and rate limit errors are retryable
+        duration = time.perf_counter() - start_time
+        logger.warning(f"{e.__class__.__name__} for agent {agent_name} after {duration:.2f}s: {str(e)}")
         
         # Raise for Prefect to handle retry with exponential backoff - don't add a message
         raise e
         
     except APIError as e:
         # API errors may be retryable depending on status code
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         status_code = getattr(e, "status_code", 0)
         
         # 429, 500, 502, 503, 504 are typically retryable
@@ -525,7 +923,7 @@ async def run_agent_openai(
             
     except asyncio.TimeoutError as e:
         # Our own timeout guard triggered
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.warning(f"Internal timeout for agent {agent_name} after {duration:.2f}s")
         
         # Raise for Prefect to handle retry
@@ -533,7 +931,7 @@ async def run_agent_openai(
         
     except Exception as e:
         # Catch all other exceptions
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.error(f"Unexpected error for agent {agent_name} after {duration:.2f}s: {str(e)}")
         
         error_result = AgentErrorResult(
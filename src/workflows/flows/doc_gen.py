@@ -1,16 +1,76 @@
 import asyncio
-from typing import List
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 from prefect import flow, task
 from prefect.artifacts import create_markdown_artifact
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 from core.utils import LoggerFactory
 
 from core.config import app_config
 logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
 
+# Version of the markdown renderer, part of every report digest; bump it whenever a change
+# to generate_markdown_from_doc or its templates changes the rendered output
+DOC_RENDERER_VERSION = "1"
+
+def get_doc_digest(data: Dict[str, Any]) -> str:
+    """
+    Compute a stable digest of the data a report is built from and of the renderer.
+    
+    Args:
+        data: Dictionary the markdown report is generated from
+        
+    Returns:
+        Hex digest identifying the data and DOC_RENDERER_VERSION
+    """
+    if orjson is not None:
+        serialized = orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        serialized = json.dumps(data, default=str, sort_keys=True).encode("utf-8")
+    digest = hashlib.blake2b(DOC_RENDERER_VERSION.encode("ascii"), digest_size=32)
+    digest.update(serialized)
+    return digest.hexdigest()
+
+def _read_unchanged_report(filepath: Path, digest_path: Path, doc_digest: str) -> Optional[str]:
+    """
+    Read an existing report if it was built from the same data and renderer.
+    
+    Args:
+        filepath: Path of the markdown report
+        digest_path: Path of the digest stored next to the report
+        doc_digest: Digest of the current data, from get_doc_digest()
+        
+    Returns:
+        The existing markdown content, or None when the report must be regenerated
+    """
+    if filepath.exists() and digest_path.exists() and digest_path.read_text() == doc_digest:
+        return filepath.read_text()
+    return None
+
+def _write_report(filepath: Path, digest_path: Path, markdown_content: str, doc_digest: str) -> None:
+    """
+    Save a markdown report together with the digest of the data it was built from.
+    
+    Args:
+        filepath: Path of the markdown report
+        digest_path: Path of the digest stored next to the report
+        markdown_content: Rendered markdown
+        doc_digest: Digest of the data, from get_doc_digest()
+    """
+    filepath.parent.mkdir(exist_ok=True)
+    filepath.write_text(markdown_content)
+    digest_path.write_text(doc_digest)
+
 
 @flow(
     log_prints=True, 
@@ -28,10 +88,26 @@ async def run_generate_docs_new(build_from_obj):
     else:
         raise ValueError(f"Error: Failed to created Markdown object from type:{type(build_from_obj)}, Supported Types: pydantic.BaseModel, to_dict() method, or dict instance itself")
     
-    markdown_content = generate_markdown_from_doc(doc=data)
+    repo_name = data.get("repository_name", "unnamed-repo")
+    
+    reports_dir = Path("reports")
+    filename = f"{repo_name.upper()}.md"
+    filepath = reports_dir / filename
+    # Digest of the data the existing report was built from, kept next to the report
+    digest_path = reports_dir / f".{filename}.digest"
+    
+    # Digesting, rendering and file I/O are blocking; run them in worker threads
+    # so concurrently processed repositories keep making progress on the event loop
+    doc_digest = await asyncio.to_thread(get_doc_digest, data)
+    # Skip regeneration when the report already reflects identical data and renderer
+    markdown_content = await asyncio.to_thread(_read_unchanged_report, filepath, digest_path, doc_digest)
+    is_unchanged = markdown_content is not None
+    if is_unchanged:
+        logger.info(f"Documentation unchanged, reusing {filepath}")
+    else:
+        markdown_content = await asyncio.to_thread(generate_markdown_from_doc, doc=data)
     
     # Create artifact filename (repo name + timestamp)
-    repo_name = data.get("repository_name", "unnamed-repo")
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     artifact_key = f"documentation-{repo_name}-{timestamp}"
     
@@ -42,15 +118,11 @@ async def run_generate_docs_new(build_from_obj):
         description=f"Documentation for {repo_name}",
     )
     
-    # Also save to a file in the reports directory
-    reports_dir = Path("reports")
-    reports_dir.mkdir(exist_ok=True)
-    
-    filename = f"{repo_name.upper()}.md"
-    filepath = reports_dir / filename
+    if is_unchanged:
+        return str(filepath)
     
-    with open(filepath, "w") as f:
-        f.write(markdown_content)
+    # Also save to a file in the reports directory
+    await asyncio.to_thread(_write_report, filepath, digest_path, markdown_content, doc_digest)
     
     logger.info(f"Documentation saved to {filepath}")
     return str(filepath)
@@ -183,51 +255,65 @@ def generate_metadata_section():
 def generate_github_executive_summary(doc):
     """Generate a simplified executive summary using GitHub markdown."""
     repo_name = doc.get("repository_name", "Unknown Repository")
-    file_count = len(doc.get("files", []))
+    files = doc.get("files", [])
+    file_count = len(files)
     
-    # Get environment variables across all files
     all_env_vars = set()
-    for file in doc.get("files", []):
-        for env_var in file.get("env_vars", []):
-            if "name" in env_var:
-                all_env_vars.add(env_var["name"])
-    
-    # Get all database names
     all_dbs = set()
-    for file in doc.get("files", []):
-        for db in file.get("db", []):
-            if "db_name" in db:
-                all_dbs.add(db["db_name"])
-    
-    # Get all API hosts
     all_apis = set()
-    for file in doc.get("files", []):
-        for api in file.get("api", []):
-            if "host" in api:
-                all_apis.add(api["host"])
-    
-    # Get all file types by extension
     all_file_types = set()
-    for file in doc.get("files", []):
-        path = file.get("path", "")
-        if "." in path:
-            ext = path.split(".")[-1]
-            all_file_types.add(ext)
-    
-    # Get all tables mentioned in the codebase
     all_tables = set()
-    for file in doc.get("files", []):
-        for db in file.get("db", []):
-            for table in db.get("tables", []):
-                if "name" in table:
-                    all_tables.add(table["name"])
-    
-    # Get all security findings
     all_malicious_elements = []
     all_sensitive_info = []
     all_vulnerabilities = []
     
-    for file in doc.get("files", []):
+    # Index every file once; the sections below render from these lookups
+    env_var_files = defaultdict(list)   # env var name -> paths, one entry per mention
+    db_files = defaultdict(list)        # db name -> paths, one entry per mention
+    db_tables = defaultdict(set)        # db name -> table names
+    db_table_files = defaultdict(set)   # (db name, table name) -> paths
+    table_files = defaultdict(set)      # table name -> paths, across all databases
+    unnamed_db_tables = set()           # tables of databases without a usable name
+    api_files = defaultdict(list)       # host -> paths, one entry per mention
+    api_endpoints = defaultdict(set)    # host -> endpoint names
+    
+    for file in files:
+        file_path = file.get("path", "Unknown")
+        
+        # Get all file types by extension
+        path = file.get("path", "")
+        if "." in path:
+            all_file_types.add(path.split(".")[-1])
+        
+        for env_var in file.get("env_vars", []):
+            if "name" in env_var:
+                all_env_vars.add(env_var["name"])
+            env_var_files[env_var.get("name")].append(file_path)
+        
+        for db in file.get("db", []):
+            db_name = db.get("db_name")
+            if "db_name" in db:
+                all_dbs.add(db_name)
+            db_files[db_name].append(file_path)
+            for table in db.get("tables", []):
+                table_name = table.get("name")
+                if "name" in table:
+                    all_tables.add(table_name)
+                    db_tables[db_name].add(table_name)
+                    if not db_name or db_name == "Unknown":
+                        unnamed_db_tables.add(table_name)
+                db_table_files[(db_name, table_name)].add(file_path)
+                table_files[table_name].add(file_path)
+        
+        for api in file.get("api", []):
+            host = api.get("host")
+            if "host" in api:
+                all_apis.add(host)
+            api_files[host].append(file_path)
+            for endpoint in api.get("endpoints", []):
+                if "name" in endpoint:
+                    api_endpoints[host].add(endpoint["name"])
+        
         # Extract security data from their actual locations in the file data
         malicious = file.get("malicious_elements", [])
         sensitive = file.get("sensitive_info", [])
@@ -263,7 +349,7 @@ def generate_github_executive_summary(doc):
     
     total_security_findings = len(all_malicious_elements) + len(all_sensitive_info) + len(all_vulnerabilities)
     
-    markdown = f"""## Executive Summary
+    parts = [f"""## Executive Summary
 
 This documentation provides an automated analysis of **{repo_name}**, containing {file_count} analyzed files.
 
@@ -280,15 +366,11 @@ This documentation provides an automated analysis of **{repo_name}**, containing
 
 | Variable | Used In |
 |----------|---------|
-"""
+"""]
     
     # Add environment variables with file references
     for var in sorted(all_env_vars):
-        files_using_var = []
-        for file in doc.get("files", []):
-            for env_var in file.get("env_vars", []):
-                if env_var.get("name") == var:
-                    files_using_var.append(file.get("path", "Unknown"))
+        files_using_var = env_var_files[var]
         
         # Limit to first 3 files with "+X more" if needed
         if len(files_using_var) > 3:
@@ -296,16 +378,16 @@ This documentation provides an automated analysis of **{repo_name}**, containing
         else:
             file_list = ", ".join([f"`{f}`" for f in files_using_var])
             
-        markdown += f"| `{var}` | {file_list} |\n"
+        parts.append(f"| `{var}` | {file_list} |\n")
     
     if not all_env_vars:
-        markdown += "| *None found* | - |\n"
+        parts.append("| *None found* | - |\n")
     
-    markdown += """
+    parts.append("""
 <details>
 <summary><strong>Database Information</strong></summary>
 
-"""
+""")
     
     # Add database information
     has_db_info = False
@@ -313,22 +395,11 @@ This documentation provides an automated analysis of **{repo_name}**, containing
     # First handle known databases
     for db_name in sorted(all_dbs):
         has_db_info = True
-        db_tables = []
-        files_using_db = []
-        
-        for file in doc.get("files", []):
-            for db in file.get("db", []):
-                if db.get("db_name") == db_name:
-                    files_using_db.append(file.get("path", "Unknown"))
-                    for table in db.get("tables", []):
-                        if "name" in table:
-                            db_tables.append(table["name"])
-        
-        # Remove duplicates and sort
-        db_tables = sorted(set(db_tables))
+        files_using_db = db_files[db_name]
+        tables_of_db = sorted(db_tables[db_name])
         
         # Create a header for this database
-        markdown += f"**Database: `{db_name}`**\n\n"
+        parts.append(f"**Database: `{db_name}`**\n\n")
         
         # Limit file list for the database
         if len(files_using_db) > 3:
@@ -336,69 +407,38 @@ This documentation provides an automated analysis of **{repo_name}**, containing
         else:
             file_list = ", ".join([f"`{f}`" for f in files_using_db])
             
-        markdown += f"**Used in**: {file_list}\n\n"
+        parts.append(f"**Used in**: {file_list}\n\n")
         
         # List tables if any
-        if db_tables:
-            markdown += "**Tables**:\n\n"
-            for table in db_tables:
-                # Find files using this table
-                table_files = []
-                for file in doc.get("files", []):
-                    for db in file.get("db", []):
-                        if db.get("db_name") == db_name:
-                            for tbl in db.get("tables", []):
-                                if tbl.get("name") == table:
-                                    table_files.append(file.get("path", "Unknown"))
-                
-                # Remove duplicates
-                table_files = sorted(set(table_files))
+        if tables_of_db:
+            parts.append("**Tables**:\n\n")
+            for table in tables_of_db:
+                # Files using this table in this database
+                files_using_table = sorted(db_table_files[(db_name, table)])
                 
                 # Format file list
-                if len(table_files) > 3:
-                    file_list = f"`{table_files[0]}`, `{table_files[1]}`, `{table_files[2]}` +{len(table_files)-3} more"
+                if len(files_using_table) > 3:
+                    file_list = f"`{files_using_table[0]}`, `{files_using_table[1]}`, `{files_using_table[2]}` +{len(files_using_table)-3} more"
                 else:
-                    file_list = ", ".join([f"`{f}`" for f in table_files])
+                    file_list = ", ".join([f"`{f}`" for f in files_using_table])
                 
-                markdown += f"- `{table}` - Used in: {file_list}\n"
+                parts.append(f"- `{table}` - Used in: {file_list}\n")
         else:
-            markdown += "**Tables**: *No tables specified*\n"
+            parts.append("**Tables**: *No tables specified*\n")
         
-        markdown += "\n---\n\n"
-    
-    # Handle tables without a specific database
-    orphan_tables = set()
-    for file in doc.get("files", []):
-        for db in file.get("db", []):
-            if not db.get("db_name") or db.get("db_name") == "Unknown":
-                for table in db.get("tables", []):
-                    if "name" in table:
-                        orphan_tables.add(table["name"])
+        parts.append("\n---\n\n")
     
-    # Remove tables that are already associated with known databases
+    # Handle tables without a specific database, except those already associated with known databases
+    orphan_tables = set(unnamed_db_tables)
     for db_name in all_dbs:
-        for file in doc.get("files", []):
-            for db in file.get("db", []):
-                if db.get("db_name") == db_name:
-                    for table in db.get("tables", []):
-                        if "name" in table and table["name"] in orphan_tables:
-                            orphan_tables.remove(table["name"])
+        orphan_tables -= db_tables[db_name]
     
     if orphan_tables:
         has_db_info = True
-        markdown += "**Database: `Unknown`**\n\n"
+        parts.append("**Database: `Unknown`**\n\n")
         
         # Find files using these orphan tables
-        all_orphan_files = []
-        for table_name in orphan_tables:
-            for file in doc.get("files", []):
-                for db in file.get("db", []):
-                    for table in db.get("tables", []):
-                        if table.get("name") == table_name:
-                            all_orphan_files.append(file.get("path", "Unknown"))
-        
-        # Remove duplicates
-        all_orphan_files = sorted(set(all_orphan_files))
+        all_orphan_files = sorted(set().union(*(table_files[table_name] for table_name in orphan_tables)))
         
         # Format file list
         if len(all_orphan_files) > 3:
@@ -406,60 +446,41 @@ This documentation provides an automated analysis of **{repo_name}**, containing
         else:
             file_list = ", ".join([f"`{f}`" for f in all_orphan_files])
             
-        markdown += f"**Used in**: {file_list}\n\n"
+        parts.append(f"**Used in**: {file_list}\n\n")
         
-        markdown += "**Tables**:\n\n"
+        parts.append("**Tables**:\n\n")
         for table_name in sorted(orphan_tables):
-            # Find files using this table
-            table_files = []
-            for file in doc.get("files", []):
-                for db in file.get("db", []):
-                    for table in db.get("tables", []):
-                        if table.get("name") == table_name:
-                            table_files.append(file.get("path", "Unknown"))
-            
-            # Remove duplicates
-            table_files = sorted(set(table_files))
+            # Files using this table in any database
+            files_using_table = sorted(table_files[table_name])
             
             # Format file list
-            if len(table_files) > 3:
-                file_list = f"`{table_files[0]}`, `{table_files[1]}`, `{table_files[2]}` +{len(table_files)-3} more"
+            if len(files_using_table) > 3:
+                file_list = f"`{files_using_table[0]}`, `{files_using_table[1]}`, `{files_using_table[2]}` +{len(files_using_table)-3} more"
             else:
-                file_list = ", ".join([f"`{f}`" for f in table_files])
+                file_list = ", ".join([f"`{f}`" for f in files_using_table])
             
-            markdown += f"- `{table_name}` - Used in: {file_list}\n"
+            parts.append(f"- `{table_name}` - Used in: {file_list}\n")
     
     if not has_db_info:
-        markdown += "**No database information found**\n"
+        parts.append("**No database information found**\n")
     
-    markdown += """
+    parts.append("""
 </details>
 
 <details>
 <summary><strong>API Information</strong></summary>
 
-"""
+""")
     
     # Add API information
     has_api_info = False
     for host in sorted(all_apis):
         has_api_info = True
-        api_endpoints = []
-        files_using_api = []
-        
-        for file in doc.get("files", []):
-            for api in file.get("api", []):
-                if api.get("host") == host:
-                    files_using_api.append(file.get("path", "Unknown"))
-                    for endpoint in api.get("endpoints", []):
-                        if "name" in endpoint:
-                            api_endpoints.append(endpoint["name"])
-        
-        # Remove duplicates and sort
-        api_endpoints = sorted(set(api_endpoints))
+        files_using_api = api_files[host]
+        endpoints_of_api = sorted(api_endpoints[host])
         
         # Create header for this API
-        markdown += f"**Host: `{host}`**\n\n"
+        parts.append(f"**Host: `{host}`**\n\n")
         
         # Limit file list
         if len(files_using_api) > 3:
@@ -467,28 +488,28 @@ This documentation provides an automated analysis of **{repo_name}**, containing
         else:
             file_list = ", ".join([f"`{f}`" for f in files_using_api])
             
-        markdown += f"**Used in**: {file_list}\n\n"
+        parts.append(f"**Used in**: {file_list}\n\n")
         
         # List endpoints if any
-        if api_endpoints:
-            markdown += "**Endpoints**:\n\n"
-            for endpoint in api_endpoints:
-                markdown += f"- `{endpoint}`\n"
+        if endpoints_of_api:
+            parts.append("**Endpoints**:\n\n")
+            for endpoint in endpoints_of_api:
+                parts.append(f"- `{endpoint}`\n")
         else:
-            markdown += "**Endpoints**: *No endpoints specified*\n"
+            parts.append("**Endpoints**: *No endpoints specified*\n")
         
-        markdown += "\n---\n\n"
+        parts.append("\n---\n\n")
     
     if not has_api_info:
-        markdown += "**No API information found**\n"
+        parts.append("**No API information found**\n")
     
-    markdown += """
+    parts.append("""
 </details>
 
 <details>
 <summary><strong>Security Findings</strong></summary>
 
-"""
+""")
 
     # Add security findings
     if total_security_findings > 0:
@@ -520,9 +541,9 @@ This documentation provides an automated analysis of **{repo_name}**, containing
         severities = ["Critical", "High", "Medium", "Low", "Info", "Unknown"]
         
         # First show a summary
-        markdown += "### Security Summary\n\n"
-        markdown += "| Severity | Vulnerabilities | Sensitive Info | Malicious Code | Total |\n"
-        markdown += "|----------|----------------|---------------|---------------|-------|\n"
+        parts.append("### Security Summary\n\n")
+        parts.append("| Severity | Vulnerabilities | Sensitive Info | Malicious Code | Total |\n")
+        parts.append("|----------|----------------|---------------|---------------|-------|\n")
         
         for severity in severities:
             vuln_count = len(vuln_by_severity.get(severity, []))
@@ -531,10 +552,10 @@ This documentation provides an automated analysis of **{repo_name}**, containing
             total = vuln_count + sensitive_count + malicious_count
             
             if total > 0:
-                markdown += f"| **{severity}** | {vuln_count} | {sensitive_count} | {malicious_count} | {total} |\n"
+                parts.append(f"| **{severity}** | {vuln_count} | {sensitive_count} | {malicious_count} | {total} |\n")
                 
         # Show top findings across all types
-        markdown += "\n### Top Security Findings\n\n"
+        parts.append("\n### Top Security Findings\n\n")
         
         # Function to get the display severity
         def get_severity_emoji(severity):
@@ -577,20 +598,20 @@ This documentation provides an automated analysis of **{repo_name}**, containing
             location = finding.get('location', 'Unknown location')
             
             emoji = get_severity_emoji(severity)
-            markdown += f"{emoji} **{severity} {finding_type}**: {desc} - *Location: {location}*\n\n"
+            parts.append(f"{emoji} **{severity} {finding_type}**: {desc} - *Location: {location}*\n\n")
             
         # If there are more than 10 findings, indicate there are more
         if len(sorted_findings) > 10:
-            markdown += f"... and {len(sorted_findings) - 10} more findings\n"
+            parts.append(f"... and {len(sorted_findings) - 10} more findings\n")
     else:
-        markdown += "No security findings detected in the codebase.\n"
+        parts.append("No security findings detected in the codebase.\n")
     
-    markdown += """
+    parts.append("""
 </details>
 ---
-"""
+""")
     
-    return markdown
+    return "".join(parts)
 
 def generate_github_overview_section(doc):
     """Generate a simple overview section using GitHub markdown."""
@@ -618,7 +639,7 @@ def generate_github_overview_section(doc):
     total_tokens = summary.get("total_tokens", "N/A")
     security_status = summary.get("security", "N/A")
     
-    markdown = f"""## Repository Information
+    parts = [f"""## Repository Information
 
 - **Repository URL**: [{repo_url}]({repo_url})
 - **Repository Name**: {repo_name}
@@ -635,7 +656,7 @@ def generate_github_overview_section(doc):
 
 | Rank | File Path | Characters | Tokens |
 |:----:|-----------|------------:|--------:|
-"""
+"""]
     
     # Add top files from tool_output
     top_files = tool_output.get("top_files", [])
@@ -646,13 +667,13 @@ def generate_github_overview_section(doc):
             chars = file.get("chars", "N/A")
             tokens = file.get("tokens", "N/A")
             
-            markdown += f"| {rank} | `{path}` | {chars:,} | {tokens:,} |\n"
+            parts.append(f"| {rank} | `{path}` | {chars:,} | {tokens:,} |\n")
     else:
-        markdown += "| - | *No files data available* | - | - |\n"
+        parts.append("| - | *No files data available* | - | - |\n")
     
-    markdown += "\n---\n"
+    parts.append("\n---\n")
     
-    return markdown
+    return "".join(parts)
 
 def generate_github_files_section(doc):
     """Generate file details section using GitHub markdown."""
@@ -662,8 +683,8 @@ def generate_github_files_section(doc):
         return "## File Details\n\nNo file details available."
     
     # Create navigation first
-    markdown = "## File Details\n\n"
-    markdown += "<details open>\n<summary><strong>File Navigation</strong></summary>\n\n"
+    parts = ["## File Details\n\n"]
+    parts.append("<details open>\n<summary><strong>File Navigation</strong></summary>\n\n")
     
     # Group files by type for navigation
     file_groups = {}
@@ -679,17 +700,17 @@ def generate_github_files_section(doc):
     # Create navigation with file type grouping
     for ext, file_group in sorted(file_groups.items()):
         icon = get_file_icon_for_group(ext)
-        markdown += f"**{icon} {ext.upper() if ext != 'other' else 'Other'} Files**\n\n"
+        parts.append(f"**{icon} {ext.upper() if ext != 'other' else 'Other'} Files**\n\n")
         
         for idx, file in file_group:
             path = file.get("path", "Unknown")
             # Create anchor links with sanitized IDs
             file_id = f"file-{idx+1}"
-            markdown += f"- [{path}](#{file_id})\n"
+            parts.append(f"- [{path}](#{file_id})\n")
         
-        markdown += "\n"
+        parts.append("\n")
     
-    markdown += "</details>\n\n"
+    parts.append("</details>\n\n")
     
     # Now add individual file details
     for idx, file in enumerate(files):
@@ -698,7 +719,7 @@ def generate_github_files_section(doc):
         
         # File heading with icon based on file type
         file_icon = get_file_icon(path)
-        markdown += f"### {file_icon} {path} <a id='{file_id}'></a>\n\n"
+        parts.append(f"### {file_icon} {path} <a id='{file_id}'></a>\n\n")
         
         # Skip content as requested but keep all other fields
         file_data = {k: v for k, v in file.items() if k != "content"}
@@ -706,85 +727,85 @@ def generate_github_files_section(doc):
         # Handle environment variables
         env_vars = file.get("env_vars", [])
         
-        markdown += "<details open>\n<summary><strong>Environment Variables</strong></summary>\n\n"
+        parts.append("<details open>\n<summary><strong>Environment Variables</strong></summary>\n\n")
         
         if env_vars:
-            markdown += "| Name | Description | Context |\n"
-            markdown += "|------|-------------|--------|\n"
+            parts.append("| Name | Description | Context |\n")
+            parts.append("|------|-------------|--------|\n")
             
             for env_var in env_vars:
                 name = env_var.get("name", "Unknown")
                 description = env_var.get("description", "")
                 context = env_var.get("context", "")
-                markdown += f"| `{name}` | {description} | {context} |\n"
+                parts.append(f"| `{name}` | {description} | {context} |\n")
         else:
-            markdown += "**Environment Variables**: None\n"
+            parts.append("**Environment Variables**: None\n")
         
-        markdown += "\n</details>\n\n"
+        parts.append("\n</details>\n\n")
         
         # Handle database information
         db_info = file.get("db", [])
         
-        markdown += "<details open>\n<summary><strong>Database Information</strong></summary>\n\n"
+        parts.append("<details open>\n<summary><strong>Database Information</strong></summary>\n\n")
         
         if db_info:
             for db in db_info:
                 db_name = db.get("db_name", "Unknown")
                 db_context = db.get("context", "")
                 
-                markdown += f"**Database**: {db_name}\n\n"
-                markdown += f"**Context**: {db_context}\n\n"
+                parts.append(f"**Database**: {db_name}\n\n")
+                parts.append(f"**Context**: {db_context}\n\n")
                 
                 tables = db.get("tables", [])
                 if tables:
-                    markdown += "| Table | Description | Context |\n"
-                    markdown += "|-------|-------------|--------|\n"
+                    parts.append("| Table | Description | Context |\n")
+                    parts.append("|-------|-------------|--------|\n")
                     
                     for table in tables:
                         table_name = table.get("name", "Unknown")
                         table_desc = table.get("description", "")
                         table_context = table.get("context", "")
-                        markdown += f"| `{table_name}` | {table_desc} | {table_context} |\n"
+                        parts.append(f"| `{table_name}` | {table_desc} | {table_context} |\n")
                 else:
-                    markdown += "No tables specified.\n"
+                    parts.append("No tables specified.\n")
                 
-                markdown += "\n"
+                parts.append("\n")
         else:
-            markdown += "**Database Information**: None\n"
+            parts.append("**Database Information**: None\n")
         
-        markdown += "</details>\n\n"
+        parts.append("</details>\n\n")
         
         # Handle API information
         api_info = file.get("api", [])
         
-        markdown += "<details open>\n<summary><strong>API Information</strong></summary>\n\n"
+        parts.append("<details open>\n<summary><strong>API Information</strong></summary>\n\n")
         
         if api_info:
             for api in api_info:
                 host = api.get("host", "Unknown")
                 api_context = api.get("context", "")
                 
-                markdown += f"**Host**: {host}\n\n"
-                markdown += f"**Context**: {api_context}\n\n"
+                parts.append(f"**Host**: {host}\n\n")
+                parts.append(f"**Context**: {api_context}\n\n")
                 
                 endpoints = api.get("endpoints", [])
                 if endpoints:
-                    markdown += "| Endpoint | Description | Context |\n"
-                    markdown += "|----------|-------------|--------|\n"
+                    parts.append("| Endpoint | Description | Context |\n")
+                    parts.append("|----------|-------------|--------|\n")
                     
                     for endpoint in endpoints:
                         endpoint_name = endpoint.get("name", "Unknown")
                         endpoint_desc = endpoint.get("description", "")
                         endpoint_context = endpoint.get("context", "")
-                        markdown += f"| `{endpoint_name}` | {endpoint_desc} | {endpoint_context} |\n"
+                        parts.append(f"| `{endpoint_name}` | {endpoint_desc} | {endpoint_context} |\n")
                 else:
-                    markdown += "No endpoints specified.\n"
+                    parts.append("No endpoints specified.\n")
                 
-                markdown += "\n"
+                parts.append("\n")
         else:
-            markdown += "**API Information**: None\n"
+            parts.append("**API Information**: None\n")
         
-        markdown += "</details>\n\n"
+        parts.append("</details>\n\n")
         
         # Handle security information - NEW SECTION
         # Extract security findings directly from the file data
@@ -819,7 +840,7 @@ def generate_github_files_section(doc):
         # Use the reclassified list
         malicious_elements = reclassified_malicious
         
-        markdown += "<details open>\n<summary><strong>Security Findings</strong></summary>\n\n"
+        parts.append("<details open>\n<summary><strong>Security Findings</strong></summary>\n\n")
         
         # Function to get the display severity
         def get_severity_emoji(severity):
@@ -852,13 +873,13 @@ def generate_github_files_section(doc):
                 else:
                     risk_color = "🟢"
                     
-                markdown += f"**Risk Score**: {risk_color} {risk_score}/100 - {score_justification}\n\n"
+                parts.append(f"**Risk Score**: {risk_color} {risk_score}/100 - {score_justification}\n\n")
             
             # Handle vulnerabilities
             if vulnerabilities:
-                markdown += "#### Vulnerabilities\n\n"
-                markdown += "| Severity | Type | Description | Location | False Positive? |\n"
-                markdown += "|----------|------|-------------|----------|----------------|\n"
+                parts.append("#### Vulnerabilities\n\n")
+                parts.append("| Severity | Type | Description | Location | False Positive? |\n")
+                parts.append("|----------|------|-------------|----------|----------------|\n")
                 
                 for vuln in vulnerabilities:
                     severity = vuln.get("severity", "Unknown")
@@ -868,15 +889,15 @@ def generate_github_files_section(doc):
                     fp_likelihood = vuln.get("false_positive_likelihood", "Unknown")
                     
                     emoji = get_severity_emoji(severity)
-                    markdown += f"| {emoji} {severity} | {vuln_type} | {description} | {location} | {fp_likelihood} |\n"
+                    parts.append(f"| {emoji} {severity} | {vuln_type} | {description} | {location} | {fp_likelihood} |\n")
                 
-                markdown += "\n"
+                parts.append("\n")
             
             # Handle sensitive info
             if sensitive_info:
-                markdown += "#### Sensitive Information Exposure\n\n"
-                markdown += "| Severity | Type | Description | Location | False Positive? |\n"
-                markdown += "|----------|------|-------------|----------|----------------|\n"
+                parts.append("#### Sensitive Information Exposure\n\n")
+                parts.append("| Severity | Type | Description | Location | False Positive? |\n")
+                parts.append("|----------|------|-------------|----------|----------------|\n")
                 
                 for info in sensitive_info:
                     severity = info.get("severity", "Unknown")
@@ -886,15 +907,15 @@ def generate_github_files_section(doc):
                     fp_likelihood = info.get("false_positive_likelihood", "Unknown")
                     
                     emoji = get_severity_emoji(severity)
-                    markdown += f"| {emoji} {severity} | {info_type} | {description} | {location} | {fp_likelihood} |\n"
+                    parts.append(f"| {emoji} {severity} | {info_type} | {description} | {location} | {fp_likelihood} |\n")
                 
-                markdown += "\n"
+                parts.append("\n")
             
             # Handle malicious code elements
             if malicious_elements:
-                markdown += "#### Malicious Code Elements\n\n"
-                markdown += "| Severity | Type | Description | Location | False Positive? |\n"
-                markdown += "|----------|------|-------------|----------|----------------|\n"
+                parts.append("#### Malicious Code Elements\n\n")
+                parts.append("| Severity | Type | Description | Location | False Positive? |\n")
+                parts.append("|----------|------|-------------|----------|----------------|\n")
                 
                 for element in malicious_elements:
                     severity = element.get("severity", "Unknown")
@@ -904,15 +925,15 @@ def generate_github_files_section(doc):
                     fp_likelihood = element.get("false_positive_likelihood", "Unknown")
                     
                     emoji = get_severity_emoji(severity)
-                    markdown += f"| {emoji} {severity} | {element_type} | {description} | {location} | {fp_likelihood} |\n"
+                    parts.append(f"| {emoji} {severity} | {element_type} | {description} | {location} | {fp_likelihood} |\n")
                 
-                markdown += "\n"
+                parts.append("\n")
             
             # Handle recommendations
             if recommendations:
-                markdown += "#### Security Recommendations\n\n"
-                markdown += "| Priority | Issue Reference | Recommendation |\n"
-                markdown += "|----------|----------------|----------------|\n"
+                parts.append("#### Security Recommendations\n\n")
+                parts.append("| Priority | Issue Reference | Recommendation |\n")
+                parts.append("|----------|----------------|----------------|\n")
                 
                 for rec in recommendations:
                     priority = rec.get("priority", "Unknown")
@@ -929,18 +950,18 @@ def generate_github_files_section(doc):
                     else:
                         priority_emoji = "⚪"
                     
-                    markdown += f"| {priority_emoji} {priority} | {issue_ref} | {recommendation} |\n"
+                    parts.append(f"| {priority_emoji} {priority} | {issue_ref} | {recommendation} |\n")
                 
-                markdown += "\n"
+                parts.append("\n")
         else:
-            markdown += "No security issues detected in this file.\n"
+            parts.append("No security issues detected in this file.\n")
         
-        markdown += "</details>\n\n"
+        parts.append("</details>\n\n")
         
         # Handle any other key-value pairs dynamically
         other_keys = [k for k in file_data.keys() if k not in ["path", "env_vars", "db", "api", "malicious_elements", "sensitive_info", "vulnerabilities", "recommendations", "overall_risk_score", "score_justification"]]
         
-        markdown += "<details open>\n<summary><strong>Additional Information</strong></summary>\n\n"
+        parts.append("<details open>\n<summary><strong>Additional Information</strong></summary>\n\n")
         
         if other_keys:
             for key in other_keys:
@@ -952,112 +973,117 @@ def generate_github_files_section(doc):
                 # Handle different types of values
                 if isinstance(value, list):
                     if value:
-                        markdown += f"**{display_key}**:\n\n"
+                        parts.append(f"**{display_key}**:\n\n")
                         for item in value:
                             if isinstance(item, dict):
                                 for item_key, item_value in item.items():
                                     item_display_key = item_key.replace("_", " ").title()
-                                    markdown += f"- {item_display_key}: {item_value}\n"
+                                    parts.append(f"- {item_display_key}: {item_value}\n")
                             else:
-                                markdown += f"- {item}\n"
+                                parts.append(f"- {item}\n")
                     else:
-                        markdown += f"**{display_key}**: None\n"
+                        parts.append(f"**{display_key}**: None\n")
                 elif isinstance(value, dict):
                     if value:
-                        markdown += f"**{display_key}**:\n\n"
+                        parts.append(f"**{display_key}**:\n\n")
                         for sub_key, sub_value in value.items():
                             sub_display_key = sub_key.replace("_", " ").title()
-                            markdown += f"- {sub_display_key}: {sub_value}\n"
+                            parts.append(f"- {sub_display_key}: {sub_value}\n")
                     else:
-                        markdown += f"**{display_key}**: Empty\n"
+                        parts.append(f"**{display_key}**: Empty\n")
                 else:
-                    markdown += f"**{display_key}**: {value or 'None'}\n"
+                    parts.append(f"**{display_key}**: {value or 'None'}\n")
                 
-                markdown += "\n"
+                parts.append("\n")
         else:
-            markdown += "**Additional Information**: None\n"
+            parts.append("**Additional Information**: None\n")
         
-        markdown += "</details>\n\n"
+        parts.append("</details>\n\n")
         
         # Add back to top link using GitHub compatible anchor
-        markdown += "[↑ Back to top](#repository-documentation)\n\n"
+        parts.append("[↑ Back to top](#repository-documentation)\n\n")
         
         # Add separator between files
         if idx < len(files) - 1:
-            markdown += "---\n\n"
+            parts.append("---\n\n")
     
-    return markdown
+    return "".join(parts)
+
+# Icons by lowercase file extension (or special file name)
+FILE_ICONS = {
+    'py': '🐍',  # Python
+    'js': '📜',  # JavaScript
+    'ts': '📜',  # TypeScript
+    'html': '🌐',  # HTML
+    'css': '🎨',  # CSS
+    'md': '📝',  # Markdown
+    'json': '📊',  # JSON
+    'yml': '⚙️',  # YAML
+    'yaml': '⚙️',  # YAML
+    'sql': '💾',  # SQL
+    'sh': '🔧',  # Shell
+    'dockerfile': '🐳',  # Dockerfile
+    'txt': '📄',  # Text
+    'makefile': '🛠️',  # Makefile
+    'jenkinsfile': '🔄',  # Jenkinsfile
+}
+
+# Icons for file group headings by lowercase extension
+FILE_GROUP_ICONS = {
+    'py': '🐍',      # Python
+    'js': '📜',      # JavaScript
+    'ts': '📜',      # TypeScript
+    'html': '🌐',    # HTML
+    'css': '🎨',     # CSS
+    'md': '📝',      # Markdown
+    'json': '📊',    # JSON
+    'yml': '⚙️',     # YAML/Config
+    'yaml': '⚙️',    # YAML/Config
+    'sql': '💾',     # Database
+    'sh': '🔧',      # Scripts
+    'dockerfile': '🐳', # Docker
+    'txt': '📄',     # Text
+    'other': '📁',   # Other
+}
+
+# File names matched as a whole rather than by extension
+SPECIAL_FILE_NAMES = frozenset({'dockerfile', 'jenkinsfile', 'makefile'})
 
 def get_file_icon(filename):
     """Return an appropriate emoji icon based on file extension."""
-    ext = filename.split('.')[-1].lower() if '.' in filename else ''
-    
-    icons = {
-        'py': '🐍',  # Python
-        'js': '📜',  # JavaScript
-        'ts': '📜',  # TypeScript
-        'html': '🌐',  # HTML
-        'css': '🎨',  # CSS
-        'md': '📝',  # Markdown
-        'json': '📊',  # JSON
-        'yml': '⚙️',  # YAML
-        'yaml': '⚙️',  # YAML
-        'sql': '💾',  # SQL
-        'sh': '🔧',  # Shell
-        'dockerfile': '🐳',  # Dockerfile
-        'txt': '📄',  # Text
-        'makefile': '🛠️',  # Makefile
-        'jenkinsfile': '🔄',  # Jenkinsfile
-    }
+    lowered = filename.lower()
     
     # Special case for Dockerfile, Jenkinsfile, etc.
-    for special in ['dockerfile', 'jenkinsfile', 'makefile']:
-        if filename.lower() == special:
-            return icons.get(special, '📄')
+    if lowered in SPECIAL_FILE_NAMES:
+        return FILE_ICONS[lowered]
     
-    return icons.get(ext, '📄')  # Default to generic file icon
+    ext = lowered.rsplit('.', 1)[-1] if '.' in lowered else ''
+    return FILE_ICONS.get(ext, '📄')  # Default to generic file icon
 
 def get_file_icon_for_group(ext):
     """Return appropriate icon for file group heading."""
-    group_icons = {
-        'py': '🐍',      # Python
-        'js': '📜',      # JavaScript
-        'ts': '📜',      # TypeScript
-        'html': '🌐',    # HTML
-        'css': '🎨',     # CSS
-        'md': '📝',      # Markdown
-        'json': '📊',    # JSON
-        'yml': '⚙️',     # YAML/Config
-        'yaml': '⚙️',    # YAML/Config
-        'sql': '💾',     # Database
-        'sh': '🔧',      # Scripts
-        'dockerfile': '🐳', # Docker
-        'txt': '📄',     # Text
-        'other': '📁',   # Other
-    }
-    
-    return group_icons.get(ext.lower(), '📁')
+    return FILE_GROUP_ICONS.get(ext.lower(), '📁')
 
 def generate_github_directory_structure(doc):
     """Generate the directory structure section using GitHub markdown."""
     dir_structure = doc.get("directory_structure", "No directory structure available")
     
-    markdown = """## Directory Structure
+    parts = ["""## Directory Structure
 
 <details>
 <summary><strong>Repository Layout</strong></summary>
 
 ```
-"""
-    markdown += dir_structure
-    markdown += """
+"""]
+    parts.append(dir_structure)
+    parts.append("""
 ```
 
 </details>
 
 ---
-"""
+""")
     
-    return markdown
+    return "".join(parts)
 
 __all__ = ["run_generate_docs_new"]
\ No newline at end of file
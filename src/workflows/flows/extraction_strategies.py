@@ -1,4 +1,5 @@
-from typing import Union, Type
+import re
+from typing import Callable, Optional, Union, Type
 from prefect import flow
 from prefect.states import Completed,Failed
 from workflows.agents.prompts import CODE_ANALYZER_BASE_INSTR, SECURITY_ANALYZER_BASE_INSTR
@@ -16,6 +17,30 @@ from core.models import RepoAnalysisResult
 
 logger = LoggerFactory.get_logger(name=app_config.APP_TITLE,log_level=app_config.log_level, trace_enabled=True)
 
+# Cheap signals that a file reads env vars, connects to a database or calls/serves an API;
+# files without any of them get an empty base extraction result instead of an LLM call.
+# Deliberately broad: a false positive costs one LLM call, a false negative loses data
+_SIGNAL_RE = re.compile(
+    r'(?i:environ|getenv|process\.env|dotenv|DATABASE_URL|\b[a-z][a-z0-9+.-]*://'
+    r'|connect\(|create_engine|requests\.|httpx\.|urllib|axios\.|fetch\(|express\(\)'
+    r'|@\w+\.(route|get|post|put|patch|delete)\()'
+    # Case-sensitive: Ruby ENV["KEY"] and dotenv-style KEY=VALUE lines
+    r'|\bENV\[|^\s*(export\s+)?[A-Z][A-Z0-9_]*=',
+    re.MULTILINE,
+)
+
+def has_base_signals(content: str) -> bool:
+    """
+    Check whether file content contains any env/DB/API signal worth an LLM call.
+    
+    Args:
+        content: File content to check
+        
+    Returns:
+        True if the file should be analyzed, False if it can be skipped
+    """
+    return _SIGNAL_RE.search(content) is not None
+
 
 @flow(
     log_prints=True, 
@@ -42,7 +67,8 @@ async def add_basev2(repomix_result:RepoAnalysisResult) -> Union[Completed,Faile
         repomix_result,
         agent_name='env-vars-extractor',
         instr=CODE_ANALYZER_BASE_INSTR,
-        expected_result_type=BaseAgentAnalysisResult)
+        expected_result_type=BaseAgentAnalysisResult,
+        content_filter=has_base_signals if app_config.PREFILTER_ENABLED else None)
 
 @flow(
     log_prints=True, 
@@ -60,7 +86,8 @@ async def _run_agents(
     repomix_result: RepoAnalysisResult, 
     agent_name:str, 
     instr: str, 
-    expected_result_type: Type[AgentAnalysisResult]):
+    expected_result_type: Type[AgentAnalysisResult],
+    content_filter: Optional[Callable[[str], bool]] = None):
     
     if not repomix_result:
         return {}
@@ -73,7 +100,8 @@ async def _run_agents(
     return await run_concurrent_agents(
         ctx=task_ctx,
         agent_name=agent_name,
-        instructions=instr
+        instructions=instr,
+        content_filter=content_filter
     )
 
 def clean_result_artifacts(strategy_result_item):
@@ -113,21 +141,29 @@ def merge_strategy_results(org_files, results_to_be_merged):
         org_files: List of original files to update
         results_to_be_merged: List of strategy results to merge
     """
+    # Index every strategy by file path first, so files are walked only once
+    file_mappings = []
     for strategy_result in results_to_be_merged:
         if isinstance(strategy_result, AgentBatchResult):
-            file_mapping = strategy_result.get_file_map()
-            
-            for idx, file in enumerate(org_files):
-                lookup_f_path = getattr(file, 'path', 'default')
-                s_item_results = file_mapping.get(lookup_f_path, {})
-                
-                if s_item_results:
-                    # Create a clean copy without artifacts
-                    s_item_results = clean_result_artifacts(s_item_results)
-                    # Merge file and cleaned results
-                    org_files[idx] = file.model_copy(update=s_item_results)
+            file_mappings.append(strategy_result.get_file_map())
         else:
             logger.warning(f"Warning: Strategy result of type {type(strategy_result)} can't be merged")
+    
+    if not file_mappings:
+        return
+    
+    for idx, file in enumerate(org_files):
+        lookup_f_path = getattr(file, 'path', 'default')
+        file_update = {}
+        for file_mapping in file_mappings:
+            s_item_results = file_mapping.get(lookup_f_path)
+            if s_item_results:
+                # Create a clean copy without artifacts; later strategies win on key clashes
+                file_update.update(clean_result_artifacts(s_item_results))
+        
+        if file_update:
+            # Merge file and cleaned results of all strategies in a single copy
+            org_files[idx] = file.model_copy(update=file_update)
 
 
-__all__ = ["add_base", "security_review","clean_result_artifacts", "merge_strategy_results"]
\ No newline at end of file
+__all__ = ["add_base", "security_review","clean_result_artifacts", "merge_strategy_results", "has_base_signals"]
\ No newline at end of file
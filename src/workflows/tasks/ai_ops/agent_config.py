@@ -5,10 +5,12 @@ This module contains configuration for different AI agents,
 including model selection, system prompts, and network settings.
 """
 
+import asyncio
 import httpx
+import importlib.util
 import os
 import time
-from typing import Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any
 
 from openai import AsyncOpenAI
 from pydantic_ai import Agent
@@ -57,6 +59,148 @@ APP_URL =os.environ.get("APP_URL", "https://workflow-automations.local")
 
 from core.config import app_config
 
+# Client shared by every agent, with the event loop it was created on and the task closing it
+_shared_httpx_client: Optional[Tuple[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient, Optional[asyncio.Task]]] = None
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient) -> None:
+    """
+    Close an HTTP client once its event loop shuts down.
+    
+    Runs as a background task that waits forever; asyncio.run cancels pending tasks
+    before closing the loop, so the client's connection pool is released while the
+    loop it is bound to can still close its sockets.
+    
+    Args:
+        client: Client created on the running event loop
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+def get_shared_httpx_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by all LLM agents.
+    
+    Reusing one client keeps connections to the provider alive across files, strategies
+    and repositories instead of paying connection setup for every new agent. HTTP/2 is
+    used when the optional `h2` package is installed. httpx connection pools are bound
+    to an event loop, so a new client is created when called from a different loop,
+    and each client is closed when the loop it was created on shuts down.
+    
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _shared_httpx_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    if _shared_httpx_client is not None:
+        client_loop, client, closer = _shared_httpx_client
+        if client_loop is loop and not client.is_closed:
+            return client
+        if client_loop is loop and closer is not None:
+            # Closed by a caller on this loop; its shutdown hook has nothing left to do
+            closer.cancel()
+    
+    client = httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=app_config.HTTPX_MAX_CONNECTIONS,
+            max_keepalive_connections=app_config.HTTPX_MAX_CONNECTIONS
+        ),
+        timeout=httpx.Timeout(timeout=30, connect=5),
+        headers={
+            "HTTP-Referer": APP_URL,
+            'X-Title': APP_TITLE,
+            'User-Agent': f'pydantic-ai/{APP_TITLE}',
+        }
+    )
+    closer = loop.create_task(_close_on_loop_shutdown(client)) if loop is not None else None
+    _shared_httpx_client = (loop, client, closer)
+    return client
+
+# Agents and clients built on top of the shared HTTP client, keyed by (factory, agent_name)
+_agent_cache: Dict[Tuple[str, str], Tuple[httpx.AsyncClient, Any, Dict[str, Any]]] = {}
+
+def _get_cached_agent(factory: str, agent_name: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """
+    Look up an agent previously built on the current shared HTTP client.
+    
+    Entries built on a client that has since been replaced (new event loop or
+    closed client) are ignored so callers rebuild them.
+    
+    Args:
+        factory: Name of the factory that built the agent
+        agent_name: Name of the agent from agent_mapping
+        
+    Returns:
+        Tuple of (agent, config), or None when no valid entry exists
+    """
+    cached = _agent_cache.get((factory, agent_name))
+    if cached is None or cached[0] is not get_shared_httpx_client():
+        return None
+    return cached[1], cached[2]
+
+def get_prompt_cache_key(agent_name: str) -> str:
+    """
+    Build the provider prompt cache key shared by all requests of an agent.
+    
+    Requests carrying the same key and the same static prefix (system prompt plus
+    the fixed part of the instruction template) are served from the provider's
+    prompt cache, so only the per-file tail is billed at the full rate.
+    
+    Args:
+        agent_name: Name of the agent from agent_mapping
+        
+    Returns:
+        Cache key string, or an empty string when prompt caching is disabled
+    """
+    if not app_config.PROMPT_CACHE_ENABLED:
+        return ""
+    return f"{APP_TITLE}:{agent_name}"
+
+def get_prompt_cache_body(agent_name: str) -> Dict[str, Any]:
+    """
+    Build the extra request body fields enabling prompt caching for an agent.
+    
+    Args:
+        agent_name: Name of the agent from agent_mapping
+        
+    Returns:
+        Dictionary to merge into the request body, empty when caching is disabled
+    """
+    cache_key = get_prompt_cache_key(agent_name)
+    return {"prompt_cache_key": cache_key} if cache_key else {}
+
+class _ExtraBodyAsyncOpenAI(AsyncOpenAI):
+    """
+    AsyncOpenAI client that merges fixed extra fields into every POST request body.
+    
+    pydantic-ai 0.0.55 forwards only a fixed set of model settings to the OpenAI client
+    and has no extra_body setting, so fields such as prompt_cache_key are added here.
+    """
+    
+    def __init__(self, *args: Any, extra_body: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._extra_body = dict(extra_body or {})
+    
+    def copy(self, *args: Any, **kwargs: Any) -> "_ExtraBodyAsyncOpenAI":
+        client = super().copy(*args, **kwargs)
+        client._extra_body = dict(self._extra_body)
+        return client
+    
+    with_options = copy
+    
+    async def _prepare_options(self, options):
+        options = await super()._prepare_options(options)
+        if self._extra_body and options.method.lower() == "post":
+            # Fields passed explicitly by the caller take precedence
+            options.extra_json = {**self._extra_body, **(options.extra_json or {})}
+        return options
+
 def get_async_litellm_proxy_agent(agent_name: str) -> Tuple[Agent, str]:
     """
     Create an async-compatible Pydantic AI agent that uses LiteLLM proxy.
@@ -165,7 +309,8 @@ def get_async_pydanticai_agent(agent_name:str) -> Tuple[Agent, Dict[str, Any]]:
     
     This implementation uses the httpx directly,
     which provides better optimization for concurrent API calls and follows OpenRouter's
-    recommended approach.
+    recommended approach. The result is cached per agent name for as long as the
+    shared HTTP client stays valid, so task-level fallbacks reuse the same instance.
     
     Args:
         agent_name: Name of the agent to create from agent_mapping
@@ -173,33 +318,26 @@ def get_async_pydanticai_agent(agent_name:str) -> Tuple[Agent, Dict[str, Any]]:
     Returns:
         Tuple containing (pydantic_ai.Agent, agent_config)
     """
+    cached = _get_cached_agent("pydanticai", agent_name)
+    if cached is not None:
+        return cached
+    
     agent_config = agent_mapping.get(agent_name, {})
     
     # Get system prompt and model from config
     agent_system_prompt = agent_config.get('system_prompt', 'You are helpful assistant')
     agent_model_name = agent_config.get('model', DEFAULT_MODEL)
     
-    timeout = httpx.Timeout(timeout=30, connect=5)
-    limits = httpx.Limits(max_connections=10)
-    transport = httpx.AsyncHTTPTransport(limits=limits)
-    headers = {
-        "HTTP-Referer": APP_URL,
-        'X-Title': "Test Agent",
-        'User-Agent': f'pydantic-ai/test-agent',
-    }
-    
-    custom_httpx_client = httpx.AsyncClient(
-        transport=transport, 
-        timeout=timeout, 
-        headers=headers
-    )
-    
+    http_client = get_shared_httpx_client()
     model = OpenAIModel(
         agent_model_name,
         provider=OpenAIProvider(
-            base_url=OPENROUTER_BASE_URL,
-            api_key=OPENROUTER_API_KEY,
-            http_client=custom_httpx_client
+            openai_client=_ExtraBodyAsyncOpenAI(
+                base_url=OPENROUTER_BASE_URL,
+                api_key=OPENROUTER_API_KEY,
+                http_client=http_client,
+                extra_body=get_prompt_cache_body(agent_name)
+            )
         )
     )
     
@@ -209,7 +347,7 @@ def get_async_pydanticai_agent(agent_name:str) -> Tuple[Agent, Dict[str, Any]]:
         instrument=True,
         result_type=str, # type: ignore
         result_tool_name='parse_code_analysis_response',
-        system_prompt=CODE_ANALYZER_SYS_PROMPT
+        system_prompt=agent_system_prompt
     )
     
     # Register result parser
@@ -219,12 +357,14 @@ def get_async_pydanticai_agent(agent_name:str) -> Tuple[Agent, Dict[str, Any]]:
     config = {
         "model": agent_model_name,
         "system_prompt": agent_system_prompt,
+        "extra_body": get_prompt_cache_body(agent_name),
         "headers": {
             "HTTP-Referer": APP_URL,
             "X-Title": APP_TITLE
         }
     }
     
+    _agent_cache[("pydanticai", agent_name)] = (http_client, agent, config)
     return agent, config
 
 def get_async_openai_agent(agent_name: str) -> Tuple[AsyncOpenAI, Dict[str, Any]]:
@@ -233,7 +373,8 @@ def get_async_openai_agent(agent_name: str) -> Tuple[AsyncOpenAI, Dict[str, Any]
     
     This implementation uses the official AsyncOpenAI client instead of httpx directly,
     which provides better optimization for concurrent API calls and follows OpenRouter's
-    recommended approach.
+    recommended approach. The result is cached per agent name for as long as the
+    shared HTTP client stays valid, so task-level fallbacks reuse the same instance.
     
     Args:
         agent_name: Name of the agent to create from agent_mapping
@@ -241,6 +382,10 @@ def get_async_openai_agent(agent_name: str) -> Tuple[AsyncOpenAI, Dict[str, Any]
     Returns:
         Tuple containing (AsyncOpenAI client, agent_config)
     """
+    cached = _get_cached_agent("openai", agent_name)
+    if cached is not None:
+        return cached
+    
     agent_config = agent_mapping.get(agent_name, {})
     
     # Get system prompt and model from config
@@ -248,28 +393,35 @@ def get_async_openai_agent(agent_name: str) -> Tuple[AsyncOpenAI, Dict[str, Any]
     agent_model_name = agent_config.get('model', DEFAULT_MODEL)
     
     # Configure AsyncOpenAI client for OpenRouter
+    http_client = get_shared_httpx_client()
     client = AsyncOpenAI(
         base_url=OPENROUTER_BASE_URL,
         api_key=OPENROUTER_API_KEY,
         timeout=httpx.Timeout(timeout=TIMEOUT_SECONDS),
-        max_retries=3
+        max_retries=3,
+        http_client=http_client
     )
     
     # Store agent configuration for later use
     config = {
         "model": agent_model_name,
         "system_prompt": agent_system_prompt,
+        "extra_body": get_prompt_cache_body(agent_name),
         "headers": {
             "HTTP-Referer": APP_URL,
             "X-Title": APP_TITLE
         }
     }
     
+    _agent_cache[("openai", agent_name)] = (http_client, client, config)
     return client, config
 
 __all__ = [
     "agent_mapping", 
     "get_async_openrouter_agent", 
     "get_async_openai_agent",
-    "get_async_litellm_proxy_agent"
+    "get_async_litellm_proxy_agent",
+    "get_shared_httpx_client",
+    "get_prompt_cache_key",
+    "get_prompt_cache_body"
 ]
\ No newline at end of file
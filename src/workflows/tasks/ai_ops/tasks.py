@@ -299,7 +299,7 @@ async def run_agent(ctx: RunAIDeps, instructions: str) -> Union[Completed, Faile
     agent_name_to_use = agent.name if hasattr(agent, 'name') and agent.name else "unknown"
     
     # Measure execution time
-    agent_start_time = time.time()
+    agent_start_time = time.perf_counter()
     
     logger.info(f"Starting agent: {agent_name_to_use}")
     
@@ -435,7 +435,7 @@ async def run_agent_sync(instructions: str, agent_name: str) -> Union[Completed,
         err_msg = f"Agent with name:{agent_name} does not exist. Make sure agent_name param matches those in agent_mapping"
         return Failed(message=err_msg)
     
-    agent_start_time = time.time()
+    agent_start_time = time.perf_counter()
     
     logger.info(f"Starting agent: {task_specific_agent_name}")
     
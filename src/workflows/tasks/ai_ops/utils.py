@@ -4,11 +4,18 @@ Utility functions for AI operations.
 This module contains helper functions for the AI operations workflow.
 """
 
+import hashlib
+import json
 import re
 import time
 import demjson3
 
-from typing import Optional, Dict, Any, List
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from typing import Callable, Optional, Dict, Any, Iterable, Iterator, List, Tuple, Type, Union
 
 from prefect import runtime
 
@@ -56,15 +63,72 @@ def get_run_duration(start_time: float) -> float:
     Calculate the duration of a process.
     
     Args:
-        start_time: Timestamp when the process started
+        start_time: time.perf_counter() value taken when the process started
         
     Returns:
         Duration in seconds as a float
     """
-    end_time = time.time()
+    end_time = time.perf_counter()
     return end_time - start_time
 
-def create_agent_tasks(instructions: str, repo_context: RepomixResultData, result_type_schema: BaseModel) -> List[AgentTask]:
+def _loads_json(text: str) -> Any:
+    """
+    Decode a JSON string, using orjson for strict JSON and demjson3 for the rest.
+    
+    Most LLM responses are strict JSON, so the C decoder handles them directly;
+    demjson3 only runs for the lenient cases (single quotes, trailing commas, ...).
+    
+    Args:
+        text: The JSON text to decode
+        
+    Returns:
+        The decoded Python object
+    """
+    try:
+        return orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError:
+        return demjson3.decode(text)
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data to a compact JSON string, preferring orjson when available.
+    
+    Args:
+        data: The JSON-serializable data to dump
+        
+    Returns:
+        The JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+def _render_schema(result_type_schema: Union[Dict[str, Any], str, Type[BaseModel]]) -> str:
+    """
+    Render a result schema as JSON text for the {json_schema} prompt placeholder.
+    
+    Args:
+        result_type_schema: Schema dict, pre-rendered string or Pydantic model class
+        
+    Returns:
+        The schema as JSON, or its str() when it cannot be serialized to JSON
+    """
+    if isinstance(result_type_schema, str):
+        return result_type_schema
+    if isinstance(result_type_schema, type) and issubclass(result_type_schema, BaseModel):
+        result_type_schema = result_type_schema.model_json_schema()
+    try:
+        return _dumps_json(result_type_schema)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Result schema is not JSON serializable, using its string form: {str(e)}")
+        return str(result_type_schema)
+
+def create_agent_tasks(
+    instructions: str, 
+    repo_context: RepomixResultData, 
+    result_type_schema: Union[Dict[str, Any], str, Type[BaseModel]],
+    content_filter: Optional[Callable[[str], bool]] = None
+) -> List[AgentTask]:
     """
     Create a list of agent tasks from repository context with content retrieval.
     
@@ -74,20 +138,50 @@ def create_agent_tasks(instructions: str, repo_context: RepomixResultData, resul
     Args:
         instructions: A string template with placeholders ({content}, {file_path}, {json_schema})
         repo_context: Dictionary containing repository information including a 'files' list
-        result_type: Pydantic model to use for result schema validation
+        result_type_schema: JSON schema of the result (dict, pre-rendered string or Pydantic model class)
+        content_filter: Optional predicate on file content; files it rejects get no task
         
     Returns:
         List of AgentTask containing necessary information with retrieved content
     """
-    tasks: List[AgentTask] = []
+    return list(iter_agent_tasks(instructions, repo_context, result_type_schema, content_filter))
+
+def iter_agent_tasks(
+    instructions: str, 
+    repo_context: RepomixResultData, 
+    result_type_schema: Union[Dict[str, Any], str, Type[BaseModel]],
+    content_filter: Optional[Callable[[str], bool]] = None,
+    filtered_paths: Optional[List[str]] = None
+) -> Iterator[AgentTask]:
+    """
+    Lazily create agent tasks from repository context, one file at a time.
+    
+    Prompts are the largest objects in an analysis run, so consumers that send
+    tasks as they are produced only keep the in-flight prompts in memory.
+    
+    Args:
+        instructions: A string template with placeholders ({content}, {file_path}, {json_schema})
+        repo_context: Dictionary containing repository information including a 'files' list
+        result_type_schema: JSON schema of the result (dict, pre-rendered string or Pydantic model class)
+        content_filter: Optional predicate on file content; files it rejects get no task
+        filtered_paths: Optional list extended with the paths of files rejected by content_filter
+        
+    Yields:
+        AgentTask containing necessary information with retrieved content
+    """
+    tasks_created = 0
     
     # Track statistics for better logging
     stats = {
         "files_processed": 0,
         "files_skipped": 0, 
+        "files_filtered": 0,
         "files_with_separate_storage": 0
     }
     
+    # Render the schema once instead of once per file
+    json_schema = _render_schema(result_type_schema)
+    
     for file in getattr(repo_context,'files', []):
         # Process each file in the repository
         stats["files_processed"] += 1
@@ -107,9 +201,16 @@ def create_agent_tasks(instructions: str, repo_context: RepomixResultData, resul
                 stats["files_skipped"] += 1
                 continue
             
+            # Skip files the caller knows hold nothing worth analyzing
+            if content_filter is not None and not content_filter(file_content):
+                stats["files_filtered"] += 1
+                if filtered_paths is not None:
+                    filtered_paths.append(file_path)
+                continue
+            
             # Format the task with file context
             task_context = instructions.format(
-                json_schema=result_type_schema, 
+                json_schema=json_schema, 
                 content=file_content,
                 file_path=file_path)
             
@@ -119,23 +220,81 @@ def create_agent_tasks(instructions: str, repo_context: RepomixResultData, resul
                 file_path=file_path
             )
             
-            # Store task
-            tasks.append(task)
-            logger.debug(f"Created agent task for file {file_path}")
-            
         except Exception as file_error:
             logger.error(f"Error processing file {file_path}: {str(file_error)}")
             stats["files_skipped"] += 1
             continue
+        
+        # Counted only; per-file logging is covered by the summary below
+        tasks_created += 1
+        yield task
                 
         
     # # Log detailed statistics
     logger.info(
-        f"Created {len(tasks)} agent tasks from repository context. " + 
+        f"Created {tasks_created} agent tasks from repository context. " + 
         f"Files processed: {stats['files_processed']}, " + 
-        f"Files skipped: {stats['files_skipped']}, "
+        f"Files skipped: {stats['files_skipped']}, " + 
+        f"Files filtered: {stats['files_filtered']}"
     )
-    return tasks
+
+def dedupe_agent_tasks(tasks: List[AgentTask], repo_context: RepomixResultData) -> Tuple[List[AgentTask], Dict[str, List[str]]]:
+    """
+    Drop tasks whose file content is identical to an earlier task's file.
+    
+    Repositories often contain byte-identical files (license headers, generated
+    stubs, vendored copies). Only the first file of each content group is sent
+    to the LLM; its result is later copied to the other paths of the group.
+    
+    Args:
+        tasks: Agent tasks as returned by create_agent_tasks()
+        repo_context: Repository context the tasks were created from
+        
+    Returns:
+        Tuple of (tasks to run, mapping of representative file path to the paths of its duplicates)
+    """
+    duplicates: Dict[str, List[str]] = {}
+    unique_tasks = list(iter_unique_agent_tasks(tasks, repo_context, duplicates))
+    if duplicates:
+        logger.info(f"Skipping {len(tasks) - len(unique_tasks)} agent tasks for files with duplicate content")
+    return unique_tasks, duplicates
+
+def iter_unique_agent_tasks(
+    tasks: Iterable[AgentTask], 
+    repo_context: RepomixResultData, 
+    duplicates: Dict[str, List[str]]
+) -> Iterator[AgentTask]:
+    """
+    Lazily drop tasks whose file content is identical to an earlier task's file.
+    
+    Streaming counterpart of dedupe_agent_tasks(); `duplicates` is filled in as
+    tasks are consumed, so it is only complete once the iterator is exhausted.
+    
+    Args:
+        tasks: Agent tasks, e.g. from iter_agent_tasks()
+        repo_context: Repository context the tasks were created from
+        duplicates: Mapping updated with representative file path -> paths of its duplicates
+        
+    Yields:
+        Tasks to run
+    """
+    digest_by_path = {}
+    for file in getattr(repo_context, 'files', []):
+        file_path = getattr(file, 'path', '')
+        file_content = getattr(file, 'content', '')
+        if file_path and file_content:
+            digest_by_path[file_path] = hashlib.blake2b(file_content.encode('utf-8'), digest_size=16).digest()
+    
+    representative_by_digest = {}
+    for task in tasks:
+        digest = digest_by_path.get(task.file_path)
+        representative = representative_by_digest.get(digest) if digest is not None else None
+        if representative is None:
+            if digest is not None:
+                representative_by_digest[digest] = task.file_path
+            yield task
+        else:
+            duplicates.setdefault(representative, []).append(task.file_path)
 
 def parse_agent_response(task_result: AgentRunResult) -> AgentAnalysisResult:
     """
@@ -161,7 +320,7 @@ def parse_agent_response(task_result: AgentRunResult) -> AgentAnalysisResult:
         
         if result_data and isinstance(result_data, str):
             try:
-                decoded_data = demjson3.decode(result_data)
+                decoded_data = _loads_json(result_data)
             except Exception as e:
                 return AgentAnalysisResult.create_error_result(
                     f"Failed to parse JSON from agent response", 
@@ -204,7 +363,7 @@ def parse_agent_response_from_str(
     try:
         # Attempt to parse the JSON response
         try:
-            data = demjson3.decode(response_str)
+            data = _loads_json(response_str)
         except Exception as e:
             # Handle any parsing errors
             return AgentAnalysisResult.create_error_result(
@@ -280,6 +439,7 @@ __all__ = [
     "parse_agent_response_from_str",
     "sanitize_and_parse_agent_response",
     "create_agent_tasks", 
+    "dedupe_agent_tasks",
     "get_run_duration", 
     "get_runtime_task_id", 
     "get_runtime_context"]
\ No newline at end of file
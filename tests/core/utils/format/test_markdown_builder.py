@@ -250,12 +250,12 @@ class TestJsonToMarkdown:
     
     def test_error_handling(self):
         """Test error handling for non-serializable data."""
-        # Instead of creating a circular reference, directly patch the json.dumps
+        # Instead of creating a circular reference, directly patch the serializer
         # to simulate the error condition
         test_data = {"test": "data"}
         
-        with patch('json.dumps') as mock_dumps:
-            # Simulate what happens when json.dumps raises TypeError
+        with patch('core.utils.format.markdown_builder._dumps') as mock_dumps:
+            # Simulate what happens when the serializer raises TypeError
             mock_dumps.side_effect = TypeError("Circular reference detected")
             
             # Now the error should be caught and handled properly
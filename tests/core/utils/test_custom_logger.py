@@ -0,0 +1,46 @@
+"""
+Tests for the CustomLogger wrapper around logfire and standard logging.
+"""
+import logging
+from unittest.mock import patch
+
+import core.utils.logger.custom_logger as custom_logger_module
+from core.utils.logger.custom_logger import CustomLogger
+
+
+class Unformattable:
+    """Argument that fails the test if it is ever rendered into a message."""
+
+    def __str__(self):
+        raise AssertionError("message was formatted")
+
+
+def test_disabled_level_is_not_formatted_or_traced():
+    """Messages below the logger level skip rendering and logfire entirely."""
+    base_logger = logging.getLogger("test_custom_logger.disabled")
+    base_logger.setLevel(logging.INFO)
+    logger = CustomLogger(base_logger, use_trace=True)
+
+    with patch.object(custom_logger_module, "logfire") as mock_logfire:
+        logger.debug("value: %s", Unformattable())
+
+    mock_logfire.debug.assert_not_called()
+
+
+def test_enabled_level_is_traced_with_rendered_message():
+    """Enabled messages go to logfire with their %-style args applied."""
+    base_logger = logging.getLogger("test_custom_logger.enabled")
+    base_logger.setLevel(logging.DEBUG)
+    logger = CustomLogger(base_logger, use_trace=True)
+
+    with patch.object(custom_logger_module, "logfire") as mock_logfire:
+        logger.debug("value: %s", 42)
+
+    mock_logfire.debug.assert_called_once_with("value: 42")
+
+
+def test_render_matches_stdlib_formatting():
+    """A single mapping arg is used for named formatting; mismatched args never raise."""
+    assert CustomLogger._render("%(name)s=%(value)d", ({"name": "x", "value": 1},)) == "x=1"
+    assert CustomLogger._render("no placeholders", ("extra",)) == "no placeholders ('extra',)"
+    assert CustomLogger._render("%d items", ("many",)) == "%d items ('many',)"
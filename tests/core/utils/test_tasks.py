@@ -10,6 +10,7 @@ from unittest.mock import patch, MagicMock
 
 from core.utils.tasks import (
     create_task_batches,
+    iter_task_batches,
     get_current_retry_count,
     get_current_task_run_id
 )
@@ -63,6 +64,16 @@ def test_create_task_batches_batch_size_larger_than_items():
     assert batches[0] == [1, 2, 3]
 
 
+def test_iter_task_batches_is_lazy():
+    """Test iter_task_batches yields batches on demand from a generator."""
+    items = (i for i in range(7))
+    
+    batches = iter_task_batches(items, 3)
+    
+    assert next(batches) == [0, 1, 2]
+    assert list(batches) == [[3, 4, 5], [6]]
+
+
 def test_get_current_retry_count_success():
     """Test get_current_retry_count with a successful context retrieval."""
     # Create a mock context with run_count
@@ -99,13 +110,13 @@ def test_get_current_task_run_id_success():
 
 def test_get_current_task_run_id_failure():
     """Test get_current_task_run_id with a context retrieval failure."""
-    # Mock get_run_context to raise an exception and mock time.time for predictable result
+    # Mock get_run_context to raise an exception and mock time.monotonic_ns for predictable result
     with patch('core.utils.tasks.get_run_context', side_effect=Exception("Context unavailable")), \
-         patch('core.utils.tasks.time.time', return_value=123456.789):
+         patch('core.utils.tasks.time.monotonic_ns', return_value=123456789):
         
         task_id = get_current_task_run_id()
         
-        assert task_id == "unknown-123456.789"
+        assert task_id == "unknown-123456789"
         assert isinstance(task_id, str)
         assert task_id.startswith("unknown-")
 
@@ -13,7 +13,7 @@ from core.utils.time import get_run_duration, format_duration
 def test_get_run_duration():
     """Test the get_run_duration function accurately measures elapsed time."""
     # Test with a small delay
-    start_time = time.time()
+    start_time = time.perf_counter()
     time.sleep(0.1)  # Sleep for 100ms
     duration = get_run_duration(start_time)
     
@@ -21,7 +21,7 @@ def test_get_run_duration():
     assert 0.09 <= duration <= 0.15, f"Expected duration around 0.1s, got {duration}s"
     
     # Test with no delay
-    start_time = time.time()
+    start_time = time.perf_counter()
     duration = get_run_duration(start_time)
     
     # The duration should be very small (near zero)
@@ -1,5 +1,6 @@
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 from workflows.agents.models import (
     AgentTask, 
     TokenUsage, 
@@ -32,6 +33,12 @@ class TestAgentTask:
         assert task.repo_name == ""
         assert task.file_path is None
 
+    def test_fast_dump_matches_model_dump(self):
+        """Test that fast_dump returns the same fields as model_dump."""
+        task = AgentTask(instructions="Test instructions", repo_name="repo", file_path="a.py")
+
+        assert task.fast_dump() == task.model_dump()
+
 class TestTokenUsage:
     def test_creation(self):
         """Test that TokenUsage can be created with all fields."""
@@ -139,5 +146,17 @@ class TestAgentErrorResult:
         assert error.exception_type is None
         assert error.prompt_index is None
 
+class TestAgentAnalysisResult:
+    def test_missing_file_path_fails_validation(self):
+        """Test that omitting file_path is reported by the validator, not a TypeError."""
+        with pytest.raises(ValidationError, match="file_path is required"):
+            AgentAnalysisResult()
+    
+    def test_construct_without_file_path(self):
+        """Test that model_construct falls back to the empty default."""
+        result = AgentAnalysisResult.model_construct()
+        
+        assert result.file_path == ""
+
 if __name__ == "__main__":
     pytest.main(["-xvs", "--pdb", __file__]) 
\ No newline at end of file
@@ -7,11 +7,12 @@ class TestAgentAnalysisResult:
         """Test that file_path validation works correctly."""
         # Should raise ValueError when file_path is empty
         with pytest.raises(ValueError, match="file_path is required"):
-            AgentAnalysisResult(file_path="").validate_file_path()
+            AgentAnalysisResult(file_path="")
         
         # Should pass with valid file_path
         result = AgentAnalysisResult(file_path="test.py")
-        assert result.validate_file_path() == result
+        assert result.file_path == "test.py"
+        assert AgentAnalysisResult.validate_file_path("test.py") == "test.py"
     
     def test_default_factory(self):
         """Test the default factory method."""
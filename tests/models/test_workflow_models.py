@@ -1,5 +1,8 @@
+import sys
+
 import pytest
 from workflows.agents.models import RunAIDeps, RunAITask
+from core.utils.format.markdown_builder import custom_json_serializer
 
 class TestRunAIDeps:
     def test_init_with_defaults(self):
@@ -37,9 +40,16 @@ class TestRunAIDeps:
         # All these methods should return the same dictionary
         expected = {"db_name": "workflows", "db_col_name": "repomix", "target_obj_id": "test_id"}
         assert deps.to_dict() == expected
-        assert deps.__dict__() == expected
         assert deps.__json__() == expected
         assert deps.toJSON() == expected
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        """Test that instances use slots and still serialize through to_dict."""
+        deps = RunAIDeps(target_obj_id="test_id")
+        
+        assert not hasattr(deps, '__dict__')
+        assert custom_json_serializer(deps) == deps.to_dict()
 
 class TestRunAITask:
     def test_model_creation(self):
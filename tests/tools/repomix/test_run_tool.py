@@ -0,0 +1,95 @@
+"""
+Tests for the repomix runner defined in tools/repomix/run_tool.py.
+
+A fake ``repomix`` executable is put on PATH so the tests exercise the real
+subprocess handling without requiring the repomix CLI.
+"""
+import io
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tools.repomix import run_tool
+from tools.repomix.run_tool import _write_cleaned_lines, run_repomix_local
+
+
+@pytest.fixture
+def fake_repomix(tmp_path, monkeypatch):
+    """Install a fake repomix that writes its working directory to the output file."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "repomix"
+    script.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import os, sys, time
+        output = sys.argv[sys.argv.index('--output') + 1]
+        time.sleep(0.2)
+        with open(output, 'w') as f:
+            f.write(os.getcwd())
+        print('\\x1b[32mPacked\\x1b[0m\\n\\n\\n\\nDone')
+        """))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+def test_run_repomix_local_concurrent_calls_use_own_repo(tmp_path, fake_repomix, monkeypatch):
+    """Test that parallel runs each analyze their own repository and keep the process cwd."""
+    # Hold both runs at process start so they are guaranteed to overlap
+    barrier = threading.Barrier(2, timeout=5)
+    real_popen = subprocess.Popen
+
+    def popen_after_barrier(*args, **kwargs):
+        barrier.wait()
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(run_tool.subprocess, "Popen", popen_after_barrier)
+    config = tmp_path / "repomix.config.json"
+    config.write_text("{}")
+    repos = []
+    for name in ("repo_a", "repo_b"):
+        repo = tmp_path / name
+        repo.mkdir()
+        repos.append(repo)
+    original_dir = os.getcwd()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(run_repomix_local, str(repo), str(config), str(tmp_path / f"{repo.name}.xml"))
+            for repo in repos
+        ]
+        results = [future.result() for future in futures]
+
+    assert os.getcwd() == original_dir
+    for repo, (return_code, output_path, _) in zip(repos, results):
+        assert return_code == 1
+        with open(output_path) as f:
+            assert f.read().startswith(str(repo))
+
+
+def test_run_repomix_local_appends_cleaned_tool_output(tmp_path, fake_repomix):
+    """Test that the cleaned terminal output is appended to the result file."""
+    config = tmp_path / "repomix.config.json"
+    config.write_text("{}")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    return_code, output_path, _ = run_repomix_local(str(repo), str(config), str(tmp_path / "out.xml"))
+
+    assert return_code == 1
+    with open(output_path) as f:
+        assert f.read() == f"{repo}\n<tool_output>\nPacked\n\nDone\n\n</tool_output>\n"
+
+
+def test_write_cleaned_lines_collapses_blank_lines_across_lines():
+    """Test that blank-line runs spanning several lines are collapsed like the whole output."""
+    out = io.BytesIO()
+
+    _write_cleaned_lines(["a\n", "\n", "\x1b[2K\n", "\n", "b\n", "\n"], out)
+
+    assert out.getvalue() == b"a\n\nb\n\n"
@@ -0,0 +1,62 @@
+"""
+Tests for the RepoMix output parser defined in tools/repomix/xml_parser.py.
+"""
+import pytest
+
+from tools.repomix.xml_parser import RepoMixParser
+
+SAMPLE_OUTPUT = """<directory_structure>
+a.py
+b.py
+</directory_structure>
+<files>
+<file path="a.py">
+print("a")
+</file>
+<file path="b.py">
+print("b")
+</file>
+</files>
+<tool_output>
+📈 Top 50 Files by Character Count and Token Count:
+1.  a.py (10 chars, 5 tokens)
+2.  b.py (10 chars, 5 tokens)
+
+📊 Pack Summary:
+  Total Files: 2 files
+  Total Chars: 20 chars
+ Total Tokens: 10 tokens
+       Output: repomix-output.xml
+     Security: ✔ No suspicious files detected
+
+🎉 All Done!
+</tool_output>
+"""
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    """Write a small RepoMix output file."""
+    path = tmp_path / "repomix-output.xml"
+    path.write_text(SAMPLE_OUTPUT, encoding="utf-8")
+    return path
+
+
+def test_parse_returns_files(output_file):
+    """Test that parse extracts every file block."""
+    result = RepoMixParser.parse(output_file)
+
+    assert [f.path for f in result.files] == ["a.py", "b.py"]
+    assert result.tool_output.summary.total_files == 2
+
+
+def test_parse_result_files_do_not_share_cached_list(output_file):
+    """Test that replacing files in one parse result does not leak into later parses."""
+    first = RepoMixParser.parse(output_file)
+    first.files[0] = first.files[0].model_copy(update={"env_vars": ["LEAKED"]})
+    first.files.reverse()
+
+    second = RepoMixParser.parse(output_file)
+
+    assert [f.path for f in second.files] == ["a.py", "b.py"]
+    assert not hasattr(second.files[0], "env_vars")
@@ -0,0 +1,87 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+import asyncio
+import sqlite3
+
+from workflows.agents.response_cache import ResponseCache
+
+
+def test_make_key_is_stable_and_unambiguous():
+    """Keys depend on every part and on the boundaries between parts."""
+    assert ResponseCache.make_key("model", "prompt") == ResponseCache.make_key("model", "prompt")
+    assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+    assert ResponseCache.make_key("model", None) == ResponseCache.make_key("model", "")
+
+
+def test_get_and_set_round_trip(tmp_path):
+    """Stored values are returned on later lookups, including from a new instance."""
+    db_path = str(tmp_path / "cache" / "responses.sqlite3")
+    cache = ResponseCache(db_path=db_path, enabled=True)
+    key = ResponseCache.make_key("model", "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, '{"file_path": "a.py"}')
+    assert cache.get(key) == '{"file_path": "a.py"}'
+    assert ResponseCache(db_path=db_path, enabled=True).get(key) == '{"file_path": "a.py"}'
+
+
+def test_disabled_cache_is_a_no_op(tmp_path):
+    """A disabled cache never stores or returns anything."""
+    cache = ResponseCache(db_path=str(tmp_path / "responses.sqlite3"), enabled=False)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "responses.sqlite3").exists()
+
+
+def test_memory_lru_serves_and_evicts(tmp_path):
+    """Recent entries are served from memory; the oldest are evicted beyond memory_size."""
+    cache = ResponseCache(db_path=str(tmp_path / "responses.sqlite3"), enabled=True, memory_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+
+    assert list(cache._memory) == ["b", "c"]
+    assert cache.get("a") == "A"
+    assert list(cache._memory) == ["c", "a"]
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    """Entries older than ttl_seconds are not served, from memory or from disk."""
+    db_path = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(db_path=db_path, enabled=True, ttl_seconds=60)
+    cache.set("key", "value")
+    cache._memory["key"] = ("value", 0.0)
+
+    assert cache.get("key") == "value"  # Still fresh on disk
+    cache._memory.clear()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE responses SET created_at = 0")
+
+    assert cache.get("key") is None
+
+
+def test_prune_caps_entries_and_drops_expired(tmp_path):
+    """Opening the cache removes expired entries and the oldest entries beyond max_entries."""
+    db_path = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(db_path=db_path, enabled=True, ttl_seconds=0)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE responses SET created_at = 1 WHERE key = 'a'")
+
+    ResponseCache(db_path=db_path, enabled=True, ttl_seconds=3600, max_entries=1)
+
+    with sqlite3.connect(db_path) as conn:
+        assert [row[0] for row in conn.execute("SELECT key FROM responses")] in (["b"], ["c"])
+
+
+def test_async_accessors_round_trip(tmp_path):
+    """aget()/aset() store and return values like get()/set()."""
+    cache = ResponseCache(db_path=str(tmp_path / "responses.sqlite3"), enabled=True)
+
+    async def round_trip():
+        await cache.aset("key", "value")
+        return await cache.aget("key")
+
+    assert asyncio.run(round_trip()) == "value"
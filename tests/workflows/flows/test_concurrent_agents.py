@@ -0,0 +1,295 @@
+"""
+Tests for the agent call helpers in concurrent_agents.py.
+
+The PydanticAI agent is replaced by a stub whose ``run`` coroutine returns
+prepared responses, so no LLM is called.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from prefect.testing.utilities import prefect_test_harness
+
+import workflows.flows.concurrent_agents as concurrent_agents_module
+from core.models import RepoFile
+from workflows.agents.models import (
+    AgentAnalysisResult,
+    AgentErrorResult,
+    AgentSuccessResult,
+    AgentTask,
+    BaseAgentAnalysisResult,
+    RunAgentDeps,
+)
+from workflows.agents.response_cache import ResponseCache
+
+pytestmark = pytest.mark.asyncio
+
+CONFIG = {"model": "test-model", "system_prompt": "test-system-prompt", "timeout_seconds": 90}
+
+
+class StubAgent:
+    """Agent stub returning the given responses in order and counting calls."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def run(self, prompt):
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        if isinstance(response, BaseException):
+            raise response
+        return SimpleNamespace(data=response)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prefect_test_fixture():
+    """Set up Prefect test environment for all tests."""
+    with prefect_test_harness():
+        yield
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    """Use an empty on-disk response cache for each test."""
+    cache = ResponseCache(db_path=str(tmp_path / "responses.sqlite3"), enabled=True)
+    monkeypatch.setattr(concurrent_agents_module, "get_response_cache", lambda: cache)
+    return cache
+
+
+async def call_agent(agent, file_path="a.py"):
+    task = AgentTask(instructions=f"analyze {file_path}", file_path=file_path)
+    return await concurrent_agents_module._call_agent_pydantic(
+        task=task, agent_name="test-agent", shared_client=agent, config=CONFIG, inner_timeout=5
+    )
+
+
+async def test_parse_fallback_result_is_not_cached(response_cache):
+    """A default result from a failed parse is returned but the next run asks the LLM again."""
+    agent = StubAgent(AgentAnalysisResult.default(), AgentAnalysisResult(file_path="a.py"))
+
+    first = await call_agent(agent)
+    second = await call_agent(agent)
+
+    assert first.is_completed()
+    assert first.data.result.file_path == "default"
+    assert second.data.result.file_path == "a.py"
+    assert agent.calls == 2
+
+
+async def test_parsed_result_is_served_from_cache(response_cache):
+    """A successfully parsed result is cached and reused without another LLM call."""
+    agent = StubAgent(AgentAnalysisResult(file_path="a.py"))
+
+    await call_agent(agent)
+    cached = await call_agent(agent)
+
+    assert cached.data.result.file_path == "a.py"
+    assert agent.calls == 1
+
+
+class TimedCalls:
+    """Call factory whose n-th call sleeps for delays[n], then returns or raises outcomes[n]."""
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.started = 0
+        self.cancelled = 0
+
+    def __call__(self):
+        delay, outcome = self.steps[self.started]
+        self.started += 1
+        return self._run(delay, outcome)
+
+    async def _run(self, delay, outcome):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def hedge_after_short_delay(monkeypatch):
+    """Hedge every call that takes longer than 20ms."""
+    monkeypatch.setattr(concurrent_agents_module, "_get_hedge_delay", lambda: 0.02)
+
+
+async def test_hedge_wins_when_first_call_is_slow(hedge_after_short_delay):
+    """A fast hedged copy returns first and the slow call is cancelled."""
+    calls = TimedCalls((1.0, "slow"), (0.01, "hedge"))
+
+    result = await concurrent_agents_module._run_hedged(calls, asyncio.Semaphore(2))
+
+    # Let the cancelled call process its cancellation
+    await asyncio.sleep(0)
+    assert result == "hedge"
+    assert calls.started == 2
+    assert calls.cancelled == 1
+
+
+async def test_hedge_result_used_when_first_call_fails(hedge_after_short_delay):
+    """A first call failing after the hedge was sent does not end the race."""
+    calls = TimedCalls((0.05, RuntimeError("first failed")), (0.1, "hedge"))
+
+    result = await concurrent_agents_module._run_hedged(calls, asyncio.Semaphore(2))
+
+    assert result == "hedge"
+
+
+async def test_hedge_raises_when_both_calls_fail(hedge_after_short_delay):
+    """The error is raised once both copies failed."""
+    calls = TimedCalls((0.05, RuntimeError("first failed")), (0.1, RuntimeError("hedge failed")))
+
+    with pytest.raises(RuntimeError):
+        await concurrent_agents_module._run_hedged(calls, asyncio.Semaphore(2))
+    assert calls.started == 2
+
+
+async def test_hedge_needs_a_free_semaphore_slot(hedge_after_short_delay):
+    """No hedged copy is sent while every LLM slot is taken, and the hedge slot is returned."""
+    semaphore = asyncio.Semaphore(2)
+    async with semaphore:
+        calls = TimedCalls((0.05, "first"), (0.01, "hedge"))
+        assert await concurrent_agents_module._run_hedged(calls, semaphore) == "hedge"
+        assert not semaphore.locked()
+
+        async with semaphore:
+            calls = TimedCalls((0.05, "first"), (0.01, "hedge"))
+            assert await concurrent_agents_module._run_hedged(calls, semaphore) == "first"
+            assert calls.started == 1
+
+
+class FileOutcomeAgent:
+    """Agent stub answering per file path; each path maps to a list of outcomes used in turn."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.calls = {path: 0 for path in outcomes}
+
+    async def run(self, prompt):
+        path = prompt.split("file_path:")[1].split("\n")[0]
+        outcome = self.outcomes[path][min(self.calls[path], len(self.outcomes[path]) - 1)]
+        self.calls[path] += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return SimpleNamespace(data=AgentAnalysisResult(file_path=path, **outcome))
+
+
+async def test_batch_retries_only_retryable_errors(response_cache):
+    """Retryable errors are retried per file; other errors and exhausted retries become error results."""
+    agent = FileOutcomeAgent({
+        "ok.py": [{}],
+        "flaky.py": [asyncio.TimeoutError(), {}],
+        "broken.py": [ValueError("bad prompt")],
+        "down.py": [asyncio.TimeoutError()],
+    })
+    tasks = [AgentTask(instructions=f"file_path:{path}\n", file_path=path) for path in agent.outcomes]
+
+    results = await concurrent_agents_module.run_agent_batch_pydantic.fn(
+        tasks=tasks, agent_name="test-agent", shared_client=agent, config=CONFIG, max_retries=1, inner_timeout=5
+    )
+
+    # One result per task, in input order
+    assert [result.task.file_path for result in results] == list(agent.outcomes)
+    assert [type(result) for result in results] == [AgentSuccessResult, AgentSuccessResult, AgentErrorResult, AgentErrorResult]
+    assert results[2].exception_type == "ValueError"
+    assert results[3].exception_type == "TimeoutError"
+    assert agent.calls == {"ok.py": 1, "flaky.py": 2, "broken.py": 1, "down.py": 2}
+
+
+async def test_fused_flow_counts_successful_and_failed(response_cache, monkeypatch):
+    """With AGENT_TASK_BATCH_SIZE > 1 the flow runs fused batches and counts every file."""
+    paths = [f"f{i}.py" for i in range(5)]
+    agent = FileOutcomeAgent({path: [{}] for path in paths})
+    agent.outcomes["f3.py"] = [ValueError("unexpected")]
+    files = [RepoFile(path=path, content=f"import os\nos.environ['X{i}']") for i, path in enumerate(paths)]
+    ctx = RunAgentDeps(
+        repomix_data=SimpleNamespace(result=SimpleNamespace(files=files), repository_url="https://github.com/org/repo"),
+        result_type=BaseAgentAnalysisResult,
+    )
+    monkeypatch.setattr(concurrent_agents_module.app_config, "AGENT_TASK_BATCH_SIZE", 2)
+    monkeypatch.setattr(concurrent_agents_module, "get_async_pydanticai_agent", lambda name: (agent, CONFIG))
+
+    result = await concurrent_agents_module.run_concurrent_agents(
+        ctx, instructions="{json_schema}\nfile_path:{file_path}\ncontent:\n{content}", timeout_seconds=30
+    )
+
+    assert (result.total_tasks, result.successful, result.failed) == (5, 4, 1)
+    assert sorted(r["file_path"] for r in result.results) == ["f0.py", "f1.py", "f2.py", "f4.py"]
+
+
+async def test_duplicates_of_failed_file_count_as_failed(response_cache, monkeypatch):
+    """Files sharing content with a failed file are counted as failed, so the totals add up."""
+    agent = FileOutcomeAgent({"ok.py": [{}], "bad.py": [ValueError("unexpected")]})
+    files = [
+        RepoFile(path="ok.py", content="import os\nos.environ['OK']"),
+        RepoFile(path="bad.py", content="import os\nos.environ['BAD']"),
+        RepoFile(path="bad_copy.py", content="import os\nos.environ['BAD']"),
+    ]
+    ctx = RunAgentDeps(
+        repomix_data=SimpleNamespace(result=SimpleNamespace(files=files), repository_url="https://github.com/org/repo"),
+        result_type=BaseAgentAnalysisResult,
+    )
+    monkeypatch.setattr(concurrent_agents_module.app_config, "AGENT_TASK_BATCH_SIZE", 2)
+    monkeypatch.setattr(concurrent_agents_module, "get_async_pydanticai_agent", lambda name: (agent, CONFIG))
+
+    result = await concurrent_agents_module.run_concurrent_agents(
+        ctx, instructions="{json_schema}\nfile_path:{file_path}\ncontent:\n{content}", timeout_seconds=30
+    )
+
+    assert (result.total_tasks, result.successful, result.failed) == (3, 1, 2)
+
+
+async def test_filtered_files_get_empty_results(response_cache, monkeypatch):
+    """Files rejected by content_filter get an empty result, even when no file reaches the agent."""
+    agent = FileOutcomeAgent({})
+    files = [RepoFile(path="logo.svg", content="<svg/>"), RepoFile(path="LICENSE", content="MIT License")]
+    ctx = RunAgentDeps(
+        repomix_data=SimpleNamespace(result=SimpleNamespace(files=files), repository_url="https://github.com/org/repo"),
+        result_type=BaseAgentAnalysisResult,
+    )
+    monkeypatch.setattr(concurrent_agents_module, "get_async_pydanticai_agent", lambda name: (agent, CONFIG))
+
+    result = await concurrent_agents_module.run_concurrent_agents(
+        ctx, instructions="{json_schema}\nfile_path:{file_path}\ncontent:\n{content}", timeout_seconds=30,
+        content_filter=lambda content: False
+    )
+
+    assert agent.calls == {}
+    assert (result.total_tasks, result.successful, result.failed) == (2, 2, 0)
+    assert result.results == [
+        {"file_path": "logo.svg", "env_vars": [], "db": [], "api": []},
+        {"file_path": "LICENSE", "env_vars": [], "db": [], "api": []},
+    ]
+
+
+async def test_task_run_slots_cap_live_task_runs(monkeypatch):
+    """At most MAX_WORKERS files hold task-run slots at once, batches counting one slot per file."""
+    monkeypatch.setattr(concurrent_agents_module.app_config, "MAX_WORKERS", 3)
+    monkeypatch.setattr(concurrent_agents_module, "_task_run_gate", None)
+    live = peak = 0
+
+    async def run(count):
+        nonlocal live, peak
+        async with concurrent_agents_module._task_run_slots(count):
+            live += count
+            peak = max(peak, live)
+            await asyncio.sleep(0.01)
+            live -= count
+
+    await asyncio.gather(*(run(count) for count in (2, 2, 1, 1, 3)))
+
+    assert peak <= 3
+
+
+async def test_batch_timeout_excludes_queueing_beyond_its_own_rounds(monkeypatch):
+    """A batch gets one timeout per call round and attempt, plus the backoff sleeps."""
+    monkeypatch.setattr(concurrent_agents_module.app_config, "MAX_WORKERS", 10)
+
+    assert concurrent_agents_module._get_batch_timeout(30, 4, 0) == 30
+    assert concurrent_agents_module._get_batch_timeout(30, 4, 3) == 30 * 4 + 2 + 4 + 8
+    assert concurrent_agents_module._get_batch_timeout(30, 15, 0) == 60
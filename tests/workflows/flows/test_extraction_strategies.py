@@ -0,0 +1,54 @@
+"""
+Tests for the extraction strategy helpers.
+"""
+import pytest
+
+from core.models import RepoFile
+from workflows.agents.models import AgentBatchResult
+from workflows.flows.extraction_strategies import has_base_signals, merge_strategy_results
+
+
+@pytest.mark.parametrize("content", [
+    "import os\nDB_HOST = os.environ['DB_HOST']",
+    "const key = process.env.API_KEY;",
+    "@app.route('/users')\ndef users(): ...",
+    "axios.get(`${BASE}/items`)",
+    "DB_HOST=localhost\nDB_PORT=5432\n",
+    "services:\n  app:\n    environment:\n      CACHE: redis://cache:6379\n",
+    "resp = requests.get('https://api.example.com/items')",
+    "conn = psycopg2.connect(dsn)",
+    "engine = create_engine('mysql://user@db/app')",
+    "@router.get('/items')\nasync def items(): ...",
+    "secret = ENV[\"SECRET\"]",
+])
+def test_has_base_signals_detects_env_db_api_usage(content):
+    """Files referencing env vars, databases or APIs are analyzed."""
+    assert has_base_signals(content)
+
+
+@pytest.mark.parametrize("content", [
+    "MIT License\n\nPermission is hereby granted, free of charge",
+    "<html><body><h1>Hello</h1></body></html>",
+    "def add(a, b):\n    return a + b\n",
+    "from .settings import config\nroute = config.route  # env-independent cursor handling",
+])
+def test_has_base_signals_skips_files_without_signals(content):
+    """Files with no env/DB/API signal are skipped."""
+    assert not has_base_signals(content)
+
+
+def test_merge_strategy_results_applies_all_strategies_per_file():
+    """Every strategy's result is merged into its file, without artifact keys."""
+    org_files = [RepoFile(path="a.py", content="a"), RepoFile(path="b.py", content="b")]
+    base = AgentBatchResult.model_construct(results=[
+        {"file_path": "a.py", "instructions": "...", "env_vars": ["A"]},
+    ])
+    appsec = AgentBatchResult.model_construct(results=[
+        {"file_path": "a.py", "score": 10},
+        {"file_path": "b.py", "score": 90},
+    ])
+
+    merge_strategy_results(org_files, [base, appsec])
+
+    assert org_files[0].model_dump() == {"path": "a.py", "content": "a", "env_vars": ["A"], "score": 10}
+    assert org_files[1].model_dump() == {"path": "b.py", "content": "b", "score": 90}
@@ -0,0 +1,62 @@
+"""
+Tests for the shared HTTP client and agent factories in agent_config.py.
+"""
+import asyncio
+import json
+
+import httpx
+
+import workflows.tasks.ai_ops.agent_config as agent_config_module
+from workflows.tasks.ai_ops.agent_config import get_async_pydanticai_agent, get_shared_httpx_client
+
+
+async def _get_client_twice():
+    client = get_shared_httpx_client()
+    assert get_shared_httpx_client() is client
+    return client
+
+
+def test_shared_client_is_closed_with_its_event_loop():
+    """Each event loop gets its own client, closed when that loop shuts down."""
+    first = asyncio.run(_get_client_twice())
+    second = asyncio.run(_get_client_twice())
+
+    assert first is not second
+    assert first.is_closed
+    assert second.is_closed
+
+
+def test_shared_client_replaced_after_close():
+    """A client closed by a caller is replaced on the same event loop."""
+    async def close_and_get_again():
+        client = get_shared_httpx_client()
+        await client.aclose()
+        return client, get_shared_httpx_client()
+
+    closed, replacement = asyncio.run(close_and_get_again())
+
+    assert closed is not replacement
+    assert replacement.is_closed
+
+
+def test_pydanticai_agent_sends_prompt_cache_key(monkeypatch):
+    """Requests made by the PydanticAI agent carry the agent's prompt_cache_key in the body."""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "test-model",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": '{"file_path": "a.py"}'}, "finish_reason": "stop"}],
+        })
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(agent_config_module, "get_shared_httpx_client", lambda: http_client)
+    monkeypatch.setattr(agent_config_module, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(agent_config_module.app_config, "PROMPT_CACHE_ENABLED", True)
+    monkeypatch.setattr(agent_config_module, "_agent_cache", {})
+
+    agent, _ = get_async_pydanticai_agent("env-vars-extractor")
+    asyncio.run(agent.run("analyze a.py"))
+
+    assert bodies[0]["prompt_cache_key"] == agent_config_module.get_prompt_cache_key("env-vars-extractor")
@@ -4,6 +4,9 @@ Tests for the create_agent_tasks function.
 This module tests the create_agent_tasks function which creates
 a list of agent tasks from repository context with content retrieval.
 """
+import json
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -284,6 +287,17 @@ class TestCreateAgentTasks:
             assert "Schema: " in task.instructions
             assert "TestResultModel" in task.instructions
             
+def test_schema_is_rendered_as_json_from_dict_or_model():
+    """Schema dicts and model classes are both embedded in the prompt as JSON."""
+    repo_context = SimpleNamespace(files=[SimpleNamespace(path="a.py", content="x = 1")])
+
+    from_dict = create_agent_tasks("{json_schema}", repo_context, {"type": "object"})
+    from_model = create_agent_tasks("{json_schema}", repo_context, TestResultModel)
+
+    assert json.loads(from_dict[0].instructions) == {"type": "object"}
+    assert json.loads(from_model[0].instructions) == TestResultModel.model_json_schema()
+
+
 if __name__ == "__main__":
     # Run all tests even if some fail
     pytest.main(["-vs", "--tb=short", "--no-header", __file__]) 
\ No newline at end of file
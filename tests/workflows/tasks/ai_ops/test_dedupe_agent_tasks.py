@@ -0,0 +1,54 @@
+"""
+Tests for dedupe_agent_tasks in the ai_ops utils module.
+"""
+from types import SimpleNamespace
+
+from workflows.agents.models import AgentTask
+from workflows.tasks.ai_ops.utils import dedupe_agent_tasks, iter_unique_agent_tasks
+
+
+def _repo_context(files):
+    return SimpleNamespace(files=[SimpleNamespace(path=path, content=content) for path, content in files])
+
+
+def test_dedupe_agent_tasks_groups_identical_content():
+    """Only the first file of each content group is kept; the rest map to it."""
+    repo_context = _repo_context([
+        ("a/LICENSE", "MIT"),
+        ("main.py", "print('hi')"),
+        ("b/LICENSE", "MIT"),
+        ("c/LICENSE", "MIT"),
+    ])
+    tasks = [AgentTask(instructions=f"analyze {file.path}", file_path=file.path) for file in repo_context.files]
+
+    unique_tasks, duplicates = dedupe_agent_tasks(tasks, repo_context)
+
+    assert [task.file_path for task in unique_tasks] == ["a/LICENSE", "main.py"]
+    assert duplicates == {"a/LICENSE": ["b/LICENSE", "c/LICENSE"]}
+
+
+def test_dedupe_agent_tasks_keeps_tasks_without_known_content():
+    """Tasks whose file is not in the repository context are always kept."""
+    tasks = [
+        AgentTask(instructions="analyze x", file_path="x.py"),
+        AgentTask(instructions="analyze y", file_path="y.py"),
+    ]
+
+    unique_tasks, duplicates = dedupe_agent_tasks(tasks, _repo_context([]))
+
+    assert unique_tasks == tasks
+    assert duplicates == {}
+
+
+def test_iter_unique_agent_tasks_fills_duplicates_while_streaming():
+    """The streaming variant yields unique tasks lazily and records duplicates as it goes."""
+    repo_context = _repo_context([("a.py", "x = 1"), ("b.py", "x = 1")])
+    tasks = (AgentTask(instructions=f"analyze {file.path}", file_path=file.path) for file in repo_context.files)
+    duplicates = {}
+
+    unique_tasks = iter_unique_agent_tasks(tasks, repo_context, duplicates)
+
+    assert next(unique_tasks).file_path == "a.py"
+    assert duplicates == {}
+    assert list(unique_tasks) == []
+    assert duplicates == {"a.py": ["b.py"]}